@@ -0,0 +1,120 @@
+"""
+This module creates a class holding the rocket's animation frames. Every
+frame is scaled, converted and rotated once when the animation is
+created, so picking the frame to draw is only an index lookup.
+"""
+
+import pygame
+from assets import ASSETS
+
+IDLE_FRAME = "sprites/TestRocket.png"
+THRUST_FRAMES = ("sprites/rocket_move_0.png", "sprites/rocket_move_1.png")
+
+
+class RocketAnimation:
+    """
+    The rocket's sprites, with the flame frames cycling while it rises and
+    each frame tilted towards the direction the rocket is moving.
+
+    Every sprite is drawn with the rocket's body over the player hitbox.
+    Flame frames are taller than the body, and tilting turns the sprite
+    around the body's center, so each frame is stored with the offset
+    from the hitbox center to the center of the sprite.
+
+    Attributes:
+        _frames: A list with a list per tilt of (surface, offset) tuples,
+            the idle frame first and then each flame frame, where offset
+            is a tuple of the int x and y offset of the sprite's center
+        _tilt_steps: An int representing the number of tilts each side
+            of upright
+        _top_speed: A float representing the x speed that gets the most
+            tilt
+        _frame_ms: An int representing how many milliseconds each flame
+            frame is shown for
+    """
+
+    def __init__(
+        self,
+        width,
+        body_height,
+        max_tilt=12,
+        tilt_steps=2,
+        top_speed=0.5 / 0.12,
+        frame_ms=80,
+    ) -> None:
+        """
+        Loads and prepares every frame.
+
+        Args:
+            width: An int representing the width to scale the sprites to
+            body_height: An int representing the height of the rocket's
+                body, which the hitbox covers, once scaled
+            max_tilt: A float representing the degrees the rocket tilts at
+                top speed. Defaults to 12.
+            tilt_steps: An int representing the number of tilts each side
+                of upright. Defaults to 2.
+            top_speed: A float representing the x speed that gets the most
+                tilt. Defaults to the player's top speed.
+            frame_ms: An int representing how many milliseconds each
+                flame frame is shown for. Defaults to 80.
+        """
+        self._tilt_steps = tilt_steps
+        self._top_speed = top_speed
+        self._frame_ms = frame_ms
+        images = [
+            ASSETS.image(path, width) for path in (IDLE_FRAME,) + THRUST_FRAMES
+        ]
+        pivot = pygame.math.Vector2(width / 2, body_height / 2)
+        self._frames = []
+        for step in range(-tilt_steps, tilt_steps + 1):
+            # Moving right tilts the nose right, which is clockwise
+            angle = -max_tilt * step / tilt_steps if tilt_steps else 0
+            self._frames.append(
+                [self._rotate(image, pivot, angle) for image in images]
+            )
+
+    @staticmethod
+    def _rotate(image, pivot, angle):
+        """
+        Rotates a sprite around a point on it
+
+        Args:
+            image: A pygame.Surface of the sprite
+            pivot: A pygame.math.Vector2 of the point to rotate around,
+                relative to the sprite's top left corner
+            angle: A float representing the degrees to rotate
+                anticlockwise
+
+        Returns:
+            A tuple of the rotated pygame.Surface and a tuple of the int x
+            and y offset from the pivot to the center of the rotated
+            sprite
+        """
+        rotated = pygame.transform.rotate(image, angle) if angle else image
+        center = pygame.math.Vector2(image.get_size()) / 2
+        # Screen y points down, so an anticlockwise turn on screen is a
+        # clockwise turn of the vector
+        offset = (center - pivot).rotate(-angle)
+        return rotated, (round(offset.x), round(offset.y))
+
+    def frame(self, rising, x_velocity, ticks):
+        """
+        Picks the frame to draw
+
+        Args:
+            rising: A bool representing if the rocket is moving up, which
+                shows the flame
+            x_velocity: A float representing the rocket's x velocity
+            ticks: An int representing the milliseconds since the game
+                started, used to cycle the flame frames
+
+        Returns:
+            A tuple of the pygame.Surface to draw and a tuple of the int x
+            and y offset of its center from the center of the hitbox
+        """
+        steps = self._tilt_steps
+        tilt = round(x_velocity / self._top_speed * steps)
+        tilts = self._frames[min(max(tilt, -steps), steps) + steps]
+        if not rising:
+            return tilts[0]
+        return tilts[1 + ticks // self._frame_ms % (len(tilts) - 1)]
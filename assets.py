@@ -0,0 +1,205 @@
+"""
+This module creates a cache for the images, sounds and fonts used by the
+game, so each file is only loaded from disk once no matter how many
+players, models or views are made. Files can also be loaded ahead of time
+on background threads while the menu is showing.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import pygame
+
+# Files the game needs after the menu, loaded in the background at startup.
+# The background music is not here since it is streamed by
+# pygame.mixer.music instead of being decoded up front.
+GAME_IMAGES = (
+    "sprites/TestRocket.png",
+    "sprites/rocket_move_0.png",
+    "sprites/rocket_move_1.png",
+)
+GAME_SOUNDS = (
+    "sounds/rocketbrrrnoises.wav",
+    "sounds/end_sound.wav",
+)
+
+
+class AssetCache:
+    """
+    Loads images, sounds and fonts once and keeps them for reuse. Images
+    are kept scaled to each size they are asked for and, once a display
+    exists, converted to the display's pixel format so drawing them does
+    not convert every pixel on every blit.
+
+    Files being preloaded are stored as a Future until they are first
+    asked for, so asking for one only waits for that file to finish.
+
+    Attributes:
+        _sources: A dict mapping an image path to the pygame.Surface
+            loaded from disk, or a Future of it while preloading
+        _images: A dict mapping a tuple of an image path and size to the
+            scaled pygame.Surface
+        _unconverted: A set of the keys in _images that were cached before
+            a display existed and have not been converted yet
+        _sounds: A dict mapping a sound path to its pygame.mixer.Sound,
+            or a Future of it while preloading
+        _fonts: A dict mapping a tuple of a font path and size to the
+            pygame.font.Font
+        _executor: A ThreadPoolExecutor used to preload files, or None if
+            nothing has been preloaded
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            none
+        """
+        self._sources = {}
+        self._images = {}
+        self._unconverted = set()
+        self._sounds = {}
+        self._fonts = {}
+        self._executor = None
+
+    def image(self, path, width=None):
+        """
+        Returns an image, scaled to a width while keeping its aspect ratio
+
+        Args:
+            path: A string representing the path of the image file
+            width: An int representing the width to scale the image to, or
+                None to keep the original size. Defaults to None.
+
+        Returns:
+            A pygame.Surface of the image. The same surface is returned
+            every time, so it should not be drawn on.
+        """
+        source = self._sources.get(path)
+        if source is None:
+            source = pygame.image.load(path)
+        elif isinstance(source, Future):
+            source = source.result()
+        self._sources[path] = source
+        if width is None:
+            size = source.get_size()
+        else:
+            size = (
+                width,
+                int(width * (source.get_height() / source.get_width())),
+            )
+        key = (path, size)
+
+        image = self._images.get(key)
+        if image is None:
+            if size == source.get_size():
+                image = source
+            else:
+                image = pygame.transform.scale(source, size)
+            self._unconverted.add(key)
+        if key in self._unconverted and pygame.display.get_surface():
+            image = image.convert_alpha()
+            self._unconverted.discard(key)
+        self._images[key] = image
+        return image
+
+    def sound(self, path):
+        """
+        Returns a sound
+
+        Args:
+            path: A string representing the path of the sound file
+
+        Returns:
+            A pygame.mixer.Sound of the sound file
+        """
+        sound = self._sounds.get(path)
+        if sound is None:
+            _start_mixer()
+            sound = pygame.mixer.Sound(path)
+        elif isinstance(sound, Future):
+            sound = sound.result()
+        self._sounds[path] = sound
+        return sound
+
+    def font(self, path, size):
+        """
+        Returns a font, starting the font module the first time one is
+        asked for
+
+        Args:
+            path: A string representing the path of the font file
+            size: An int representing the font size
+
+        Returns:
+            A pygame.font.Font of the font file
+        """
+        font = self._fonts.get((path, size))
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(path, size)
+            self._fonts[(path, size)] = font
+        return font
+
+    def preload(self, images=(), sounds=()):
+        """
+        Starts loading files on background threads, so they are ready or
+        nearly ready by the time they are asked for. Images are only
+        decoded there; scaling and converting them happens the first time
+        they are asked for. The mixer is started before returning, since
+        SDL subsystems should be started from the main thread.
+
+        Args:
+            images: An iterable of strings representing image paths.
+                Defaults to none.
+            sounds: An iterable of strings representing sound paths.
+                Defaults to none.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=3, thread_name_prefix="assets"
+            )
+        for path in images:
+            if path not in self._sources:
+                self._sources[path] = self._executor.submit(
+                    pygame.image.load, path
+                )
+        if sounds:
+            _start_mixer()
+        for path in sounds:
+            if path not in self._sounds:
+                self._sounds[path] = self._executor.submit(
+                    pygame.mixer.Sound, path
+                )
+
+    def ready(self, path):
+        """
+        Returns if an image or sound can be used without waiting for it to
+        load
+
+        Args:
+            path: A string representing the path of the file
+
+        Returns:
+            A bool representing if the file has finished loading. A file
+            that failed to load counts as ready, since asking for it will
+            not wait.
+        """
+        entry = self._sources.get(path, self._sounds.get(path))
+        if isinstance(entry, Future):
+            return entry.done()
+        return entry is not None
+
+
+def _start_mixer():
+    """
+    Starts the mixer if it has not been started
+
+    Args:
+        none
+    """
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+
+
+ASSETS = AssetCache()
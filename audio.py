@@ -0,0 +1,76 @@
+"""
+This module creates a class to play short sound effects on a few mixer
+channels kept for them, so effects played in quick succession cannot use
+up every channel.
+"""
+
+import pygame
+
+
+class SoundPool:
+    """
+    Plays sound effects on channels reserved for them. Reserved channels
+    are never picked by Sound.play, so other sounds cannot take them. A
+    sound started again sooner than a minimum interval after it last
+    started is skipped, and when every channel is busy they are cut off
+    in turn.
+
+    Attributes:
+        _channels: A list of the pygame.mixer.Channel instances reserved
+            for the pool
+        _next: An int representing the index of the channel to reuse
+            when every channel is busy
+        _min_interval: An int representing the fewest milliseconds
+            between starts of the same sound
+        _last_played: A dict mapping a pygame.mixer.Sound to the
+            pygame.time.get_ticks() value it was last started at
+    """
+
+    def __init__(self, channels=2, min_interval=100) -> None:
+        """
+        Reserves the pool's channels. The mixer must be started.
+
+        Args:
+            channels: An int representing the number of channels to
+                reserve. Defaults to 2.
+            min_interval: An int representing the fewest milliseconds
+                between starts of the same sound. Defaults to 100.
+        """
+        if pygame.mixer.get_num_channels() < channels:
+            pygame.mixer.set_num_channels(channels)
+        pygame.mixer.set_reserved(channels)
+        self._channels = [
+            pygame.mixer.Channel(index) for index in range(channels)
+        ]
+        self._next = 0
+        self._min_interval = min_interval
+        self._last_played = {}
+
+    def play(self, sound, now=None):
+        """
+        Plays a sound on one of the pool's channels, unless it was started
+        too recently
+
+        Args:
+            sound: A pygame.mixer.Sound to play
+            now: An int representing the current time in milliseconds, or
+                None to use pygame.time.get_ticks(). Defaults to None.
+
+        Returns:
+            The pygame.mixer.Channel the sound is playing on, or None if
+            it was skipped
+        """
+        if now is None:
+            now = pygame.time.get_ticks()
+        last = self._last_played.get(sound)
+        if last is not None and now - last < self._min_interval:
+            return None
+        self._last_played[sound] = now
+        for channel in self._channels:
+            if not channel.get_busy():
+                break
+        else:
+            channel = self._channels[self._next]
+            self._next = (self._next + 1) % len(self._channels)
+        channel.play(sound)
+        return channel
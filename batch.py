@@ -0,0 +1,511 @@
+"""
+This module creates a class to step many independent game sessions at
+once. Player and platform state for every session is held in NumPy arrays
+so each frame is a handful of vectorized operations instead of a Python
+loop over Model instances.
+"""
+
+import numpy as np
+from generation import next_platform_rects, round_half_away
+
+
+class BatchSimulation:
+    """
+    Steps N game sessions together, applying the same rules as
+    Simulation.step: scrolling and scoring, Player.move's gravity and
+    friction integration, Model.update's landing and jump rule and
+    Model.check_player_off_screen.
+
+    Like the Model, positions and platforms are in world coordinates and
+    each session has a camera offset that scrolling increases.
+
+    Platforms are stored in fixed slots per session. Removed platforms are
+    marked as not alive, and an insertion counter keeps the order the
+    pygame.sprite.Group would have so new platforms are placed above the
+    latest one.
+    Sessions are refilled to the platform count with next_platform_rects,
+    one vectorized call per platform missing from the emptiest session.
+
+    Attributes:
+        _width: int representing the width of the display screen
+        _height: int representing the height of the display screen
+        _fps: An int representing the frames per second the game is
+            designed to run at
+        _gravity: A float representing the downwards acceleration
+        _friction: A float representing the horizontal friction
+        _jump_velocity: A float representing the y velocity of a jump
+        _player_size: A tuple of ints representing the player hitbox
+            width and height
+        _difficulty: A NumPy array of floats with the difficulty of
+            each session
+        _position: A (N, 2) NumPy array of player positions
+        _velocity: A (N, 2) NumPy array of player velocities
+        _rect_left: A NumPy array of the player hitbox left edges
+        _rect_top: A NumPy array of the player hitbox top edges
+        _camera_offset: A NumPy array of how far each session has scrolled
+        _platforms: A (N, P, 4) NumPy int64 array of platform left, top,
+            width and height
+        _alive: A (N, P) NumPy bool array of platform slots in use
+        _order: A (N, P) NumPy int64 array of platform insertion order
+        _next_order: An int representing the next insertion order value
+        _platform_num: An int representing the number of platforms each
+            session is refilled to, or None to not generate platforms
+        _rng: A numpy.random.Generator used for platform generation
+        _score: A NumPy array of session scores
+        _timer: A NumPy array of frames left in each session
+        _current_time: A NumPy array of the timer value when each session
+            last scored
+        _can_increase_score: A NumPy bool array of whether each session
+            can score on its next upwards scroll
+        _game_over: A NumPy bool array of sessions whose player left the
+            screen
+        _frames: A NumPy array of frames stepped in each session
+    """
+
+    def __init__(
+        self,
+        platforms,
+        width,
+        height,
+        difficulty=0.5,
+        fps=60,
+        player_size=(35, 53),
+        platform_num=30,
+        seed=None,
+    ) -> None:
+        """
+        Initializes N sessions with the player standing where a new
+        Player starts.
+
+        Args:
+            platforms: A (N, P, 4) array-like of platform left, top, width
+                and height in insertion order. Slots with a width of 0
+                are empty.
+            width: int representing the width of the display screen
+            height: int representing the height of the display screen
+            difficulty: A float or array-like of floats with the difficulty
+                of each session. Defaults to 0.5.
+            fps: An int representing the frames per second the game is
+                designed to run at. Defaults to 60.
+            player_size: A tuple of ints representing the player hitbox
+                width and height. Defaults to (35, 53).
+            platform_num: An int representing the number of platforms each
+                session is refilled to, or None to not generate platforms.
+                Defaults to 30.
+            seed: An int used to seed platform generation, or None for a
+                random seed. Defaults to None.
+        """
+        platforms = np.array(platforms, dtype=np.int64)
+        count, slots = platforms.shape[:2]
+        if platform_num is not None and slots < platform_num:
+            platforms = np.concatenate(
+                (platforms, np.zeros((count, platform_num - slots, 4), int)),
+                1,
+            )
+            slots = platform_num
+        self._width = width
+        self._height = height
+        self._fps = fps
+        self._gravity = 0.35
+        self._friction = 0.12
+        self._jump_velocity = -10.0
+        self._player_size = player_size
+        self._difficulty = np.broadcast_to(
+            np.asarray(difficulty, dtype=np.float64), (count,)
+        ).copy()
+        self._position = np.tile(np.array([200.0, 310.0]), (count, 1))
+        self._velocity = np.zeros((count, 2))
+        self._rect_left = np.zeros(count, dtype=np.int64)
+        self._rect_top = np.zeros(count, dtype=np.int64)
+        self._update_rects(np.ones(count, dtype=bool))
+        self._camera_offset = np.zeros(count)
+        self._platforms = platforms
+        self._alive = platforms[:, :, 2] > 0
+        self._order = np.tile(np.arange(slots, dtype=np.int64), (count, 1))
+        self._next_order = slots
+        self._platform_num = platform_num
+        self._rng = np.random.default_rng(seed)
+        self._score = np.zeros(count, dtype=np.int64)
+        self._timer = np.full(count, 60 * fps, dtype=np.int64)
+        self._current_time = np.zeros(count, dtype=np.int64)
+        self._can_increase_score = np.ones(count, dtype=bool)
+        self._game_over = np.zeros(count, dtype=bool)
+        self._frames = np.zeros(count, dtype=np.int64)
+
+    @classmethod
+    def from_simulations(cls, simulations, generate=True, seed=None):
+        """
+        Creates a batch that continues from the current state of a list
+        of Simulation instances.
+
+        Args:
+            simulations: A list of Simulation instances with the same
+                screen size
+            generate: A bool representing if the batch should generate
+                platforms like the Simulations do. Defaults to True.
+            seed: An int used to seed platform generation, or None for a
+                random seed. Defaults to None.
+
+        Returns:
+            A BatchSimulation instance
+        """
+        models = [simulation.model for simulation in simulations]
+        slots = max(len(model.platforms) for model in models)
+        platforms = np.zeros((len(models), slots, 4), dtype=np.int64)
+        for row, model in enumerate(models):
+            for slot, platform in enumerate(model.platforms):
+                platforms[row, slot] = (
+                    platform.rect.left,
+                    platform.rect.top,
+                    platform.rect.width,
+                    platform.rect.height,
+                )
+        # pylint: disable=protected-access
+        first = models[0]
+        batch = cls(
+            platforms,
+            first._screen_width,
+            first._screen_height,
+            [model._game_difficulty for model in models],
+            simulations[0]._fps,
+            first.player.rect.size,
+            first._platform_num if generate else None,
+            seed,
+        )
+        for row, simulation in enumerate(simulations):
+            player = simulation.model.player
+            batch._position[row] = (player.position.x, player.position.y)
+            batch._velocity[row] = (player.velocity.x, player.velocity.y)
+            batch._rect_left[row] = player.rect.left
+            batch._rect_top[row] = player.rect.top
+            batch._camera_offset[row] = simulation.model.camera_offset
+            batch._score[row] = simulation.model.score
+            batch._timer[row] = simulation.timer
+            batch._current_time[row] = simulation._current_time
+            batch._can_increase_score[row] = simulation._can_increase_score
+            batch._game_over[row] = simulation.model.game_over
+            batch._frames[row] = simulation.frames
+        return batch
+
+    def step(self, x_acceleration, jumping):
+        """
+        Advances every unfinished session by one frame. Finished sessions
+        are left unchanged.
+
+        Args:
+            x_acceleration: A float or array-like of floats representing
+                the horizontal acceleration input of each session.
+            jumping: A bool or array-like of bools representing if each
+                session is holding jump.
+        """
+        active = ~self.finished
+        count = len(active)
+        x_acceleration = np.broadcast_to(
+            np.asarray(x_acceleration, dtype=np.float64), (count,)
+        )
+        jumping = np.broadcast_to(np.asarray(jumping, dtype=bool), (count,))
+
+        self._scroll(active)
+        self._generate(active)
+        self._move(active, x_acceleration)
+        self._land(active, jumping)
+        self._update_rects(active)
+        self._check_off_screen(active)
+        self._timer -= active
+        self._frames += active
+
+    def _scroll(self, active):
+        """
+        Scrolls sessions whose player is in the top third of the screen
+        and updates their score, as Model.scroll and Simulation.step do.
+
+        Args:
+            active: A NumPy bool array of sessions to step
+        """
+        scrolled = active & (
+            self._rect_top + self._camera_offset <= self._height / 3
+        )
+        self._camera_offset += np.where(
+            scrolled, np.abs(self._velocity[:, 1]), 0.0
+        )
+        self._alive &= ~(
+            scrolled[:, None]
+            & (
+                self._platforms[:, :, 1]
+                >= (self._height - self._camera_offset)[:, None]
+            )
+        )
+
+        scored = scrolled & (self._velocity[:, 1] < 0)
+        self._score += scored & self._can_increase_score
+        self._current_time = np.where(scored, self._timer, self._current_time)
+        self._can_increase_score &= ~scored
+        self._can_increase_score |= active & (
+            self._current_time - self._timer > 1
+        )
+
+    def _generate(self, active):
+        """
+        Adds platforms above the latest one in each session until it has
+        the platform count again, as Model.platform_generation does
+
+        Args:
+            active: A NumPy bool array of sessions to step
+        """
+        if self._platform_num is None:
+            return
+        while True:
+            rows = np.flatnonzero(
+                active & (self._alive.sum(1) < self._platform_num)
+            )
+            if len(rows) == 0:
+                return
+            alive = self._alive[rows]
+            latest = np.argmax(np.where(alive, self._order[rows], -1), 1)
+            new_platforms = next_platform_rects(
+                self._rng,
+                self._platforms[rows, latest],
+                self._difficulty[rows],
+                self._width,
+                self._player_size[0],
+                (self._gravity, self._jump_velocity),
+            )
+            free = np.argmin(alive, 1)
+            self._platforms[rows, free] = new_platforms
+            self._alive[rows, free] = True
+            self._order[rows, free] = self._next_order
+            self._next_order += 1
+
+    def _move(self, active, x_acceleration):
+        """
+        Applies Player.move's integration to every active session
+
+        Args:
+            active: A NumPy bool array of sessions to step
+            x_acceleration: A NumPy array of horizontal acceleration inputs
+        """
+        x_accel = np.where(
+            active, x_acceleration - self._velocity[:, 0] * self._friction, 0
+        )
+        y_accel = np.where(active, self._gravity, 0.0)
+        self._velocity[:, 0] += x_accel
+        self._velocity[:, 1] += y_accel
+        self._position += np.where(
+            active[:, None],
+            self._velocity + 0.5 * np.stack((x_accel, y_accel), 1),
+            0.0,
+        )
+
+    def _land(self, active, jumping):
+        """
+        Applies Model.update's landing and jump rule. Like the Model, the
+        collision uses the player hitbox from the previous frame.
+
+        Args:
+            active: A NumPy bool array of sessions to step
+            jumping: A NumPy bool array of jump inputs
+        """
+        width, height = self._player_size
+        left = self._rect_left[:, None]
+        top = self._rect_top[:, None]
+        plat_left = self._platforms[:, :, 0]
+        plat_top = self._platforms[:, :, 1]
+        plat_right = plat_left + self._platforms[:, :, 2]
+        plat_bottom = plat_top + self._platforms[:, :, 3]
+        hits = (
+            self._alive
+            & (left < plat_right)
+            & (plat_left < left + width)
+            & (top < plat_bottom)
+            & (plat_top < top + height)
+        )
+        # The platform whose top is closest to the player's feet is the one
+        # the Model lands on, the higher one if two are equally close
+        largest = np.iinfo(np.int64).max
+        distance = np.where(hits, np.abs(plat_top - (top + height)), largest)
+        nearest = hits & (distance == distance.min(1, keepdims=True))
+        hit = np.argmin(np.where(nearest, plat_top, largest), 1)
+        rows = np.arange(len(hit))
+        landed = (
+            active
+            & hits[rows, hit]
+            & (self._velocity[:, 1] >= 0)
+            & (self._rect_top + height < plat_bottom[rows, hit])
+        )
+        self._velocity[landed, 1] = 0.0
+        self._position[landed, 1] = plat_top[rows, hit][landed] - height / 2
+        self._velocity[landed & jumping, 1] = self._jump_velocity
+
+    def _update_rects(self, active):
+        """
+        Moves the player hitbox to the player position, as Player.update
+        does
+
+        Args:
+            active: A NumPy bool array of sessions to update
+        """
+        width, height = self._player_size
+        centers = round_half_away(self._position[active])
+        self._rect_left[active] = centers[:, 0] - width // 2
+        self._rect_top[active] = centers[:, 1] - height // 2
+
+    def _check_off_screen(self, active):
+        """
+        Applies Model.check_player_off_screen to every active session
+
+        Args:
+            active: A NumPy bool array of sessions to check
+        """
+        x_pos = self._position[:, 0]
+        self._game_over |= active & (
+            (x_pos < 0)
+            | (x_pos > self._width)
+            | (self._position[:, 1] + self._camera_offset > self._height)
+        )
+
+    @property
+    def positions(self):
+        """
+        Returns the player position of each session
+
+        Args:
+            none
+
+        Returns:
+            A read only (N, 2) NumPy array of player positions
+        """
+        return self._read_only(self._position)
+
+    @property
+    def velocities(self):
+        """
+        Returns the player velocity of each session
+
+        Args:
+            none
+
+        Returns:
+            A read only (N, 2) NumPy array of player velocities
+        """
+        return self._read_only(self._velocity)
+
+    @property
+    def camera_offsets(self):
+        """
+        Returns how far each session has scrolled
+
+        Args:
+            none
+
+        Returns:
+            A read only NumPy array of camera offsets
+        """
+        return self._read_only(self._camera_offset)
+
+    @property
+    def platforms(self):
+        """
+        Returns the platform slots of each session
+
+        Args:
+            none
+
+        Returns:
+            A read only (N, P, 4) NumPy array of platform left, top, width
+            and height. Use alive to tell which slots are in use.
+        """
+        return self._read_only(self._platforms)
+
+    @property
+    def alive(self):
+        """
+        Returns which platform slots are in use
+
+        Args:
+            none
+
+        Returns:
+            A read only (N, P) NumPy bool array
+        """
+        return self._read_only(self._alive)
+
+    @property
+    def scores(self):
+        """
+        Returns the score of each session
+
+        Args:
+            none
+
+        Returns:
+            A read only NumPy array of scores
+        """
+        return self._read_only(self._score)
+
+    @property
+    def timers(self):
+        """
+        Returns the frames left in each session
+
+        Args:
+            none
+
+        Returns:
+            A read only NumPy array of frames left
+        """
+        return self._read_only(self._timer)
+
+    @property
+    def frames(self):
+        """
+        Returns the frames stepped in each session
+
+        Args:
+            none
+
+        Returns:
+            A read only NumPy array of frames stepped
+        """
+        return self._read_only(self._frames)
+
+    @property
+    def game_over(self):
+        """
+        Returns which sessions had the player leave the screen
+
+        Args:
+            none
+
+        Returns:
+            A read only NumPy bool array
+        """
+        return self._read_only(self._game_over)
+
+    @property
+    def finished(self):
+        """
+        Returns which sessions are over, either by the player leaving the
+        screen or by running out of fuel
+
+        Args:
+            none
+
+        Returns:
+            A NumPy bool array
+        """
+        return self._game_over | (self._timer <= 0)
+
+    @staticmethod
+    def _read_only(array):
+        """
+        Returns a view of an array that cannot be written to
+
+        Args:
+            array: A NumPy array
+
+        Returns:
+            A read only view of the array
+        """
+        view = array.view()
+        view.flags.writeable = False
+        return view
@@ -0,0 +1,278 @@
+"""
+This module times the parts of the game that run every frame, so changes
+can be compared against a saved baseline.
+
+Usage:
+    python benchmark.py             Runs every case and compares the
+                                    results with the saved baseline
+    python benchmark.py --save      Runs every case and saves the results
+                                    as the new baseline
+
+Results depend on the machine, so baselines should only be compared with
+runs on the same machine.
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import pygame
+from runner import climb
+from simulation import Simulation
+
+WIDTH = 400
+HEIGHT = 450
+BASELINE_PATH = "benchmark_baseline.json"
+
+
+def _climbed_simulation(frames):
+    """
+    Creates a seeded session that has been climbing for a number of frames
+
+    Args:
+        frames: An int representing the number of frames to step
+
+    Returns:
+        An instance of the Simulation class
+    """
+    simulation = Simulation(WIDTH, HEIGHT, difficulty=0.5, seed=1)
+    simulation.run(climb, max_frames=frames)
+    return simulation
+
+
+def bench_model_update():
+    """
+    Times Model.update with the player standing on the ground and a full
+    set of platforms above it
+
+    Returns:
+        A function taking no arguments that runs the case once
+    """
+    model = Simulation(WIDTH, HEIGHT, seed=1).model
+    model.platform_generation()
+    return lambda: model.update(0, False)
+
+
+def bench_player_physics():
+    """
+    Times one step of the player's physics kernel, Player.move followed by
+    Player.update, with the player falling and running left
+
+    Returns:
+        A function taking no arguments that runs the case once
+    """
+    player = Simulation(WIDTH, HEIGHT, seed=1).model.player
+
+    def run():
+        player.move(-0.5)
+        player.update()
+        if player.state.y > HEIGHT:
+            player.set_position((200, 0))
+            player.set_velocity((0, 0))
+
+    return run
+
+
+def bench_platform_generation():
+    """
+    Times Model.platform_generation refilling every platform above the
+    ground
+
+    Returns:
+        A function taking no arguments that runs the case once
+    """
+    model = Simulation(WIDTH, HEIGHT, seed=1).model
+
+    def run():
+        for platform in model.platforms.sprites()[1:]:
+            platform.kill()
+        model.platform_generation()
+
+    return run
+
+
+def bench_calculate_x_landing():
+    """
+    Times Model.calculate_x_landing over a typical range
+
+    Returns:
+        A function taking no arguments that runs the case once
+    """
+    model = Simulation(WIDTH, HEIGHT, difficulty=0.75, seed=1).model
+    return lambda: model.calculate_x_landing(20, 380)
+
+
+def bench_game_camera():
+    """
+    Times Model.scroll, which is all Game.camera runs, while the player is
+    high enough for the screen to scroll
+
+    Returns:
+        A function taking no arguments that runs the case once
+    """
+    model = Simulation(WIDTH, HEIGHT, seed=1).model
+    model.platform_generation()
+    player = model.player
+
+    def run():
+        player.set_position(pygame.math.Vector2(200, 100 - model.camera_offset))
+        player.set_velocity(pygame.math.Vector2(0, -10))
+        player.update()
+        model.scroll()
+
+    return run
+
+
+def bench_draw_game():
+    """
+    Times View.draw_game redrawing the whole screen onto an offscreen
+    surface
+
+    Returns:
+        A function taking no arguments that runs the case once
+    """
+    # Imported here since loading the view needs a display
+    from view import View  # pylint: disable=import-outside-toplevel
+
+    model = _climbed_simulation(300).model
+    view = View(model)
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    return lambda: view.draw_game(surface)
+
+
+def bench_headless_frame():
+    """
+    Times one headless Simulation.step with the climbing policy, starting
+    a new session when the last one finishes
+
+    Returns:
+        A function taking no arguments that runs the case once
+    """
+    sessions = [_climbed_simulation(0)]
+
+    def run():
+        simulation = sessions[0]
+        if simulation.finished:
+            simulation = _climbed_simulation(0)
+            sessions[0] = simulation
+        simulation.step(*climb(simulation.model))
+
+    return run
+
+
+CASES = {
+    "model_update": bench_model_update,
+    "player_physics": bench_player_physics,
+    "platform_generation": bench_platform_generation,
+    "calculate_x_landing": bench_calculate_x_landing,
+    "game_camera": bench_game_camera,
+    "draw_game": bench_draw_game,
+    "headless_frame": bench_headless_frame,
+}
+
+
+def time_case(case, repeat=5):
+    """
+    Times a benchmark case, taking the fastest of several runs to reduce
+    noise from the rest of the machine
+
+    Args:
+        case: A function that sets up the case and returns a function
+            taking no arguments that runs it once
+        repeat: An int representing the number of runs. Defaults to 5.
+
+    Returns:
+        A float representing the fastest seconds taken per call
+    """
+    timer = timeit.Timer(case())
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def compare(results, baseline, threshold):
+    """
+    Finds the cases that got slower than the baseline by more than a
+    threshold
+
+    Args:
+        results: A dict mapping case names to seconds per call
+        baseline: A dict mapping case names to seconds per call
+        threshold: A float representing the fraction a case may slow down
+            by before it counts as a regression
+
+    Returns:
+        A dict mapping the names of regressed cases to the fraction they
+        slowed down by
+    """
+    return {
+        name: seconds / baseline[name] - 1
+        for name, seconds in results.items()
+        if name in baseline and seconds > baseline[name] * (1 + threshold)
+    }
+
+
+def main():
+    """
+    Runs the benchmarks from the command line
+
+    Args:
+        none
+
+    Returns:
+        An int representing the exit code, 1 if any case regressed
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--save", action="store_true", help="save results as the baseline"
+    )
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="fraction slower than the baseline counted as a regression",
+    )
+    parser.add_argument(
+        "--case", action="append", choices=CASES, help="cases to run"
+    )
+    args = parser.parse_args()
+
+    # The benchmarks draw offscreen, so no window or sound is needed
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    results = {}
+    for name in args.case or CASES:
+        results[name] = time_case(CASES[name])
+        line = f"{name:<22}{results[name] * 1e6:>12.2f} us"
+        if name in baseline:
+            change = results[name] / baseline[name] - 1
+            line += f"{change:>+10.1%}"
+        print(line)
+    # Every case runs on one thread, so these are frames per second per
+    # core
+    for name in ("player_physics", "headless_frame"):
+        if name in results:
+            print(f"{name + ' fps':<22}{1 / results[name]:>12.0f}")
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump({**baseline, **results}, file, indent=4)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, change in regressions.items():
+        print(f"REGRESSION {name}: {change:+.1%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+This module creates a class that works out where platforms go on a
+background thread, ahead of when the game needs them. Only positions and
+sizes are computed there; sprites are still made on the main thread.
+"""
+
+import queue
+import threading
+import pygame
+
+# Seconds a thread waits on the queue before checking if the other thread
+# has stopped
+POLL_SECONDS = 0.1
+
+
+def spec_rect(spec):
+    """
+    Finds the rect a platform made from a spec will have
+
+    Args:
+        spec: A tuple of a (width, height) tuple and a center tuple
+
+    Returns:
+        A pygame.Rect placed the same way Platform places its rect
+    """
+    size, center = spec
+    rect = pygame.Rect((0, 0), size)
+    rect.center = center
+    return rect
+
+
+class PlatformChunkWorker:
+    """
+    Computes platform specs on a background thread, each one placed above
+    the one before, and hands them to the main thread in chunks through a
+    bounded queue. The worker only gets as far ahead as the queue holds.
+
+    Specs are computed in order from one chain, so for the same random
+    state they are the same as computing them on the main thread. The
+    spec function must not be called from anywhere else while the worker
+    is running. Once the worker stops, specs carries on the chain on the
+    thread using it, and an error in the spec function is raised there.
+
+    Attributes:
+        _spec_function: A function taking the pygame.Rect of the previous
+            platform and returning the spec of the next one
+        _chunk_size: An int representing the number of specs per chunk
+        _queue: A queue.Queue of lists of specs waiting to be used, ending
+            with the exception the worker stopped on if it failed
+        _stop: A threading.Event set when the worker should stop
+        _pending: A list of the specs computed but not queued when the
+            worker stopped
+        _previous_rect: A pygame.Rect of the last spec the worker
+            computed, set when it stops
+        _error: The Exception the spec function raised, or None
+        _thread: The threading.Thread computing specs
+    """
+
+    def __init__(
+        self, spec_function, previous_rect, chunk_size=8, max_chunks=4
+    ) -> None:
+        """
+        Starts computing specs.
+
+        Args:
+            spec_function: A function taking the pygame.Rect of the
+                previous platform and returning a tuple of the (width,
+                height) and center of the next one
+            previous_rect: A pygame.Rect of the platform the first spec is
+                placed above
+            chunk_size: An int representing the number of specs per
+                chunk. Defaults to 8.
+            max_chunks: An int representing the most chunks computed
+                ahead. Defaults to 4.
+        """
+        self._spec_function = spec_function
+        self._chunk_size = chunk_size
+        self._queue = queue.Queue(maxsize=max_chunks)
+        self._stop = threading.Event()
+        self._pending = []
+        self._previous_rect = pygame.Rect(previous_rect)
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(pygame.Rect(previous_rect),),
+            name="platforms",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self, previous_rect):
+        """
+        Computes chunks of specs until stopped, waiting while the queue is
+        full. If the spec function raises, the error is queued for the
+        main thread and the worker stops.
+
+        Args:
+            previous_rect: A pygame.Rect of the platform the first spec is
+                placed above
+        """
+        chunk = []
+        try:
+            while not self._stop.is_set():
+                chunk = []
+                for _ in range(self._chunk_size):
+                    spec = self._spec_function(previous_rect)
+                    chunk.append(spec)
+                    previous_rect = spec_rect(spec)
+                if self._put(chunk):
+                    chunk = []
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self._error = error
+            self._put(error)
+        self._pending = chunk
+        self._previous_rect = previous_rect
+
+    def _put(self, item):
+        """
+        Queues an item, waiting while the queue is full unless the worker
+        is stopped
+
+        Args:
+            item: A list of specs or an Exception to queue
+
+        Returns:
+            A bool representing if the item was queued
+        """
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def specs(self):
+        """
+        Yields specs in order as the worker finishes them. Only waits if
+        the worker has not got ahead, such as just after it starts. Once
+        the worker has stopped and its specs are used up, the rest are
+        computed on the calling thread.
+
+        Args:
+            none
+
+        Yields:
+            A tuple of the (width, height) and center of a platform
+
+        Raises:
+            Exception: The error the spec function raised, if it failed
+        """
+        while self._thread.is_alive() or not self._queue.empty():
+            try:
+                item = self._queue.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                continue
+            if isinstance(item, Exception):
+                raise item
+            yield from item
+        if self._error is not None:
+            raise self._error
+        yield from self._pending
+        self._pending = []
+        previous_rect = self._previous_rect
+        while True:
+            spec = self._spec_function(previous_rect)
+            self._previous_rect = previous_rect = spec_rect(spec)
+            yield spec
+
+    def stop(self):
+        """
+        Stops the worker and waits for its thread to finish. Specs can
+        still be taken from specs afterwards.
+
+        Args:
+            none
+        """
+        self._stop.set()
+        self._thread.join()
+
+    @property
+    def chunks_ready(self):
+        """
+        Returns the number of chunks waiting to be used
+
+        Args:
+            none
+
+        Returns:
+            An int representing the number of chunks in the queue
+        """
+        return self._queue.qsize()
@@ -0,0 +1,136 @@
+"""
+This module creates a sprite group that indexes platforms by height, so
+collision checks only look at the platforms level with the player instead
+of every platform in the game.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+import pygame
+
+
+def _bottom(sprite):
+    """
+    Returns the bottom of a sprite's rect, used as the sort key
+
+    Args:
+        sprite: A sprite with a rect
+
+    Returns:
+        An int representing the bottom edge of the sprite
+    """
+    return sprite.rect.bottom
+
+
+class PlatformIndex(pygame.sprite.Group):
+    """
+    A pygame.sprite.Group that also keeps its sprites in a list sorted by
+    the bottom of their rects. Sprites that are killed are removed from
+    the index like from any other group.
+
+    Sprites should not move once added. If they do, they must all move by
+    the same distance so the sorted order stays correct.
+
+    Attributes:
+        _sorted: A list of sprites sorted by the bottom of their rects
+        _max_height: An int representing the tallest sprite height added
+    """
+
+    def __init__(self, *sprites) -> None:
+        """
+        Initializes the index.
+
+        Args:
+            sprites: Sprites to add to the index
+        """
+        self._sorted = []
+        self._max_height = 0
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        """
+        Adds a sprite to the group and the sorted list
+
+        Args:
+            sprite: A sprite with a rect
+            layer: Unused, kept to match pygame.sprite.Group
+        """
+        super().add_internal(sprite, layer)
+        insort(self._sorted, sprite, key=_bottom)
+        self._max_height = max(self._max_height, sprite.rect.height)
+
+    def remove_internal(self, sprite):
+        """
+        Removes a sprite from the group and the sorted list
+
+        Args:
+            sprite: A sprite in the group
+        """
+        super().remove_internal(sprite)
+        index = bisect_left(self._sorted, _bottom(sprite), key=_bottom)
+        while self._sorted[index] is not sprite:
+            index += 1
+        del self._sorted[index]
+
+    def query(self, rect):
+        """
+        Finds the sprites that overlap a rect, only checking the sprites
+        whose vertical span overlaps it
+
+        Args:
+            rect: A pygame.Rect to check
+
+        Returns:
+            A list of sprites colliding with the rect
+        """
+        hits = []
+        index = bisect_right(self._sorted, rect.top, key=_bottom)
+        lowest_bottom = rect.bottom + self._max_height
+        while index < len(self._sorted):
+            sprite = self._sorted[index]
+            if sprite.rect.bottom >= lowest_bottom:
+                break
+            if rect.colliderect(sprite.rect):
+                hits.append(sprite)
+            index += 1
+        return hits
+
+    def below(self, y_pos):
+        """
+        Finds the sprites whose top is at or below a y coordinate, only
+        checking the lowest sprites
+
+        Args:
+            y_pos: A float representing the y coordinate
+
+        Returns:
+            A list of the sprites with rect.top >= y_pos
+        """
+        found = []
+        index = len(self._sorted) - 1
+        while index >= 0 and self._sorted[index].rect.bottom >= y_pos:
+            if self._sorted[index].rect.top >= y_pos:
+                found.append(self._sorted[index])
+            index -= 1
+        return found
+
+    def nearest_contact(self, rect):
+        """
+        Finds the overlapping sprite whose top is closest to the bottom of
+        a rect, which is the platform a falling player lands on
+
+        Args:
+            rect: A pygame.Rect to check
+
+        Returns:
+            The nearest colliding sprite, or None if nothing collides
+        """
+        hits = self.query(rect)
+        if not hits:
+            return None
+        return min(
+            hits,
+            key=lambda sprite: (
+                abs(sprite.rect.top - rect.bottom),
+                sprite.rect.top,
+            ),
+        )
@@ -5,19 +5,61 @@ It acts as the Controller section of MVC architecture.
 """
 
 import sys
+import time
 import pygame
 
 
+# The only event types the game handles. Everything else is blocked so
+# it never fills the event queue.
+ALLOWED_EVENTS = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.WINDOWEXPOSED,
+)
+
+
+def filter_events():
+    """
+    Blocks every event type the game does not handle from being queued.
+    Needs pygame to be initialized.
+
+    Args:
+        none
+    """
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(ALLOWED_EVENTS)
+
+
 class Controller:
     """
     Dictates actions to be completed based on specified user inputs.
 
+    Events are handled by looking up their (type, key) in a dispatch table
+    for the current screen, with None as the key for events without one.
+
     Attributes:
         _jumping: A bool representing whether the character is jumping
             or not.
         _left_right: A float representing the horizontal acceleration of the
             character.
         _view: An instance of the view class for Controller to modify
+        _show_profile: A bool representing if the frame timing overlay
+            should be shown. Toggled with F3.
+        _paused: A bool representing if the game is paused. Toggled with
+            P or Escape.
+        _input_times: A list of the time.perf_counter() values movement
+            key events were handled at, since the inputs were last
+            consumed by a physics step
+        _game_handlers: A dict mapping an event (type, key) to the method
+            that handles it during the game
+        _paused_handlers: A dict mapping an event (type, key) to the method
+            that handles it while the game is paused
+        _menu_handlers: A dict mapping an event (type, key) to the method
+            that handles it in the menu
+        _game_over_handlers: A dict mapping an event (type, key) to the
+            method that handles it on the game over screen
     """
 
     def __init__(self, view) -> None:
@@ -30,69 +72,239 @@ class Controller:
         self._view = view
         self._jumping = False
         self._left_right = 0.0
+        self._show_profile = False
+        self._paused = False
+        self._input_times = []
+        self._game_handlers = {
+            (pygame.KEYDOWN, pygame.K_LEFT): self._press_left,
+            (pygame.KEYDOWN, pygame.K_RIGHT): self._press_right,
+            (pygame.KEYDOWN, pygame.K_SPACE): self._press_jump,
+            (pygame.KEYDOWN, pygame.K_UP): self._press_jump,
+            (pygame.KEYDOWN, pygame.K_F3): self._toggle_profile,
+            (pygame.KEYDOWN, pygame.K_p): self._toggle_pause,
+            (pygame.KEYDOWN, pygame.K_ESCAPE): self._toggle_pause,
+            (pygame.KEYUP, pygame.K_LEFT): self._release_left,
+            (pygame.KEYUP, pygame.K_RIGHT): self._release_right,
+            (pygame.KEYUP, pygame.K_SPACE): self._release_jump,
+            (pygame.KEYUP, pygame.K_UP): self._release_jump,
+            (pygame.QUIT, None): self._quit,
+        }
+        # Keys released while paused still stop the player, so they do
+        # not keep moving after the game is unpaused
+        self._paused_handlers = {
+            (pygame.KEYDOWN, pygame.K_p): self._toggle_pause,
+            (pygame.KEYDOWN, pygame.K_ESCAPE): self._toggle_pause,
+            (pygame.KEYUP, pygame.K_LEFT): self._release_left,
+            (pygame.KEYUP, pygame.K_RIGHT): self._release_right,
+            (pygame.KEYUP, pygame.K_SPACE): self._release_jump,
+            (pygame.KEYUP, pygame.K_UP): self._release_jump,
+            (pygame.QUIT, None): self._quit,
+        }
+        self._menu_handlers = {
+            (pygame.MOUSEBUTTONDOWN, None): self._click_difficulty,
+            (pygame.QUIT, None): self._quit,
+        }
+        self._game_over_handlers = {(pygame.QUIT, None): self._quit}
+
+    @staticmethod
+    def _dispatch(handlers, events):
+        """
+        Runs the handler for each event that has one
+
+        Args:
+            handlers: A dict mapping an event (type, key) to a method
+                taking the event
+            events: An iterable of pygame events, or None to handle the
+                events in pygame's queue
+
+        Returns:
+            The first value other than None returned by a handler, or None
+        """
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
+            handler = handlers.get((event.type, getattr(event, "key", None)))
+            if handler is not None:
+                result = handler(event)
+                if result is not None:
+                    return result
+        return None
 
-    def update_menu(self):
+    def update_menu(self, events=None):
         """
         Updates what happens in menu based on player input
 
         Args:
-            none
+            events: An iterable of pygame events to handle, or None to
+                handle the events in pygame's queue. Defaults to None.
 
         Return:
             A float representing the difficulty of the game.
             A difficulty of 1 is the hardest
         """
-        for event in pygame.event.get():
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                position = event.pos
-                if self._view.easy_button.button_rect.collidepoint(position):
-                    return 0.5
-                if self._view.medium_button.button_rect.collidepoint(position):
-                    return 0.75
-                if self._view.hard_button.button_rect.collidepoint(position):
-                    return 1
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-        return 0
-
-    def update_game(self):
+        return self._dispatch(self._menu_handlers, events) or 0
+
+    def update_game(self, events=None):
         """
         Updates the actions of the player based player input
 
         Args:
-            none
+            events: An iterable of pygame events to handle, or None to
+                handle the events in pygame's queue. Defaults to None.
         """
-        for event in pygame.event.get():
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_LEFT:
-                    self._left_right = -0.5
-                if event.key == pygame.K_RIGHT:
-                    self._left_right = 0.5
-                if event.key in (pygame.K_SPACE, pygame.K_UP):
-                    self._jumping = True
-            elif event.type == pygame.KEYUP:
-                if event.key == pygame.K_LEFT and self._left_right == -0.5:
-                    self._left_right = 0.0
-                if event.key == pygame.K_RIGHT and self._left_right == 0.5:
-                    self._left_right = 0.0
-                if event.key in (pygame.K_SPACE, pygame.K_UP):
-                    self._jumping = False
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-    def update_game_over(self):
+        self._dispatch(self._game_handlers, events)
+
+    def update_paused(self, events=None):
+        """
+        Updates what happens while the game is paused
+
+        Args:
+            events: An iterable of pygame events to handle, or None to
+                handle the events in pygame's queue. Defaults to None.
+        """
+        self._dispatch(self._paused_handlers, events)
+
+    def update_game_over(self, events=None):
         """
         Updates the what happens in game over screen
 
+        Args:
+            events: An iterable of pygame events to handle, or None to
+                handle the events in pygame's queue. Defaults to None.
+        """
+        self._dispatch(self._game_over_handlers, events)
+
+    def consume_inputs(self):
+        """
+        Marks the current inputs as used by a physics step, returning how
+        long each movement key event waited for it. The wait is measured
+        from when the event was taken from pygame's queue.
+
         Args:
             none
+
+        Returns:
+            A list of floats representing the seconds between each
+            movement key event being handled and now
+        """
+        if not self._input_times:
+            return []
+        now = time.perf_counter()
+        latencies = [now - handled for handled in self._input_times]
+        self._input_times.clear()
+        return latencies
+
+    def _click_difficulty(self, event):
+        """
+        Picks a difficulty if a difficulty button was clicked
+
+        Args:
+            event: A pygame MOUSEBUTTONDOWN event
+
+        Returns:
+            A float representing the difficulty picked, or None if the
+            click missed every button
+        """
+        if self._view.easy_button.button_rect.collidepoint(event.pos):
+            return 0.5
+        if self._view.medium_button.button_rect.collidepoint(event.pos):
+            return 0.75
+        if self._view.hard_button.button_rect.collidepoint(event.pos):
+            return 1
+        return None
+
+    def _press_left(self, event):  # pylint: disable=unused-argument
+        """
+        Starts moving left
+
+        Args:
+            event: A pygame KEYDOWN event
+        """
+        self._left_right = -0.5
+        self._input_times.append(time.perf_counter())
+
+    def _press_right(self, event):  # pylint: disable=unused-argument
+        """
+        Starts moving right
+
+        Args:
+            event: A pygame KEYDOWN event
+        """
+        self._left_right = 0.5
+        self._input_times.append(time.perf_counter())
+
+    def _press_jump(self, event):  # pylint: disable=unused-argument
+        """
+        Starts jumping
+
+        Args:
+            event: A pygame KEYDOWN event
+        """
+        self._jumping = True
+        self._input_times.append(time.perf_counter())
+
+    def _release_left(self, event):  # pylint: disable=unused-argument
+        """
+        Stops moving left, unless the player has since pressed right
+
+        Args:
+            event: A pygame KEYUP event
+        """
+        if self._left_right == -0.5:
+            self._left_right = 0.0
+        self._input_times.append(time.perf_counter())
+
+    def _release_right(self, event):  # pylint: disable=unused-argument
+        """
+        Stops moving right, unless the player has since pressed left
+
+        Args:
+            event: A pygame KEYUP event
+        """
+        if self._left_right == 0.5:
+            self._left_right = 0.0
+        self._input_times.append(time.perf_counter())
+
+    def _release_jump(self, event):  # pylint: disable=unused-argument
+        """
+        Stops jumping
+
+        Args:
+            event: A pygame KEYUP event
+        """
+        self._jumping = False
+        self._input_times.append(time.perf_counter())
+
+    def _toggle_profile(self, event):  # pylint: disable=unused-argument
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        Shows or hides the frame timing overlay
+
+        Args:
+            event: A pygame KEYDOWN event
+        """
+        self._show_profile = not self._show_profile
+
+    def _toggle_pause(self, event):  # pylint: disable=unused-argument
+        """
+        Pauses or unpauses the game. Inputs waiting for a physics step are
+        dropped so time spent paused is not counted as input latency.
+
+        Args:
+            event: A pygame KEYDOWN event
+        """
+        self._paused = not self._paused
+        self._input_times.clear()
+
+    @staticmethod
+    def _quit(event):  # pylint: disable=unused-argument
+        """
+        Closes the game
+
+        Args:
+            event: A pygame QUIT event
+        """
+        pygame.quit()
+        sys.exit()
 
     @property
     def jumping(self):
@@ -121,3 +333,30 @@ class Controller:
             private attribute _left_right
         """
         return self._left_right
+
+    @property
+    def show_profile(self):
+        """
+        Allows the show_profile bool private attribute to be accessed
+
+        Args:
+            none
+
+        Returns:
+            If the frame timing overlay should be shown as a boolean,
+            private attribute _show_profile
+        """
+        return self._show_profile
+
+    @property
+    def paused(self):
+        """
+        Allows the paused bool private attribute to be accessed
+
+        Args:
+            none
+
+        Returns:
+            If the game is paused as a boolean, private attribute _paused
+        """
+        return self._paused
@@ -6,15 +6,35 @@ Note: This file cannot be tested as it mainly calls other functions
 and edits the visual display.
 """
 
+import random
+import time
 import pygame
+from assets import ASSETS, GAME_IMAGES, GAME_SOUNDS
 from view import View
-from model import Model
-from model import Platform
-from controller import Controller
+from controller import Controller, filter_events
+from memory import AllocationTracker
+from replay import InputRecorder
+from simulation import Simulation
+from timing import FrameProfiler
 
 WIDTH = 400
 HEIGHT = 450
 
+# How far above the top of the screen platforms are made, so the number
+# of platforms held depends on the screen and not on the difficulty
+LOOKAHEAD = HEIGHT
+
+# Most platforms made per physics step, and how far above the top of the
+# screen platforms are always made regardless
+GENERATION_BUDGET = 2
+MIN_LOOKAHEAD = 150
+
+# The screens the game moves between
+MENU = "menu"
+PLAYING = "playing"
+PAUSED = "paused"
+GAME_OVER = "game over"
+
 
 class Game:
     """
@@ -23,32 +43,94 @@ class Game:
     Attributes:
         _clock: A pygame Clock object representing how long the game
             has been running.
-        _fps: An int representing the frames per second
-        _timer: An int representing the time limit for the game.
+        _fps: An int representing the physics steps per second
+        _render_fps: An int representing the maximum frames drawn per
+            second, or 0 to draw as fast as possible
+        _max_steps_per_frame: An int representing the most physics steps
+            run before a frame is drawn when catching up
         _screen: A pygame display representing the game window.
-        _controller: An instance of the controller class.
+        _simulation: An instance of the Simulation class that steps the
+            model, scoring and time limit of the game.
         _model: An instance of the model class.
         _view: An instance of the view class.
         _controller: An instance of the controller class.
+        _profiler: A FrameProfiler that times each phase of a frame while
+            the timing overlay is shown.
+        _start_time: A float representing the time.perf_counter() value
+            the program started at, or None if not measuring startup
+        _startup_time: A float representing the seconds from the program
+            starting to the first menu frame, or None until it is shown
+        _seed: An int representing the seed platforms are generated with
+        _record_path: A string representing the file the session's inputs
+            are saved to when it ends, or None to not record them
+        _recorder: An InputRecorder of the session's inputs, or None if
+            they are not being recorded
+        _allocations: An AllocationTracker reporting where memory is
+            allocated during play, or None if allocations are not tracked
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        render_fps=60,
+        max_steps_per_frame=5,
+        start_time=None,
+        seed=None,
+        record_path=None,
+        track_allocations=False,
+    ) -> None:
         """
         Initializes game attributes.
 
         Args:
-            none
+            render_fps: An int representing the maximum frames drawn per
+                second, or 0 to draw as fast as possible. Physics always
+                runs at 60 steps per second. Defaults to 60.
+            max_steps_per_frame: An int representing the most physics
+                steps run before a frame is drawn. Defaults to 5.
+            start_time: A float representing the time.perf_counter()
+                value the program started at, used to measure how long
+                the menu took to appear. Defaults to None.
+            seed: An int used to seed platform generation, or None to
+                pick one at random. Defaults to None.
+            record_path: A string representing the file to save the
+                session's inputs to, so it can be replayed, or None to not
+                record them. Defaults to None.
+            track_allocations: A bool representing if the source lines
+                memory is allocated from should be traced during play and
+                printed every 600 frames. Slows the game down.
+                Defaults to False.
         """
+        self._start_time = start_time
+        self._startup_time = None
         self._clock = pygame.time.Clock()
         self._fps = 60
-        self._timer = 60 * self._fps
+        self._render_fps = render_fps
+        self._max_steps_per_frame = max_steps_per_frame
         self._screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        ground = Platform(surf=pygame.Surface((200, 20)), center=(200, 445))
-        platforms = pygame.sprite.Group()
-        platforms.add(ground)
-        self._model = Model(platforms, WIDTH, HEIGHT)
-        self._view = View(self._model)
+        filter_events()
+        # Everything but the menu loads in the background while the menu
+        # is showing
+        ASSETS.preload(GAME_IMAGES, GAME_SOUNDS)
+        # The seed is always known so a recording can reproduce the session
+        self._seed = random.randrange(2**32) if seed is None else seed
+        self._record_path = record_path
+        self._recorder = None
+        self._allocations = AllocationTracker() if track_allocations else None
+        self._simulation = Simulation(
+            WIDTH, HEIGHT, fps=self._fps, headless=False, seed=self._seed
+        )
+        self._model = self._simulation.model
+        # Platforms are worked out ahead on a background thread, so
+        # scrolling past several at once does not hold up a frame
+        self._model.set_background_generation(True)
+        self._model.set_lookahead(LOOKAHEAD)
+        # Refilling after a big scroll is spread over several steps, as
+        # long as platforms stay at least a jump above the screen
+        self._model.set_generation_budget(GENERATION_BUDGET, MIN_LOOKAHEAD)
+        self._view = View(self._model, dirty_rendering=True)
         self._controller = Controller(self._view)
+        self._profiler = FrameProfiler()
+        self._simulation.set_profiler(self._profiler)
 
     def camera(self):
         """
@@ -60,66 +142,203 @@ class Game:
         Returns:
             A bool representing if the camera needs to move or not
         """
-        if self._model.player.rect.top <= HEIGHT / 3:
-            new_position_y = self._model.player.position.y + abs(
-                self._model.player.velocity.y
-            )
-            self._model.player.set_position(
-                (self._model.player.position.x, new_position_y)
-            )
-            for plat in self._model.platforms:
-                plat.set_rect(
-                    plat.rect.x,
-                    plat.rect.y + abs(self._model.player.velocity.y),
-                )
-                if plat.rect.top >= HEIGHT:
-                    plat.kill()
-            return True
-        return False
+        return self._model.scroll()
+
+    def show_menu(self):
+        """
+        Draws one frame of the start menu, recording the startup time the
+        first time it is shown
+
+        Args:
+            none
+        """
+        self._view.draw_menu(self._screen)
+        pygame.display.update()
+        if self._startup_time is None and self._start_time is not None:
+            self._startup_time = time.perf_counter() - self._start_time
+
+    @property
+    def startup_time(self):
+        """
+        Allows private attribute _startup_time to be accessed
+
+        Args:
+            none
+
+        Returns:
+            A float representing the seconds from the program starting to
+            the first menu frame, or None if it has not been measured
+        """
+        return self._startup_time
 
     def start(self):
         """
-        Dictates the start of game play.
+        Dictates the start of game play. The game moves between the menu,
+        playing, paused and game over screens, each run by a method that
+        returns the next screen.
 
         Args:
             none
         """
-        # Handles the start menu
+        screens = {
+            MENU: self._run_menu,
+            PLAYING: self._run_playing,
+            PAUSED: self._run_paused,
+            GAME_OVER: self._run_game_over,
+        }
+        screen = MENU
+        while screen is not None:
+            screen = screens[screen]()
+
+    def _run_menu(self):
+        """
+        Shows the start menu until a difficulty is picked. The menu is only
+        drawn again when the window needs it.
+
+        Args:
+            none
+
+        Returns:
+            The next screen, PLAYING
+        """
+        self.show_menu()
         difficulty = 0
         while difficulty == 0:
-            difficulty = self._controller.update_menu()
-            self._view.draw_menu(self._screen)
-            pygame.display.update()
+            event = pygame.event.wait()
+            if event.type == pygame.WINDOWEXPOSED:
+                self.show_menu()
+            difficulty = self._controller.update_menu([event])
 
-        # Handles game screen
         self._model.set_difficulty(difficulty)
-        current_time = 0
-        can_increase_score = True
-        while not self._model.game_over and self._timer > 0:
-            if self.camera() and self._model.player.velocity.y < 0:
-                if can_increase_score:
-                    self._model.increase_score()
-                current_time = self._timer
-                can_increase_score = False
-            if current_time - self._timer > 1:
-                can_increase_score = True
-
-            self._model.platform_generation()
-            self._view.draw_game(self._screen)
-            self._view.draw_score(self._screen)
+        if self._record_path is not None:
+            self._recorder = InputRecorder(self._seed, difficulty)
+        if self._allocations is not None:
+            self._allocations.start()
+        return PLAYING
+
+    def _run_playing(self):
+        """
+        Runs the game until it is paused or over. Physics steps at a fixed
+        _fps steps per second of real time, however often frames are
+        drawn. Frames are drawn between the last two steps so motion stays
+        smooth. Each phase of the frame is timed while the F3 overlay is
+        shown.
+
+        Args:
+            none
+
+        Returns:
+            The next screen, PAUSED or GAME_OVER
+        """
+        # Time spent on other screens is not caught up on
+        step_time = 1 / self._fps
+        accumulator = 0.0
+        previous_time = time.perf_counter()
+        while not self._simulation.finished:
+            now = time.perf_counter()
+            accumulator += now - previous_time
+            previous_time = now
+            self._profiler.set_enabled(self._controller.show_profile)
+            self._profiler.start_frame()
+
             self._controller.update_game()
-            self._model.update(
-                self._controller.left_right, self._controller.jumping
-            )
-            self._model.check_player_off_screen()
-            self._clock.tick(self._fps)
-            self._timer -= 1
-            time = format(self._timer / self._fps, ".2f")
-            self._view.draw_timer(time, self._screen)
-            pygame.display.update()
-
-        # Handles end screen
+            if self._controller.paused:
+                return PAUSED
+            self._profiler.mark("events")
+            steps = 0
+            while (
+                accumulator >= step_time
+                and steps < self._max_steps_per_frame
+                and not self._simulation.finished
+            ):
+                if self._recorder is not None:
+                    self._recorder.record(
+                        self._controller.left_right, self._controller.jumping
+                    )
+                self._simulation.step(
+                    self._controller.left_right, self._controller.jumping
+                )
+                for latency in self._controller.consume_inputs():
+                    self._profiler.add_latency(latency)
+                accumulator -= step_time
+                steps += 1
+            if steps == self._max_steps_per_frame:
+                # Too far behind to catch up, so drop the backlog and let
+                # the game slow down rather than skip ahead
+                accumulator = min(accumulator, step_time)
+
+            self._draw_game(accumulator / step_time)
+            self._profiler.mark("draw")
+            pygame.display.update(self._view.dirty_rects())
+            self._profiler.mark("display")
+            self._profiler.end_frame()
+            if self._allocations is not None and self._allocations.end_frame():
+                print(self._allocations.format_report())
+            self._clock.tick(self._render_fps)
+
+        self._model.stop_generation()
+        if self._recorder is not None:
+            self._recorder.save(self._record_path)
+        return GAME_OVER
+
+    def _draw_game(self, alpha):
+        """
+        Draws the game screen and its HUD
+
+        Args:
+            alpha: A float from 0 to 1 representing how far between the
+                previous and current physics step to draw
+        """
+        self._view.draw_game(self._screen, alpha)
+        self._view.draw_score(self._screen)
+        time_left = format(self._simulation.time_left, ".2f")
+        self._view.draw_timer(time_left, self._screen)
+        self._view.draw_profile(
+            self._screen,
+            self._profiler.report if self._profiler.enabled else None,
+        )
+
+    def _run_paused(self):
+        """
+        Shows the pause screen over the game until it is unpaused, with
+        sounds paused
+
+        Args:
+            none
+
+        Returns:
+            The next screen, PLAYING
+        """
+        self._view.pause_sound(True)
+        self._view.draw_paused(self._screen)
+        pygame.display.update()
+        while self._controller.paused:
+            event = pygame.event.wait()
+            if event.type == pygame.WINDOWEXPOSED:
+                self._draw_game(1.0)
+                self._view.draw_paused(self._screen)
+                pygame.display.update()
+            self._controller.update_paused([event])
+        self._view.pause_sound(False)
+        return PLAYING
+
+    def _run_game_over(self):
+        """
+        Shows the game over screen until the window is closed. The screen
+        is only drawn again when the window needs it.
+
+        Args:
+            none
+
+        Returns:
+            Nothing, as the game closes from this screen
+        """
         self._view.draw_game_over(self._screen)
+        self._view.play_game_over_sound()
+        pygame.display.update()
         while True:
-            self._controller.update_game_over()
-            pygame.display.update()
+            event = pygame.event.wait()
+            if event.type == pygame.WINDOWEXPOSED:
+                self._view.draw_game_over(self._screen)
+                pygame.display.update()
+            self._controller.update_game_over([event])
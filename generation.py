@@ -0,0 +1,230 @@
+"""
+This module contains the platform generation math used by the Model, in a
+form that does not depend on pygame sprites. Landing points are sampled
+directly from the allowed intervals instead of a list of candidates, the
+jump envelope is cached per difficulty, and next_platform_rects places a
+new platform above each of many previous platforms in one vectorized call.
+"""
+
+import functools
+import math
+import numpy as np
+
+
+@functools.lru_cache(maxsize=None)
+def jump_envelope(difficulty, gravity, jump_velocity):
+    """
+    Calculates the maximum height of a jump and how long it takes to fall
+    from it. These only depend on the difficulty, so they are cached.
+
+    Args:
+        difficulty: float indicating the difficulty of the game
+            1 is hard, 0.75 is medium, 0.5 is easy
+        gravity: A float representing the downwards acceleration
+        jump_velocity: A float representing the y velocity of a jump
+
+    Returns:
+        A tuple of floats, max_y_height and fall_time
+    """
+    max_y_height = difficulty * (((-jump_velocity) ** 2) / (2 * gravity))
+    fall_time = math.sqrt(2 * max_y_height / gravity)
+    return max_y_height, fall_time
+
+
+def landing_intervals(max_left, max_right, difficulty):
+    """
+    Calculates the x values a platform can be generated at. These are the
+    values from max_left to max_right that are not in the middle band that
+    gets wider as the difficulty gets easier.
+
+    Args:
+        max_left: int that represents the maximum left x point that can be
+            reached
+        max_right: int that represents the maximum right x point that can
+            be reached
+        difficulty: float indicating the difficulty of the game
+
+    Returns:
+        A tuple of two (start, stop) tuples of ints. Each is a half open
+        interval of allowed x values and may be empty.
+    """
+    full_range = max_right - max_left
+    minimum_left_x = int(max_left + (full_range / 2) * (1 - difficulty)) + 1
+    minimum_right_x = int(max_right - (full_range / 2) * (1 - difficulty)) - 1
+    if minimum_left_x >= minimum_right_x:
+        return (max_left, max_right), (max_right, max_right)
+    left_stop = min(max(minimum_left_x, max_left), max_right)
+    right_start = max(min(minimum_right_x, max_right), left_stop)
+    return (max_left, left_stop), (right_start, max_right)
+
+
+def sample_x_landing(rng, max_left, max_right, difficulty):
+    """
+    Picks an x value uniformly from the landing intervals in constant time.
+
+    Args:
+        rng: The random module or a random.Random instance
+        max_left: int that represents the maximum left x point that can be
+            reached
+        max_right: int that represents the maximum right x point that can
+            be reached
+        difficulty: float indicating the difficulty of the game
+
+    Returns:
+        An int representing the x coord of the landing point
+
+    Raises:
+        IndexError: If there are no x values to choose from
+    """
+    (left_start, left_stop), (right_start, right_stop) = landing_intervals(
+        max_left, max_right, difficulty
+    )
+    left_count = max(left_stop - left_start, 0)
+    total = left_count + max(right_stop - right_start, 0)
+    if total <= 0:
+        raise IndexError("Cannot choose from an empty sequence")
+    # randrange draws from the same stream random.choice uses, so a seeded
+    # run picks the same landing points as a list of every candidate did
+    index = rng.randrange(total)
+    if index < left_count:
+        return left_start + index
+    return right_start + index - left_count
+
+
+def round_half_away(values):
+    """
+    Rounds values the same way pygame rounds floats assigned to a Rect
+
+    Args:
+        values: A NumPy array of floats
+
+    Returns:
+        A NumPy array of int64 rounded half away from zero
+    """
+    return (np.sign(values) * np.floor(np.abs(values) + 0.5)).astype(np.int64)
+
+
+def next_platform_rects(
+    rng, previous, difficulty, screen_width, player_width, physics
+):
+    """
+    Generates the next platform above each of K previous platforms, with
+    the same rules and distribution as Model.platform_generation.
+
+    Args:
+        rng: A numpy.random.Generator
+        previous: A (K, 4) array-like of the previous platforms' left, top,
+            width and height
+        difficulty: A float or (K,) array-like of floats with the
+            difficulty for each platform
+        screen_width: int representing the width of the display screen
+        player_width: int representing the width of the player hitbox
+        physics: A tuple of floats with the gravity and jump velocity
+
+    Returns:
+        A (K, 4) NumPy int64 array of the new platforms' left, top, width
+        and height
+    """
+    gravity, jump_velocity = physics
+    previous = np.asarray(previous, dtype=np.int64).reshape(-1, 4)
+    count = len(previous)
+    difficulty = np.broadcast_to(
+        np.asarray(difficulty, dtype=np.float64), (count,)
+    )
+    left = previous[:, 0]
+    right = left + previous[:, 2]
+    center_x = left + previous[:, 2] // 2
+    center_y = previous[:, 1] + previous[:, 3] // 2
+
+    # Jump envelope for each distinct difficulty
+    max_y_height = np.empty(count)
+    fall_time = np.empty(count)
+    for level in np.unique(difficulty):
+        rows = difficulty == level
+        max_y_height[rows], fall_time[rows] = jump_envelope(
+            float(level), gravity, jump_velocity
+        )
+
+    velocity_x_max = np.sqrt(2 * 0.5 * (right - left))
+    max_x_distance = np.trunc(velocity_x_max * fall_time) * difficulty
+    max_x_distance -= player_width * 1.5 * difficulty
+
+    width = rng.integers(50, 100, count, endpoint=True)
+    height = np.full(count, 15, dtype=np.int64)
+
+    max_left = np.trunc(left - max_x_distance).astype(np.int64)
+    max_right = np.trunc(right + max_x_distance).astype(np.int64)
+    quarter = (max_right - max_left) / 4
+    reach_max = (max_left + quarter, max_right - quarter)
+    max_left = np.maximum(max_left, 0)
+    max_right = np.minimum(max_right, screen_width)
+
+    # Landing point, uniform over the two allowed intervals
+    full_range = max_right - max_left
+    band = (full_range / 2) * (1 - difficulty)
+    minimum_left_x = np.trunc(max_left + band).astype(np.int64) + 1
+    minimum_right_x = np.trunc(max_right - band).astype(np.int64) - 1
+    no_band = minimum_left_x >= minimum_right_x
+    left_stop = np.where(
+        no_band,
+        max_right,
+        np.minimum(np.maximum(minimum_left_x, max_left), max_right),
+    )
+    right_start = np.where(
+        no_band,
+        max_right,
+        np.maximum(np.minimum(minimum_right_x, max_right), left_stop),
+    )
+    left_count = np.maximum(left_stop - max_left, 0)
+    total = left_count + np.maximum(max_right - right_start, 0)
+    index = rng.integers(0, total)
+    x_landing = np.where(
+        index < left_count,
+        max_left + index,
+        right_start + index - left_count,
+    )
+
+    # Center x, on the side of the previous platform the landing is on
+    half_width = np.ceil(width / 2).astype(np.int64)
+    new_center_x = np.where(
+        x_landing < center_x, x_landing + half_width, x_landing - half_width
+    )
+    new_center_x = np.where(
+        new_center_x - half_width < 0, half_width, new_center_x
+    )
+    new_center_x = np.where(
+        new_center_x + half_width > screen_width,
+        screen_width - half_width,
+        new_center_x,
+    )
+
+    # Center y, lowered when the landing is outside the max height range
+    full_height = (x_landing > reach_max[0]) | (x_landing < reach_max[1])
+    x_distance = np.where(
+        x_landing < reach_max[0],
+        reach_max[0] - x_landing,
+        x_landing - reach_max[1],
+    )
+    time = x_distance / velocity_x_max
+    max_y_reach = np.trunc(
+        np.where(
+            full_height,
+            max_y_height,
+            max_y_height - 0.5 * gravity * time**2,
+        )
+    ).astype(np.int64)
+    max_y_reach_point = center_y - max_y_reach
+    new_center_y = (
+        rng.integers(max_y_reach_point, max_y_reach_point + 1, endpoint=True)
+        + height / 2
+    )
+
+    return np.stack(
+        (
+            new_center_x - width // 2,
+            round_half_away(new_center_y) - height // 2,
+            width,
+            height,
+        ),
+        1,
+    )
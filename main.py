@@ -2,8 +2,45 @@
 This module executes the game class upon running.
 """
 
+import time
+
+# Taken before importing pygame so the startup time includes it
+START_TIME = time.perf_counter()
+
+# pylint: disable=wrong-import-position
+import argparse
 from game import Game
 
 if __name__ == "__main__":
-    game = Game()
-    game.start()
+    parser = argparse.ArgumentParser(description="Play Cosmic Ascension.")
+    parser.add_argument(
+        "--report-startup",
+        action="store_true",
+        help="print the time from starting to the first menu frame and quit",
+    )
+    parser.add_argument(
+        "--seed", type=int, help="seed used to generate the platforms"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="save the session's inputs to PATH to replay with replay.py",
+    )
+    parser.add_argument(
+        "--track-allocations",
+        action="store_true",
+        help="print where memory is allocated every 600 frames of play",
+    )
+    args = parser.parse_args()
+
+    game = Game(
+        start_time=START_TIME,
+        seed=args.seed,
+        record_path=args.record,
+        track_allocations=args.track_allocations,
+    )
+    if args.report_startup:
+        game.show_menu()
+        print(f"Startup time: {game.startup_time * 1000:.1f} ms")
+    else:
+        game.start()
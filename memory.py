@@ -0,0 +1,193 @@
+"""
+This module creates a class to track which source lines memory is
+allocated from as frames run, using tracemalloc, so memory that keeps
+growing in long sessions can be traced to the code responsible.
+"""
+
+import fnmatch
+import os
+import re
+import tracemalloc
+
+# Allocations made by the tracker, the modules it uses to filter snapshots
+# and the import system are not part of the game
+_IGNORED = (
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, fnmatch.__file__),
+    tracemalloc.Filter(False, os.path.join(os.path.dirname(re.__file__), "*")),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class AllocationTracker:
+    """
+    Compares snapshots of the memory held, by the source line that
+    allocated it, every so many frames. Memory allocated and freed again
+    between snapshots, like temporaries made during a frame, does not
+    show up; only memory still held does, which is what grows over a
+    long session.
+
+    Tracing slows everything down, so it is only turned on when asked
+    for.
+
+    Attributes:
+        _interval: An int representing the number of frames between
+            snapshots
+        _top: An int representing the number of source lines reported
+        _frames: An int representing the number of frames ended since the
+            last snapshot
+        _snapshot: The tracemalloc.Snapshot taken last, or None before
+            tracking starts
+        _traced: An int representing the bytes traced when the last
+            snapshot was taken
+        _traced_growth: An int representing how many bytes the traced
+            memory grew by between the last two snapshots
+        _report: A list of tuples of a "file:line" string, the bytes per
+            frame and the blocks per frame held memory changed by for the
+            source lines that changed most between the last two snapshots
+    """
+
+    def __init__(self, interval=600, top=10) -> None:
+        """
+        Initializes a tracker that has not started.
+
+        Args:
+            interval: An int representing the number of frames between
+                snapshots. Defaults to 600, 10 seconds at 60 frames per
+                second.
+            top: An int representing the number of source lines reported.
+                Defaults to 10.
+        """
+        self._interval = interval
+        self._top = top
+        self._frames = 0
+        self._snapshot = None
+        self._traced = 0
+        self._traced_growth = 0
+        self._report = []
+
+    def start(self):
+        """
+        Starts tracing allocations, if they are not being traced already,
+        and takes the first snapshot
+
+        Args:
+            none
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._frames = 0
+        self._snapshot = self._take_snapshot()
+
+    def stop(self):
+        """
+        Stops tracing allocations
+
+        Args:
+            none
+        """
+        tracemalloc.stop()
+        self._snapshot = None
+
+    def end_frame(self):
+        """
+        Counts a frame, comparing a new snapshot with the last one every
+        _interval frames
+
+        Args:
+            none
+
+        Returns:
+            A bool representing if the report was updated
+        """
+        if self._snapshot is None:
+            return False
+        self._frames += 1
+        if self._frames < self._interval:
+            return False
+        previous_traced = self._traced
+        snapshot = self._take_snapshot()
+        self._traced_growth = self._traced - previous_traced
+        self._report = [
+            (
+                f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                stat.size_diff / self._frames,
+                stat.count_diff / self._frames,
+            )
+            for stat in snapshot.compare_to(self._snapshot, "lineno")[
+                : self._top
+            ]
+            if stat.size_diff
+        ]
+        self._snapshot = snapshot
+        self._frames = 0
+        return True
+
+    def _take_snapshot(self):
+        """
+        Takes a snapshot of the memory held, leaving out allocations that
+        are not the game's
+
+        Args:
+            none
+
+        Returns:
+            A tracemalloc.Snapshot
+        """
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        self._traced = sum(
+            stat.size for stat in snapshot.statistics("filename")
+        )
+        return snapshot
+
+    def format_report(self):
+        """
+        Formats the report as a table
+
+        Args:
+            none
+
+        Returns:
+            A string with the traced memory growth and a line per source
+            line with its bytes and blocks per frame
+        """
+        lines = [
+            f"Held memory changed by {self._traced_growth:+d} B over "
+            f"{self._interval} frames, by line (B/frame, blocks/frame):"
+        ]
+        lines += [
+            f"{size:>+10.1f}{count:>+8.3f}  {location}"
+            for location, size, count in self._report
+        ]
+        return "\n".join(lines)
+
+    @property
+    def traced_growth(self):
+        """
+        Allows private attribute _traced_growth to be accessed
+
+        Args:
+            none
+
+        Returns:
+            An int representing how many bytes the traced memory grew by
+            between the last two snapshots
+        """
+        return self._traced_growth
+
+    @property
+    def report(self):
+        """
+        Allows private attribute _report to be accessed
+
+        Args:
+            none
+
+        Returns:
+            A list of tuples of a "file:line" string, the bytes per frame
+            and the blocks per frame held memory changed by
+        """
+        return self._report
@@ -6,16 +6,31 @@ user inputs. It acts as the Model section of MVC architecture.
 import random
 import math
 import pygame
+from assets import ASSETS
+from audio import SoundPool
+from chunks import PlatformChunkWorker, spec_rect
+from collision import PlatformIndex
+from generation import jump_envelope, sample_x_landing
+from physics import PhysicsState
+from platforms import PlatformPool
 
 
 VECTOR = pygame.math.Vector2
 
+# Height TestRocket.png is scaled to for a 35 pixel wide character. Used
+# to size the player hitbox when running headless without loading it.
+HEADLESS_CHARACTER_HEIGHT = 53
+
 
 class Model:
     """
     Class that acts as Model part of MVC architecture.
     Updates the data related to the game play.
 
+    The player and platforms are stored in world coordinates, which only
+    match the screen before the first scroll. Adding _camera_offset to a
+    world y coordinate gives its screen y coordinate.
+
     Attributes:
             _gravity: pygame.math.Vector2 that represents
                 the gravity in the game
@@ -26,8 +41,10 @@ class Model:
                 representing the player character
             _platform_num: An int representing the max
                 number of platforms generated at any given time
-            _platforms: pygame.sprite.Group() of platforms
-                in the game
+            _platforms: PlatformIndex of the platforms in the game,
+                sorted by height for collision checks
+            _platform_pool: PlatformPool that recycles platforms removed
+                from the game
             _game_difficulty: An int representing the difficulty
                 of the game. 1 is the max difficulty, 0.5 is the
                 game's easy mode, and 0.75 is the game's medium
@@ -37,33 +54,94 @@ class Model:
             _screen_height: int representing the height of the
                 display screen
             _game_over: a boolean representing if player is on game over screen
+            _camera_offset: A float representing how far the screen has
+                scrolled up since the start of the game
+            _previous_position: pygame.math.Vector2 of the player position
+                when save_previous_state was last called
+            _previous_camera_offset: A float of the camera offset when
+                save_previous_state was last called
             _jump_sound: wav file for the sound of the rockets when character
-                jumps
+                jumps, or None when running headless
+            _sound_pool: SoundPool that plays the jump sound, or None when
+                running headless
+            _random: random.Random instance used to generate platforms
+            _lookahead: An int representing how far above the top of the
+                screen platforms are generated, or None to keep
+                _platform_num platforms instead
+            _platform_stream: The generator from platform_stream, created
+                the first time platforms are generated
+            _latest_platform: The most recently generated Platform
+            _background_generation: A bool representing if platform
+                positions and sizes are computed ahead on a background
+                thread
+            _chunk_worker: The PlatformChunkWorker computing platforms
+                ahead, or None if there is not one running
+            _generation_budget: An int representing the most platforms
+                made by one call of platform_generation, or None for no
+                limit
+            _min_lookahead: An int representing how far above the top of
+                the screen platforms are always generated, even over the
+                budget
+            _generated: An int representing the number of platforms made
+                by the last call of platform_generation
     """
 
-    def __init__(self, platforms, width, height) -> None:
+    def __init__(
+        self, platforms, width, height, headless=False, seed=None
+    ) -> None:
         """
         Initializes the model.
 
         Args:
             platforms: pygame.sprite.Group() representing the
-                current platforms in the game
+                current platforms in the game. A PlatformIndex is used as
+                it is; the platforms in any other group are added to a
+                new PlatformIndex, which is the model's group from then
+                on.
             width: int representing the width of the display
                 screen
             height: int representing the height of the display
                 screen
+            headless: A bool representing if the model should skip loading
+                sounds and images so it can run without a display or mixer.
+                Defaults to False.
+            seed: An int used to seed platform generation so runs can be
+                reproduced, or None for a random seed. Defaults to None.
         """
         self._gravity = VECTOR(0, 0.35)
         self._friction = 0.12
-        self._player = Player(self._gravity, self._friction)
+        self._player = Player(self._gravity, self._friction, headless)
         self._platform_num = 30
-        self._platforms = platforms
+        if isinstance(platforms, PlatformIndex):
+            self._platforms = platforms
+        else:
+            self._platforms = PlatformIndex()
+            if platforms:
+                self._platforms.add(*platforms)
+        self._platform_pool = PlatformPool()
         self._game_difficulty = 0.5
         self._score = 0
         self._screen_width = width
         self._screen_height = height
         self._game_over = False
-        self._jump_sound = pygame.mixer.Sound("sounds/rocketbrrrnoises.wav")
+        self._camera_offset = 0.0
+        self._previous_position = self._player.position
+        self._previous_camera_offset = 0.0
+        self._random = random.Random(seed)
+        self._lookahead = None
+        self._platform_stream = None
+        self._latest_platform = None
+        self._background_generation = False
+        self._chunk_worker = None
+        self._generation_budget = None
+        self._min_lookahead = 0
+        self._generated = 0
+        if headless:
+            self._jump_sound = None
+            self._sound_pool = None
+        else:
+            self._jump_sound = ASSETS.sound("sounds/rocketbrrrnoises.wav")
+            self._sound_pool = SoundPool()
 
     def update(self, x_acceleration, jumping):
         """
@@ -77,35 +155,24 @@ class Model:
                 or not.
         """
         # Set the player x acceleration and move character based on it
-        self._player.move(x_acceleration)
+        player = self._player
+        player.move(x_acceleration)
 
-        # Check if the player is touching any platform
-        hits = pygame.sprite.spritecollide(self._player, self._platforms, False)
+        # Find the platform closest to the player's feet, only checking
+        # platforms level with the player
+        hit = self._platforms.nearest_contact(player.rect)
 
         # If player is not moving upwards and touching a platform
-        if self._player.velocity.y >= 0 and hits:
+        if player.state.vy >= 0 and hit is not None:
             # If bottom of player is above the bottom of the platform
-            if (self._player.rect.bottom) < hits[0].rect.bottom:
-                # Then set the velocity y velocity of the player to 0
-                # and put its y position to on top of the platform
-                self._player.set_velocity(VECTOR(self._player.velocity.x, 0))
-                self._player.set_position(
-                    VECTOR(
-                        self._player.position.x,
-                        hits[0].rect.top - self._player.rect.height / 2,
-                    )
-                )
-                # If the player is holding down the space bar, override the
-                # previous y velocity setting and change it to jump velocity
-                if jumping:
-                    self._player.set_velocity(
-                        VECTOR(
-                            self._player.velocity.x, self._player.jump_velocity
-                        )
-                    )
-                    self._jump_sound.play()
+            if player.rect.bottom < hit.rect.bottom:
+                # Then stop the player on top of the platform, or jump
+                # straight off it if they are holding down the space bar
+                player.land(hit.rect.top, jumping)
+                if jumping and self._sound_pool is not None:
+                    self._sound_pool.play(self._jump_sound)
         # Update the player's rect
-        self._player.update()
+        player.update()
 
     def check_player_off_screen(self):
         """
@@ -115,104 +182,263 @@ class Model:
         Args:
             none
         """
-        if (
-            self._player.position.x < 0
-            or self._player.position.x > self._screen_width
-        ):
+        state = self._player.state
+        if state.x < 0 or state.x > self._screen_width:
             self._game_over = True
-        if self._player.position.y > self._screen_height:
+        screen_y = state.y + self._camera_offset
+        if screen_y > self._screen_height:
             self._game_over = True
 
+    def scroll(self):
+        """
+        Scrolls the screen up to follow the player when they climb into
+        the top third of the screen. Platforms that scroll off the bottom
+        of the screen are removed.
+
+        Args:
+            none
+
+        Returns:
+            A bool representing if the screen scrolled or not
+        """
+        screen_top = self._player.rect.top + self._camera_offset
+        if screen_top > self._screen_height / 3:
+            return False
+        self._camera_offset += abs(self._player.state.vy)
+        for plat in self._platforms.below(
+            self._screen_height - self._camera_offset
+        ):
+            self._platform_pool.release(plat)
+        return True
+
     def platform_generation(self):
         """
-        Controls generation of platforms during game play
+        Controls generation of platforms during game play. Platforms are
+        taken from the platform stream until there are _platform_num of
+        them, or until the highest one is at least _lookahead above the
+        top of the screen if a lookahead is set.
+
+        With a generation budget, at most that many platforms are made per
+        call and the rest are left for later calls, unless the highest
+        platform is less than _min_lookahead above the top of the screen.
+
+        Args:
+            none
+        """
+        if self._platform_stream is None:
+            self._platform_stream = self.platform_stream()
+        budget = self._generation_budget
+        made = 0
+        while self._needs_platform():
+            if (
+                budget is not None
+                and made >= budget
+                and self._highest_platform_top() < -self._min_lookahead
+            ):
+                break
+            platform = next(self._platform_stream)
+            self._platforms.add(platform)
+            made += 1
+        self._generated = made
+
+    def platform_stream(self):
+        """
+        Lazily generates platforms, each one placed above the one before
+        it starting from the latest platform in the game. Platforms are
+        not added to the game, so they are only made as they are needed.
+
+        Args:
+            none
+
+        Yields:
+            A new Platform instance reachable from the previous one
+        """
+        previous_rect = self._platforms.sprites()[-1].rect
+        if self._background_generation:
+            self._chunk_worker = PlatformChunkWorker(
+                self.platform_spec, previous_rect
+            )
+            specs = self._chunk_worker.specs()
+        else:
+            specs = self._platform_specs(previous_rect.copy())
+        for size, center in specs:
+            self._latest_platform = self._platform_pool.acquire(size, center)
+            yield self._latest_platform
+
+    def _platform_specs(self, previous_rect):
+        """
+        Computes platform specs in order on the calling thread
+
+        Args:
+            previous_rect: A pygame.Rect of the platform the first spec is
+                placed above
+
+        Yields:
+            A tuple of the (width, height) and center of a platform
+        """
+        while True:
+            spec = self.platform_spec(previous_rect)
+            yield spec
+            previous_rect = spec_rect(spec)
+
+    def set_background_generation(self, enabled):
+        """
+        Sets if platform positions and sizes are computed ahead on a
+        background thread. Must be set before any platforms are generated,
+        and the difficulty must not change after they start being
+        generated.
+
+        Args:
+            enabled: A bool representing if a background thread is used
+        """
+        self._background_generation = enabled
+
+    def stop_generation(self):
+        """
+        Stops the background thread computing platforms, if there is one.
+        Platforms generated afterwards are computed on the calling thread,
+        carrying on the same sequence.
+
+        Args:
+            none
+        """
+        if self._chunk_worker is not None:
+            self._chunk_worker.stop()
+            self._chunk_worker = None
+
+    def _needs_platform(self):
+        """
+        Checks if more platforms are needed above the screen
 
         Args:
             none
 
+        Returns:
+            A bool representing if another platform should be generated
+        """
+        if self._lookahead is None:
+            return len(self._platforms) < self._platform_num
+        return self._highest_platform_top() > -self._lookahead
+
+    def _highest_platform_top(self):
+        """
+        Finds the screen y of the top of the most recently generated
+        platform, which is the highest one
+
+        Args:
+            none
+
+        Returns:
+            A float representing the screen y of the platform's top,
+            negative when it is above the top of the screen
+        """
+        latest_platform = self._latest_platform
+        if latest_platform is None:
+            latest_platform = self._platforms.sprites()[-1]
+        return latest_platform.rect.top + self._camera_offset
+
+    def generate_platform(self, previous_platform):
+        """
+        Generates a platform the player can reach from a previous platform
+
+        Args:
+            previous_platform: The Platform instance the player jumps from
+
+        Returns:
+            A new Platform instance
+        """
+        size, center = self.platform_spec(previous_platform.rect)
+        return self._platform_pool.acquire(size, center)
+
+    def platform_spec(self, previous_rect):
+        """
+        Works out the size and position of a platform the player can reach
+        from a previous platform. Only reads the model's settings, so it
+        can run on a background thread.
+
+        Args:
+            previous_rect: A pygame.Rect of the platform the player jumps
+                from
+
+        Returns:
+            A tuple of a (width, height) tuple and the center of the new
+            platform
+
         Note:
             The calculation for the platform distances are based off
             physics kinematics equations.
         """
-        while len(self._platforms) < self._platform_num:
-            # Get previous platform dimensions
-            latest_platform = len(self._platforms) - 1
-            previous_platform = self._platforms.sprites()[latest_platform]
-            left = previous_platform.rect.left
-            right = previous_platform.rect.right
-            center = previous_platform.rect.center
-
-            # Calculate the maximum x velocity the player can reach based
-            # on how long the previous platform is
-            velocity_x_max = math.sqrt(2 * 0.5 * (right - left))
-
-            # Calculate maximum height player can reach
-            max_y_height = self._game_difficulty * (
-                ((-self._player.jump_velocity) ** 2) / (2 * self._gravity.y)
-            )
-
-            # Calculate how long it takes to fall from this height
-            fall_time = math.sqrt(2 * max_y_height / self._gravity.y)
+        # Get previous platform dimensions
+        left = previous_rect.left
+        right = previous_rect.right
+        center = previous_rect.center
+
+        # Calculate the maximum x velocity the player can reach based
+        # on how long the previous platform is
+        velocity_x_max = math.sqrt(2 * 0.5 * (right - left))
+
+        # Maximum height player can reach and how long it takes to
+        # fall from this height. Cached as they only depend on the
+        # difficulty
+        max_y_height, fall_time = jump_envelope(
+            self._game_difficulty,
+            self._gravity.y,
+            self._player.jump_velocity,
+        )
 
-            # Calculate how far player can move in that time
-            max_x_distance = int(velocity_x_max * fall_time)
+        # Calculate how far player can move in that time
+        max_x_distance = int(velocity_x_max * fall_time)
 
-            # Accounting for difficulty level
-            max_x_distance = max_x_distance * self._game_difficulty
+        # Accounting for difficulty level
+        max_x_distance = max_x_distance * self._game_difficulty
 
-            # Accounting for take off and landing of player. Gives
-            # more leeway at higher difficult to account for reaction
-            # time. Can't expect player to make perfect jump to
-            # maximize height and distance every time
-            max_x_distance -= (
-                self._player.rect.width * 1.5 * self._game_difficulty
-            )
+        # Accounting for take off and landing of player. Gives
+        # more leeway at higher difficult to account for reaction
+        # time. Can't expect player to make perfect jump to
+        # maximize height and distance every time
+        max_x_distance -= self._player.rect.width * 1.5 * self._game_difficulty
 
-            # Generate new platform dimensions
-            surf = pygame.Surface((random.randint(50, 100), 15))
-            new_platform_width = surf.get_width()
-            new_platform_height = surf.get_height()
+        # Generate new platform dimensions
+        new_platform_width = self._random.randint(50, 100)
+        new_platform_height = 15
 
-            # Calculate maximum reachable range
-            max_left = int(left - max_x_distance)
-            max_right = int(right + max_x_distance)
+        # Calculate maximum reachable range
+        max_left = int(left - max_x_distance)
+        max_right = int(right + max_x_distance)
 
-            # Calculating range where player can reach max height
-            left_reach_max, right_reach_max = (
-                self.calculate_range_player_reach_max_height(
-                    max_left, max_right
-                )
-            )
+        # Calculating range where player can reach max height
+        left_reach_max, right_reach_max = (
+            self.calculate_range_player_reach_max_height(max_left, max_right)
+        )
 
-            # Calculating range of x that player can reach and are still on
-            # screen
-            if max_left < 0:
-                max_left = 0
-            if max_right > self._screen_width:
-                max_right = self._screen_width
+        # Calculating range of x that player can reach and are still on
+        # screen
+        if max_left < 0:
+            max_left = 0
+        if max_right > self._screen_width:
+            max_right = self._screen_width
 
-            # Calculate landing x value
-            x_landing = self.calculate_x_landing(max_left, max_right)
+        # Calculate landing x value
+        x_landing = self.calculate_x_landing(max_left, max_right)
 
-            # Calculate x of center of new platform
-            new_platform_center_x = self.calculate_platform_center_x(
-                x_landing, new_platform_width, center
-            )
+        # Calculate x of center of new platform
+        new_platform_center_x = self.calculate_platform_center_x(
+            x_landing, new_platform_width, center
+        )
 
-            # Calculate y of center of new platform
-            new_platform_center_y = self.calculate_platform_center_y(
-                (left_reach_max, right_reach_max),
-                x_landing,
-                max_y_height,
-                center,
-                velocity_x_max,
-                new_platform_height,
-            )
+        # Calculate y of center of new platform
+        new_platform_center_y = self.calculate_platform_center_y(
+            (left_reach_max, right_reach_max),
+            x_landing,
+            max_y_height,
+            center,
+            velocity_x_max,
+            new_platform_height,
+        )
 
-            # Calculate center of new platform
-            center_platform = (new_platform_center_x, new_platform_center_y)
-            platform = Platform(surf, center_platform)
-            self._platforms.add(platform)
+        # Calculate center of new platform
+        center_platform = (new_platform_center_x, new_platform_center_y)
+        return (new_platform_width, new_platform_height), center_platform
 
     def calculate_range_player_reach_max_height(self, max_left, max_right):
         """
@@ -257,23 +483,10 @@ class Model:
                 platform
         """
         # Account for difficulty. Harder difficulties will have the
-        # minimum increased
-        full_range = max_right - max_left
-        minimum_left_x = (
-            int(max_left + (full_range / 2) * (1 - self._game_difficulty)) + 1
-        )
-        minimum_right_x = (
-            int(max_right - (full_range / 2) * (1 - self._game_difficulty)) - 1
+        # minimum increased, so the middle of the range is excluded
+        return sample_x_landing(
+            self._random, max_left, max_right, self._game_difficulty
         )
-        # Calculate landing x value
-        x_landing = random.choice(
-            [
-                i
-                for i in range(max_left, max_right)
-                if i not in range(minimum_left_x, minimum_right_x)
-            ]
-        )
-        return x_landing
 
     def calculate_platform_center_x(
         self, x_landing, new_platform_width, center
@@ -358,11 +571,82 @@ class Model:
         minimum_y = center[1] - max_y_reach + 1
 
         new_platform_center_y = (
-            random.randint(max_y_reach_point, minimum_y)
+            self._random.randint(max_y_reach_point, minimum_y)
             + new_platform_height / 2
         )
         return new_platform_center_y
 
+    def save_previous_state(self):
+        """
+        Remembers the player position and camera offset, so frames drawn
+        between two physics steps can be interpolated
+
+        Args:
+            none
+        """
+        state = self._player.state
+        self._previous_position.update(state.x, state.y)
+        self._previous_camera_offset = self._camera_offset
+
+    def interpolate(self, alpha):
+        """
+        Blends the saved state with the current state
+
+        Args:
+            alpha: A float from 0 to 1 representing how far between the
+                saved state and the current state to blend
+
+        Returns:
+            A tuple of the blended player position as a
+            pygame.math.Vector2 and the blended camera offset as a float
+        """
+        if alpha >= 1:
+            return self._player.position, self._camera_offset
+        position = self._previous_position.lerp(self._player.position, alpha)
+        camera_offset = self._previous_camera_offset + alpha * (
+            self._camera_offset - self._previous_camera_offset
+        )
+        return position, camera_offset
+
+    def platforms_overlapping(self, rect):
+        """
+        Finds the platforms that overlap an area, only checking platforms
+        level with it
+
+        Args:
+            rect: A pygame.Rect in world coordinates
+
+        Returns:
+            A list of the Platform instances overlapping the rect
+        """
+        return self._platforms.query(rect)
+
+    def set_lookahead(self, lookahead):
+        """
+        Sets how far above the top of the screen platforms are generated
+
+        Args:
+            lookahead: An int representing the distance in pixels, or None
+                to keep _platform_num platforms instead
+        """
+        self._lookahead = lookahead
+
+    def set_generation_budget(self, budget, min_lookahead=0):
+        """
+        Limits how many platforms are made per call of
+        platform_generation, so refilling is spread over several frames
+
+        Args:
+            budget: An int representing the most platforms made per call,
+                or None for no limit
+            min_lookahead: An int representing how far above the top of
+                the screen platforms are always generated, even over the
+                budget, so the player never reaches the top of the
+                generated platforms. Defaults to 0.
+        """
+        self._generation_budget = budget
+        self._min_lookahead = min_lookahead
+
     def set_difficulty(self, difficulty):
         """
         Sets the difficulty of the game
@@ -382,6 +666,20 @@ class Model:
         """
         self._score += 1
 
+    @property
+    def generated(self):
+        """
+        Allows private attribute _generated to be accessed
+
+        Args:
+            none
+
+        Returns:
+            An int representing the number of platforms made by the last
+            call of platform_generation
+        """
+        return self._generated
+
     @property
     def player(self):
         """
@@ -409,97 +707,57 @@ class Model:
         return self._platforms
 
     @property
-    def score(self):
+    def camera_offset(self):
         """
-        Allows private attribute score to be accessed
+        Allows private attribute _camera_offset to be accessed
 
         Args:
             none
 
         Returns:
-            The score attribute
+            A float representing how far the screen has scrolled up, which
+            is added to world y coordinates to get screen y coordinates
         """
-        return self._score
+        return self._camera_offset
 
     @property
-    def game_over(self):
+    def altitude(self):
         """
-        Allows private attribute _game_over to be accessed
+        Returns how high the player has climbed from the starting screen
 
         Args:
             none
 
-        Return:
-            A boolean representing if game is over
-        """
-        return self._game_over
-
-
-class Platform(pygame.sprite.Sprite):
-    """
-    Creates a platform for a sprite to interact with.
-
-    Attributes:
-        _surf: A pygame.Surface() object that represents the surface of the
-            platform
-        _rect: A pygame.Rect() object that represents the rect of the
-            platform
-        _color: A tuple representing the RGB color of the platform
-    """
-
-    def __init__(self, surf, center, color=(128, 128, 128)) -> None:
-        """
-        Initializes the platforms.
-
-        Args:
-            surf: A surface representing platforms
-            center: A tuple representing the center of the platform location
-            color: A tuple representing the platform RGB color code. Defaults to
-                (128, 128, 128).
-        """
-        super().__init__()
-        self._surf = surf
-        self._color = color
-        self._surf.fill(color)
-        self._center = center
-        self._rect = self._surf.get_rect(center=center)
-
-    def set_rect(self, x_pos, y_pos):
-        """
-        Sets the rect of the platform.
-
-        Args:
-            x_pos: An int representing the x location of the platform sprite.
-            y_pos: An int representing the y location of the platform sprite.
+        Returns:
+            A float representing the scrolled distance in pixels
         """
-        self._rect.x = x_pos
-        self._rect.y = y_pos
+        return self._camera_offset
 
     @property
-    def rect(self):
+    def score(self):
         """
-        Allows private attribute _rect to be accessed
+        Allows private attribute score to be accessed
 
         Args:
             none
 
         Returns:
-            The rectangle attribute of the model.
+            The score attribute
         """
-        return self._rect
+        return self._score
 
     @property
-    def surf(self):
+    def game_over(self):
         """
-        Allows private attribute _Surf to be accessed
+        Allows private attribute _game_over to be accessed
 
         Args:
             none
 
-        Returns:
-            The surface attribute of the model.
+        Return:
+            A boolean representing if game is over
         """
-        return self._surf
+        return self._game_over
 
 
 class Player:
@@ -508,60 +766,58 @@ class Player:
     character sprite.
 
     Attributes:
-        _gravity: A pygame.math.Vector2() that stores the gravity of
-             the game
+        _gravity: A float that stores the downwards acceleration of the
+            game
         _friction: An int representing the value friction associated
             with the characters interactions with objects in game
         _jump_velocity: An int representing the jump velocity of
             the player
-        _acceleration: A pygame.math.Vector2() representing the
-            acceleration acting on the character in any direction.
-        _velocity: A pygame.math.Vector2() representing the current
-            velocity of the character
-        _position: A pygame.math.Vector2() representing the position
-            of the character in the game
+        _state: A PhysicsState holding the position, velocity and
+            acceleration of the character
         _image: A pygame.Surface() object that represents the default
             surface size of the player
         _rect: A pygame.Rect() object that represents the player sprite
             hitbox
     """
 
-    def __init__(self, gravity, friction) -> None:
+    def __init__(self, gravity, friction, headless=False) -> None:
         """
         Initializes the character.
 
         Args:
             gravity: A pygame.math.Vector2() that stores the gravity of
-                the game
+                the game. Only its y value is used, and it is copied so
+                the player never changes it.
             friction: A float representing the friction between character
                 and platforms
+            headless: A bool representing if the sprite image should be
+                replaced by a blank surface of the same size instead of
+                being loaded from disk. Defaults to False.
         """
-        self._gravity = gravity
+        self._gravity = float(gravity[1])
         self._friction = friction
         self._jump_velocity = -10
-        self._acceleration = VECTOR(0, 0)
-        self._velocity = VECTOR(0, 0)
-        self._position = VECTOR(200, 310)
+        self._state = PhysicsState(200, 310)
         self._character_width = 35
-        self._image = pygame.image.load("sprites/TestRocket.png")
-        self._image = pygame.transform.scale(
-            self._image,
-            (
-                self._character_width,
-                self._character_width
-                * (self._image.get_height() / self._image.get_width()),
-            ),
-        )
-        self._rect = self._image.get_rect(center=self._position)
+        if headless:
+            self._image = pygame.Surface(
+                (self._character_width, HEADLESS_CHARACTER_HEIGHT)
+            )
+        else:
+            self._image = ASSETS.image(
+                "sprites/TestRocket.png", self._character_width
+            )
+        self._rect = self._image.get_rect(center=(200, 310))
 
     def update(self):
         """
-        Updates the character rect based on position
+        Moves the character rect to the current position
 
         Args:
             none
         """
-        self._rect = self._image.get_rect(center=self._position)
+        state = self._state
+        self._rect.center = (state.x, state.y)
 
     def set_position(self, position):
         """
@@ -571,7 +827,8 @@ class Player:
             position: A tuple representing the x and y location
                 of the character sprite.
         """
-        self._position = position
+        self._state.x = float(position[0])
+        self._state.y = float(position[1])
 
     def set_velocity(self, velocity):
         """
@@ -581,7 +838,8 @@ class Player:
             velocity: A tuple representing the velocity
                 in each direction for the sprite.
         """
-        self._velocity = velocity
+        self._state.vx = float(velocity[0])
+        self._state.vy = float(velocity[1])
 
     def move(self, x_acceleration):
         """
@@ -591,16 +849,26 @@ class Player:
             x_acceleration: A float representing horizontal
                 acceleration of the character.
         """
-        self._acceleration = self._gravity
-        self._acceleration.x = x_acceleration
-        self._acceleration.x -= self._velocity.x * 0.12
-        self._velocity.x += self._acceleration.x
+        state = self._state
+        gravity = self._gravity
+        state.ax = x_acceleration - state.vx * self._friction
+        state.vx += state.ax
+        state.vy += gravity
+        state.x += state.vx + 0.5 * state.ax
+        state.y += state.vy + 0.5 * gravity
 
-        self._velocity.y += self._acceleration.y
-        self._position += self._velocity + 0.5 * self._acceleration
+    def land(self, top, jumping):
+        """
+        Stands the player on a platform, jumping off it straight away if
+        the player is jumping.
 
-        if self._acceleration.x < 0.1 or self._acceleration.x > -0.1:
-            self._acceleration.x = 0
+        Args:
+            top: An int representing the y position of the platform's top
+            jumping: A bool representing if the character is jumping
+        """
+        state = self._state
+        state.y = top - self._rect.height / 2
+        state.vy = float(self._jump_velocity) if jumping else 0.0
 
     @property
     def jump_velocity(self):
@@ -620,41 +888,57 @@ class Player:
     @property
     def acceleration(self):
         """
-        Allows the acceleration of player to be accessed
+        Returns the acceleration of the player's last step
 
         Args:
             none
 
         Returns:
-            _acceleration of player in form of float
+            A new pygame.math.Vector2() of the x and y acceleration
         """
-        return self._acceleration
+        return VECTOR(self._state.ax, self._gravity)
 
     @property
     def velocity(self):
         """
-        Allows the velocity of player to be accessed
+        Returns the velocity of the player
 
         Args:
             none
 
-        Returns
-            _velocity of player in form of float
+        Returns:
+            A new pygame.math.Vector2() of the x and y velocity. Changing
+            it does not change the player.
         """
-        return self._velocity
+        return VECTOR(self._state.vx, self._state.vy)
 
     @property
     def position(self):
         """
-        Allows the position of the player to be accessed
+        Returns the position of the player
+
+        Args:
+            none
+
+        Returns:
+            A new pygame.math.Vector2() of the x and y position. Changing
+            it does not change the player.
+        """
+        return VECTOR(self._state.x, self._state.y)
+
+    @property
+    def state(self):
+        """
+        Allows private attribute _state to be accessed, for code that
+        runs every step and should not create vectors
 
         Args:
             none
 
         Returns:
-            The _position attribute of the model.
+            The PhysicsState of the player, changed in place as it moves
         """
-        return self._position
+        return self._state
 
     @property
     def image(self):
@@ -0,0 +1,36 @@
+"""
+This module creates the state the player's physics is stepped on, held
+as plain floats so a step creates no pygame.math.Vector2 temporaries.
+"""
+
+
+class PhysicsState:
+    """
+    The player's motion as plain floats, updated in place every step so
+    moving the player creates no Vector2 temporaries.
+
+    Attributes:
+        x: A float representing the x position of the player's center
+        y: A float representing the y position of the player's center
+        vx: A float representing the x velocity
+        vy: A float representing the y velocity
+        ax: A float representing the x acceleration of the last step
+    """
+
+    __slots__ = ("x", "y", "vx", "vy", "ax")
+
+    def __init__(self, x=0.0, y=0.0, vx=0.0, vy=0.0) -> None:
+        """
+        Initializes the state at rest.
+
+        Args:
+            x: A float representing the x position. Defaults to 0.0.
+            y: A float representing the y position. Defaults to 0.0.
+            vx: A float representing the x velocity. Defaults to 0.0.
+            vy: A float representing the y velocity. Defaults to 0.0.
+        """
+        self.x = float(x)
+        self.y = float(y)
+        self.vx = float(vx)
+        self.vy = float(vy)
+        self.ax = 0.0
@@ -0,0 +1,172 @@
+"""
+This module creates the platforms the player jumps between and a pool
+that recycles them, so generating platforms does not keep creating new
+sprites and surfaces.
+"""
+
+import pygame
+
+
+class Platform(pygame.sprite.Sprite):
+    """
+    Creates a platform for a sprite to interact with.
+
+    Attributes:
+        _surf: A pygame.Surface() object that represents the surface of the
+            platform
+        _rect: A pygame.Rect() object that represents the rect of the
+            platform
+        _color: A tuple representing the RGB color of the platform
+    """
+
+    def __init__(self, surf, center, color=(128, 128, 128)) -> None:
+        """
+        Initializes the platforms.
+
+        Args:
+            surf: A surface representing platforms
+            center: A tuple representing the center of the platform location
+            color: A tuple representing the platform RGB color code. Defaults to
+                (128, 128, 128).
+        """
+        super().__init__()
+        self._surf = surf
+        self._color = color
+        self._surf.fill(color)
+        self._center = center
+        self._rect = self._surf.get_rect(center=center)
+
+    def set_rect(self, x_pos, y_pos):
+        """
+        Sets the rect of the platform.
+
+        Args:
+            x_pos: An int representing the x location of the platform sprite.
+            y_pos: An int representing the y location of the platform sprite.
+        """
+        self._rect.x = x_pos
+        self._rect.y = y_pos
+
+    def reset(self, surf, center):
+        """
+        Reuses the platform at a new location with a new surface. The
+        surface is expected to already be filled.
+
+        Args:
+            surf: A surface representing platforms
+            center: A tuple representing the center of the platform location
+        """
+        self._surf = surf
+        self._center = center
+        self._rect.size = surf.get_size()
+        self._rect.center = center
+
+    @property
+    def rect(self):
+        """
+        Allows private attribute _rect to be accessed
+
+        Args:
+            none
+
+        Returns:
+            The rectangle attribute of the model.
+        """
+        return self._rect
+
+    @property
+    def surf(self):
+        """
+        Allows private attribute _Surf to be accessed
+
+        Args:
+            none
+
+        Returns:
+            The surface attribute of the model.
+        """
+        return self._surf
+
+
+class PlatformPool:
+    """
+    Recycles Platform instances that have left the game and shares one
+    filled surface between all platforms of the same size, so generating
+    platforms in steady state creates no new surfaces or sprites.
+
+    Attributes:
+        _color: A tuple representing the RGB color of the platforms
+        _surfaces: A dict mapping a (width, height) tuple to the shared
+            surface for platforms of that size
+        _free: A list of Platform instances that can be reused
+    """
+
+    def __init__(self, color=(128, 128, 128)) -> None:
+        """
+        Initializes an empty pool.
+
+        Args:
+            color: A tuple representing the platform RGB color code.
+                Defaults to (128, 128, 128).
+        """
+        self._color = color
+        self._surfaces = {}
+        self._free = []
+
+    def surface(self, size):
+        """
+        Returns the shared surface for a platform size, creating and
+        filling it the first time the size is used
+
+        Args:
+            size: A tuple of ints representing the width and height
+
+        Returns:
+            A filled pygame.Surface() of the given size
+        """
+        surf = self._surfaces.get(size)
+        if surf is None:
+            surf = pygame.Surface(size)
+            surf.fill(self._color)
+            self._surfaces[size] = surf
+        return surf
+
+    def acquire(self, size, center):
+        """
+        Returns a platform of a given size and location, reusing a
+        released platform if there is one
+
+        Args:
+            size: A tuple of ints representing the width and height
+            center: A tuple representing the center of the platform location
+
+        Returns:
+            A Platform instance that is not in any group
+        """
+        if self._free:
+            platform = self._free.pop()
+            platform.reset(self.surface(size), center)
+            return platform
+        return Platform(self.surface(size), center, self._color)
+
+    def release(self, platform):
+        """
+        Removes a platform from the game and keeps it for reuse
+
+        Args:
+            platform: A Platform instance
+        """
+        platform.kill()
+        self._free.append(platform)
+
+    def __len__(self):
+        """
+        Returns the number of platforms waiting to be reused
+
+        Args:
+            none
+
+        Returns:
+            An int representing the number of free platforms
+        """
+        return len(self._free)
@@ -0,0 +1,342 @@
+"""
+This module checks that generated platforms can actually be reached by
+jumping from the platform before them, by stepping the same physics as
+Player.move for many possible inputs at once.
+
+Usage:
+    python reachability.py --seeds 1000 --platforms 30
+"""
+
+import argparse
+import time
+import numpy as np
+from generation import round_half_away
+from simulation import Simulation
+
+WIDTH = 400
+HEIGHT = 450
+
+
+class ReachabilityChecker:
+    """
+    Checks if a player standing on one platform can jump and land on
+    another, trying many inputs at once.
+
+    A jump's height over time is the same whatever the inputs are, so the
+    frames the player could land on the target are found once per
+    platform. Horizontal motion is then only the starting x plus a
+    distance that depends on the starting speed and inputs. Each
+    candidate input is tested by intersecting the range of starting x
+    positions on the platform with the starting x positions that put the
+    player over the target on a landing frame and keep them on screen
+    throughout.
+
+    A candidate holds one direction for a number of frames after takeoff,
+    then another direction until it lands. The player may take off at any
+    speed up to the fastest they can run, from anywhere on the platform.
+
+    Attributes:
+        _width: An int representing the width of the screen
+        _frames: An int representing the most frames a jump is followed
+        _player_size: A tuple of the int width and height of the player
+        _gravity: A float representing the downwards acceleration
+        _jump_velocity: A float representing the y velocity of a jump
+        _speeds: A NumPy array of each candidate's takeoff x velocity
+        _inputs: A (C, frames) NumPy array of each candidate's x
+            acceleration input on each frame after takeoff
+        _distance: A (C, frames + 1) NumPy array of how far each candidate
+            has moved horizontally from its takeoff x on each frame
+        _lowest: A (C, frames + 1) NumPy array of the smallest distance
+            each candidate has reached up to each frame
+        _highest: A (C, frames + 1) NumPy array of the largest distance
+            each candidate has reached up to each frame
+    """
+
+    def __init__(
+        self,
+        width=WIDTH,
+        frames=150,
+        player_size=(35, 53),
+        physics=(0.35, 0.12, -10),
+        speeds=9,
+        switch_frames=(4, 8, 12, 16, 20, 24, 32, 40, 48),
+    ) -> None:
+        """
+        Builds the candidate inputs and steps their horizontal motion.
+
+        Args:
+            width: An int representing the width of the screen.
+                Defaults to 400.
+            frames: An int representing the most frames to follow a jump
+                for. Defaults to 150.
+            player_size: A tuple of the int width and height of the
+                player. Defaults to (35, 53).
+            physics: A tuple of the float gravity, friction and jump
+                velocity. Defaults to the Model's (0.35, 0.12, -10).
+            speeds: An int representing the number of takeoff speeds to
+                try, spread evenly between the fastest speeds left and
+                right. Defaults to 9.
+            switch_frames: A tuple of ints representing the frames after
+                takeoff a candidate may change direction on.
+                Defaults to (4, 8, 12, 16, 20, 24, 32, 40, 48).
+        """
+        self._width = width
+        self._frames = frames
+        self._player_size = player_size
+        self._gravity, friction, self._jump_velocity = physics
+
+        directions = (-0.5, 0.0, 0.5)
+        sequences = [np.full(frames, direction) for direction in directions]
+        for switch in switch_frames:
+            for first in directions:
+                for second in directions:
+                    if first != second:
+                        sequence = np.full(frames, second)
+                        sequence[:switch] = first
+                        sequences.append(sequence)
+        top_speed = max(directions) / friction
+        takeoff_speeds = np.linspace(-top_speed, top_speed, speeds)
+        self._speeds = np.repeat(takeoff_speeds, len(sequences))
+        self._inputs = np.tile(np.array(sequences), (speeds, 1))
+
+        # Step Player.move's horizontal motion for every candidate
+        self._distance = np.zeros((len(self._speeds), frames + 1))
+        velocity = self._speeds.copy()
+        position = np.zeros(len(self._speeds))
+        for frame in range(1, frames + 1):
+            acceleration = self._inputs[:, frame - 1] - velocity * friction
+            velocity += acceleration
+            position += velocity + 0.5 * acceleration
+            self._distance[:, frame] = position
+        self._lowest = np.minimum.accumulate(self._distance, 1)
+        self._highest = np.maximum.accumulate(self._distance, 1)
+
+    def landing_frames(self, sources, targets):
+        """
+        Finds the frames after taking off from each source a player could
+        land on its target, if they were over it. Like Model.update, the
+        landing uses the player hitbox from the frame before.
+
+        Args:
+            sources: An (E, 4) NumPy array of the left, top, width and
+                height of the platforms jumped from
+            targets: An (E, 4) NumPy array of the platforms to land on
+
+        Returns:
+            An (E, K) NumPy array of frame numbers, and an (E, K) NumPy
+            bool array of which of them are real landing frames
+        """
+        _, height = self._player_size
+        target_top = targets[:, 1]
+        target_bottom = targets[:, 1] + targets[:, 3]
+        position = sources[:, 1] - height / 2
+        velocity = self._jump_velocity
+        stale_top = round_half_away(position) - height // 2
+        landing = np.zeros((len(sources), self._frames + 1), bool)
+        for frame in range(1, self._frames + 1):
+            velocity += self._gravity
+            if velocity >= 0:
+                landing[:, frame] = (
+                    (stale_top < target_bottom)
+                    & (target_top < stale_top + height)
+                    & (stale_top + height < target_bottom)
+                )
+            position = position + (velocity + 0.5 * self._gravity)
+            stale_top = round_half_away(position) - height // 2
+
+        # Falling only ever moves down, so the landing frames are in a row
+        first = np.argmax(landing, 1)
+        count = landing.sum(1)
+        # An empty batch has no counts to take the largest of
+        longest = int(count.max()) if len(count) else 0
+        offsets = np.arange(max(longest, 1))
+        frames = np.clip(first[:, None] + offsets, 1, self._frames)
+        return frames, offsets < count[:, None]
+
+    def check(self, sources, targets):
+        """
+        Checks if each target can be reached from its source
+
+        Args:
+            sources: An (E, 4) NumPy array of the left, top, width and
+                height of the platforms jumped from
+            targets: An (E, 4) NumPy array of the platforms to land on
+
+        Returns:
+            An (E,) NumPy bool array of which targets can be reached, and
+            an (E, 3) NumPy array holding, for each reachable target, the
+            candidate index, takeoff x and landing frame of one way to
+            reach it
+        """
+        sources = np.asarray(sources, float)
+        targets = np.asarray(targets, float)
+        if len(sources) == 0:
+            return np.zeros(0, bool), np.full((0, 3), np.nan)
+        width = self._player_size[0]
+        frames, real = self.landing_frames(sources, targets)
+
+        # Center x values where the player's hitbox overlaps a platform,
+        # given the hitbox is placed by rounding its center
+        half = width // 2
+        lower = half - width + 0.5
+        upper = half - 0.5
+        source_left = (sources[:, 0] + lower)[:, None, None]
+        source_right = (sources[:, 0] + sources[:, 2] + upper)[:, None, None]
+        target_left = (targets[:, 0] + lower)[:, None, None]
+        target_right = (targets[:, 0] + targets[:, 2] + upper)[:, None, None]
+
+        # Takeoff x ranges that are on the source, over the target on the
+        # landing frame and on screen until then, for each (E, K, C)
+        over = self._distance.T[frames - 1]
+        low = np.maximum(
+            np.maximum(source_left, target_left - over),
+            -self._lowest.T[frames],
+        )
+        high = np.minimum(
+            np.minimum(source_right, target_right - over),
+            self._width - self._highest.T[frames],
+        )
+        # Ranges narrower than rounding error in the stepped distances
+        # may not hold in the game, so they are not counted
+        feasible = (high - low > 1e-6) & real[:, :, None]
+
+        reachable = feasible.any((1, 2))
+        witness = np.full((len(sources), 3), np.nan)
+        flat = np.argmax(feasible.reshape(len(sources), -1), 1)
+        landing, candidate = np.divmod(flat, feasible.shape[2])
+        rows = np.arange(len(sources))
+        witness[:, 0] = candidate
+        witness[:, 1] = (
+            low[rows, landing, candidate] + high[rows, landing, candidate]
+        ) / 2
+        witness[:, 2] = frames[rows, landing]
+        witness[~reachable] = np.nan
+        return reachable, witness
+
+    def inputs(self, candidate):
+        """
+        Returns the takeoff speed and inputs of a candidate
+
+        Args:
+            candidate: An int representing the index of a candidate
+
+        Returns:
+            A tuple of the float takeoff x velocity and a NumPy array of
+            the x acceleration input on each frame after takeoff
+        """
+        return self._speeds[candidate], self._inputs[candidate]
+
+
+def level_edges(seed, difficulty, platforms, width=WIDTH, height=HEIGHT):
+    """
+    Generates a level the way the game does and pairs each platform with
+    the one generated from it
+
+    Args:
+        seed: An int used to seed platform generation
+        difficulty: float indicating the difficulty of the game
+        platforms: An int representing the number of platforms to generate
+            above the ground
+        width: int representing the width of the display screen.
+            Defaults to 400.
+        height: int representing the height of the display screen.
+            Defaults to 450.
+
+    Returns:
+        A tuple of two (platforms, 4) NumPy arrays of the left, top, width
+        and height of each platform jumped from and the platform above it
+    """
+    model = Simulation(width, height, difficulty, seed=seed).model
+    stream = model.platform_stream()
+    rects = [model.platforms.sprites()[-1].rect]
+    rects.extend(next(stream).rect for _ in range(platforms))
+    rects = np.array([tuple(rect) for rect in rects], float)
+    return rects[:-1], rects[1:]
+
+
+def unreachable_platforms(checker, seeds, difficulty, platforms, chunk=500):
+    """
+    Finds every generated platform that cannot be reached from the one
+    below it
+
+    Args:
+        checker: A ReachabilityChecker
+        seeds: An iterable of int seeds to generate levels with
+        difficulty: float indicating the difficulty of the game
+        platforms: An int representing the number of platforms to check
+            per seed
+        chunk: An int representing the most platforms checked at once,
+            which limits memory use. Defaults to 500.
+
+    Returns:
+        A tuple of the int number of platforms checked and a list of
+        (seed, index, source, target) tuples for each unreachable
+        platform, where index counts up from the first platform above the
+        ground
+    """
+    labels = []
+    sources = []
+    targets = []
+    for seed in seeds:
+        source, target = level_edges(seed, difficulty, platforms)
+        labels.extend((seed, index) for index in range(len(source)))
+        sources.append(source)
+        targets.append(target)
+    sources = np.concatenate(sources)
+    targets = np.concatenate(targets)
+
+    unreachable = []
+    for start in range(0, len(sources), chunk):
+        stop = start + chunk
+        reachable, _ = checker.check(sources[start:stop], targets[start:stop])
+        for index in np.flatnonzero(~reachable) + start:
+            unreachable.append((*labels[index], sources[index], targets[index]))
+    return len(sources), unreachable
+
+
+def main():
+    """
+    Checks generated platforms can be reached from the command line
+
+    Args:
+        none
+    """
+    parser = argparse.ArgumentParser(
+        description="Check generated platforms can be reached."
+    )
+    parser.add_argument("--seeds", type=int, default=1000)
+    parser.add_argument("--platforms", type=int, default=30)
+    parser.add_argument(
+        "--difficulty",
+        type=float,
+        action="append",
+        help="difficulties to check, defaults to 0.5, 0.75 and 1",
+    )
+    parser.add_argument(
+        "--show", type=int, default=5, help="unreachable platforms to list"
+    )
+    args = parser.parse_args()
+
+    reach = ReachabilityChecker()
+    for level in args.difficulty or (0.5, 0.75, 1):
+        started = time.perf_counter()
+        checked, found = unreachable_platforms(
+            reach, range(args.seeds), level, args.platforms
+        )
+        elapsed = time.perf_counter() - started
+        bad_seeds = len({seed for seed, *_ in found})
+        print(
+            f"difficulty {level}: {len(found)} of {checked} platforms "
+            f"unreachable, in {bad_seeds} of {args.seeds} seeds "
+            f"({args.seeds / elapsed * 60:.0f} seeds per minute)"
+        )
+        for seed, index, source, target in found[: args.show]:
+            print(
+                f"    seed {seed} platform {index}: "
+                f"{tuple(int(value) for value in source)} -> "
+                f"{tuple(int(value) for value in target)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
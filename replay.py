@@ -0,0 +1,201 @@
+"""
+This module creates a class to record the inputs of a game session and a
+function to replay them headless, reproducing the session exactly.
+
+Usage:
+    python replay.py RECORDING      Replays a recording as fast as possible
+                                    and prints how the session ended
+"""
+
+import argparse
+import json
+import time
+from simulation import Simulation
+
+
+class InputRecorder:
+    """
+    Records the controller state used for each physics step of a session.
+    Inputs usually stay the same for many steps in a row, so they are
+    stored as runs of identical inputs.
+
+    Attributes:
+        _seed: An int representing the seed the session's platforms were
+            generated with
+        _difficulty: A float representing the difficulty of the session
+        _runs: A list of lists of a left_right float, a jumping bool and
+            an int count of how many steps in a row used those inputs
+    """
+
+    def __init__(self, seed, difficulty, runs=None) -> None:
+        """
+        Initializes the recording.
+
+        Args:
+            seed: An int representing the seed the session's platforms
+                were generated with
+            difficulty: float indicating the difficulty of the session
+            runs: A list of [left_right, jumping, count] lists to start
+                from, or None to start empty. Defaults to None.
+        """
+        self._seed = seed
+        self._difficulty = difficulty
+        self._runs = [] if runs is None else runs
+
+    def record(self, left_right, jumping):
+        """
+        Records the inputs used for one physics step
+
+        Args:
+            left_right: A float representing the horizontal acceleration
+            jumping: A bool representing if the character is jumping
+        """
+        if (
+            self._runs
+            and self._runs[-1][0] == left_right
+            and self._runs[-1][1] == jumping
+        ):
+            self._runs[-1][2] += 1
+        else:
+            self._runs.append([left_right, jumping, 1])
+
+    def inputs(self):
+        """
+        Yields the inputs of each recorded step in order
+
+        Args:
+            none
+
+        Yields:
+            A tuple of the left_right float and jumping bool of a step
+        """
+        for left_right, jumping, count in self._runs:
+            for _ in range(count):
+                yield left_right, jumping
+
+    def save(self, path):
+        """
+        Saves the recording as JSON
+
+        Args:
+            path: A string representing the file to write
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "seed": self._seed,
+                    "difficulty": self._difficulty,
+                    "runs": self._runs,
+                },
+                file,
+            )
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads a recording saved with save
+
+        Args:
+            path: A string representing the file to read
+
+        Returns:
+            An InputRecorder holding the saved recording
+        """
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        return cls(data["seed"], data["difficulty"], data["runs"])
+
+    @property
+    def seed(self):
+        """
+        Allows private attribute _seed to be accessed
+
+        Args:
+            none
+
+        Returns:
+            An int representing the seed of the session
+        """
+        return self._seed
+
+    @property
+    def difficulty(self):
+        """
+        Allows private attribute _difficulty to be accessed
+
+        Args:
+            none
+
+        Returns:
+            A float representing the difficulty of the session
+        """
+        return self._difficulty
+
+    @property
+    def runs(self):
+        """
+        Allows private attribute _runs to be accessed
+
+        Args:
+            none
+
+        Returns:
+            A list of [left_right, jumping, count] lists
+        """
+        return self._runs
+
+    @property
+    def frames(self):
+        """
+        Returns the number of steps recorded
+
+        Args:
+            none
+
+        Returns:
+            An int representing the number of steps recorded
+        """
+        return sum(run[2] for run in self._runs)
+
+
+def replay(recording, width=400, height=450, fps=60):
+    """
+    Replays a recording headless as fast as possible
+
+    Args:
+        recording: An InputRecorder holding the session to replay
+        width: int representing the width of the display screen.
+            Defaults to 400.
+        height: int representing the height of the display screen.
+            Defaults to 450.
+        fps: An int representing the steps per second the session was
+            recorded at. Defaults to 60.
+
+    Returns:
+        The Simulation after every recorded step has been replayed
+    """
+    simulation = Simulation(
+        width, height, recording.difficulty, fps, seed=recording.seed
+    )
+    for left_right, jumping in recording.inputs():
+        if simulation.finished:
+            break
+        simulation.step(left_right, jumping)
+    return simulation
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Replay a recorded session headless."
+    )
+    parser.add_argument("recording", help="JSON file saved by a recording")
+    args = parser.parse_args()
+
+    loaded = InputRecorder.load(args.recording)
+    start = time.perf_counter()
+    result = replay(loaded)
+    seconds = time.perf_counter() - start
+    print(f"Steps: {result.frames} of {loaded.frames} recorded")
+    print(f"Score: {result.model.score}")
+    print(f"Time left: {result.time_left:.2f}")
+    print(f"Replayed at {result.frames / seconds:.0f} steps per second")
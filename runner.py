@@ -0,0 +1,333 @@
+"""
+This module runs many headless game sessions across a pool of processes,
+so scripted controllers can be compared over many seeds and difficulties.
+
+Usage:
+    python runner.py --seeds 100 --controller climb --controller idle
+"""
+
+import argparse
+from collections import namedtuple
+import math
+import multiprocessing
+import random
+import time
+from simulation import Simulation
+
+WIDTH = 400
+HEIGHT = 450
+
+EpisodeResult = namedtuple(
+    "EpisodeResult",
+    ["seed", "difficulty", "controller", "score", "frames", "seconds"],
+)
+
+
+def climb(model):
+    """
+    A simple policy that always jumps towards the centre of the highest
+    platform above the player
+
+    Args:
+        model: An instance of the Model class
+
+    Returns:
+        A tuple of the x acceleration and jumping bool for the next frame
+    """
+    player = model.player
+    above = [
+        platform
+        for platform in model.platforms
+        if platform.rect.top < player.rect.bottom - 5
+    ]
+    if not above:
+        return 0.0, True
+    target = max(above, key=lambda platform: platform.rect.top)
+    distance = target.rect.centerx - player.position.x
+    if distance > 5:
+        return 0.5, True
+    if distance < -5:
+        return -0.5, True
+    return 0.0, True
+
+
+def idle(model):  # pylint: disable=unused-argument
+    """
+    A policy that never moves, lasting until the fuel runs out
+
+    Args:
+        model: An instance of the Model class
+
+    Returns:
+        A tuple of the x acceleration and jumping bool for the next frame
+    """
+    return 0.0, False
+
+
+def random_inputs(seed):
+    """
+    Creates a policy that holds a random direction and jump for a random
+    number of frames at a time
+
+    Args:
+        seed: An int used to seed the random inputs
+
+    Returns:
+        A policy function taking the Model and returning a tuple of the x
+        acceleration and jumping bool for the next frame
+    """
+    rng = random.Random(seed)
+    held = [0.0, False, 0]
+
+    def policy(model):  # pylint: disable=unused-argument
+        if held[2] == 0:
+            held[0] = rng.choice((-0.5, 0.0, 0.5))
+            held[1] = rng.random() < 0.7
+            held[2] = rng.randint(5, 30)
+        held[2] -= 1
+        return held[0], held[1]
+
+    return policy
+
+
+# Maps a controller name to a function that takes the episode seed and
+# returns its policy. Controllers are sent to workers by name, since
+# policies may be closures that cannot be pickled.
+CONTROLLERS = {
+    "climb": lambda seed: climb,
+    "idle": lambda seed: idle,
+    "random": random_inputs,
+}
+
+
+def run_episode(task):
+    """
+    Runs one headless session until it is finished
+
+    Args:
+        task: A tuple of the int seed, float difficulty and string name of
+            a controller in CONTROLLERS
+
+    Returns:
+        An EpisodeResult of the session
+    """
+    seed, difficulty, controller = task
+    start = time.perf_counter()
+    simulation = Simulation(WIDTH, HEIGHT, difficulty, seed=seed)
+    simulation.run(CONTROLLERS[controller](seed))
+    return EpisodeResult(
+        seed,
+        difficulty,
+        controller,
+        simulation.model.score,
+        simulation.frames,
+        time.perf_counter() - start,
+    )
+
+
+def run_episodes(tasks, processes=None, chunksize=4):
+    """
+    Runs sessions across a pool of processes, yielding each result as soon
+    as it finishes. Workers are spawned rather than forked, since forking
+    a process that has started pygame's audio or the asset loading
+    threads can leave the workers deadlocked.
+
+    Args:
+        tasks: An iterable of (seed, difficulty, controller) tuples
+        processes: An int representing the number of worker processes, or
+            None for one per CPU. Defaults to None.
+        chunksize: An int representing the number of tasks sent to a
+            worker at a time. Defaults to 4.
+
+    Yields:
+        An EpisodeResult for each task, in the order they finish
+    """
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes) as pool:
+        yield from pool.imap_unordered(run_episode, tasks, chunksize)
+
+
+class RunningStats:
+    """
+    Keeps summary statistics of values as they arrive, without storing
+    them, using Welford's method for the variance.
+
+    Attributes:
+        _count: An int representing the number of values added
+        _mean: A float representing the mean of the values
+        _squares: A float representing the sum of squared differences from
+            the mean
+        _minimum: The smallest value added, or None
+        _maximum: The largest value added, or None
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes statistics with no values.
+
+        Args:
+            none
+        """
+        self._count = 0
+        self._mean = 0.0
+        self._squares = 0.0
+        self._minimum = None
+        self._maximum = None
+
+    def add(self, value):
+        """
+        Adds a value to the statistics
+
+        Args:
+            value: A number to add
+        """
+        self._count += 1
+        difference = value - self._mean
+        self._mean += difference / self._count
+        self._squares += difference * (value - self._mean)
+        if self._minimum is None or value < self._minimum:
+            self._minimum = value
+        if self._maximum is None or value > self._maximum:
+            self._maximum = value
+
+    @property
+    def count(self):
+        """
+        Allows private attribute _count to be accessed
+
+        Args:
+            none
+
+        Returns:
+            An int representing the number of values added
+        """
+        return self._count
+
+    @property
+    def mean(self):
+        """
+        Allows private attribute _mean to be accessed
+
+        Args:
+            none
+
+        Returns:
+            A float representing the mean of the values
+        """
+        return self._mean
+
+    @property
+    def stdev(self):
+        """
+        Returns the sample standard deviation of the values
+
+        Args:
+            none
+
+        Returns:
+            A float representing the sample standard deviation, or 0.0
+            with fewer than two values
+        """
+        if self._count < 2:
+            return 0.0
+        return math.sqrt(self._squares / (self._count - 1))
+
+    @property
+    def minimum(self):
+        """
+        Allows private attribute _minimum to be accessed
+
+        Args:
+            none
+
+        Returns:
+            The smallest value added, or None
+        """
+        return self._minimum
+
+    @property
+    def maximum(self):
+        """
+        Allows private attribute _maximum to be accessed
+
+        Args:
+            none
+
+        Returns:
+            The largest value added, or None
+        """
+        return self._maximum
+
+
+def summarize(results):
+    """
+    Groups results by controller and difficulty as they arrive
+
+    Args:
+        results: An iterable of EpisodeResult
+
+    Returns:
+        A dict mapping a tuple of the controller name and difficulty to a
+        dict of RunningStats for "score", "frames" and "seconds"
+    """
+    summary = {}
+    for result in results:
+        group = summary.setdefault(
+            (result.controller, result.difficulty),
+            {name: RunningStats() for name in ("score", "frames", "seconds")},
+        )
+        group["score"].add(result.score)
+        group["frames"].add(result.frames)
+        group["seconds"].add(result.seconds)
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run headless sessions of scripted controllers."
+    )
+    parser.add_argument(
+        "--seeds", type=int, default=50, help="sessions per combination"
+    )
+    parser.add_argument(
+        "--difficulty",
+        type=float,
+        action="append",
+        help="difficulties to run, defaults to 0.5, 0.75 and 1",
+    )
+    parser.add_argument(
+        "--controller",
+        action="append",
+        choices=CONTROLLERS,
+        help="controllers to run, defaults to all of them",
+    )
+    parser.add_argument(
+        "--processes", type=int, help="worker processes, defaults to CPUs"
+    )
+    args = parser.parse_args()
+
+    all_tasks = [
+        (seed, difficulty, controller)
+        for controller in args.controller or CONTROLLERS
+        for difficulty in args.difficulty or (0.5, 0.75, 1)
+        for seed in range(args.seeds)
+    ]
+    started = time.perf_counter()
+    totals = summarize(run_episodes(all_tasks, args.processes))
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{'controller':<12}{'difficulty':>10}{'score':>15}"
+        f"{'frames':>17}{'ms/episode':>12}"
+    )
+    for (name, level), stats in sorted(totals.items()):
+        print(
+            f"{name:<12}{level:>10}"
+            f"{stats['score'].mean:>8.1f} ±{stats['score'].stdev:<5.1f}"
+            f"{stats['frames'].mean:>9.0f} ±{stats['frames'].stdev:<6.0f}"
+            f"{stats['seconds'].mean * 1000:>12.1f}"
+        )
+    print(
+        f"{len(all_tasks)} episodes in {elapsed:.1f} s, "
+        f"{len(all_tasks) / elapsed:.1f} episodes per second"
+    )
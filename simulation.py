@@ -0,0 +1,198 @@
+"""
+This module creates a class to step a game session without a display,
+sound or frame rate cap, so sessions can be simulated as fast as the
+model allows.
+"""
+
+import pygame
+from collision import PlatformIndex
+from model import Model
+from platforms import Platform
+
+
+class Simulation:
+    """
+    Steps a full game session, including scrolling, scoring and the
+    fuel timer, one frame at a time.
+
+    Attributes:
+        _fps: An int representing the frames per second the game is
+            designed to run at. Used to convert the timer to seconds.
+        _timer: An int representing the number of frames left before
+            the player runs out of fuel.
+        _frames: An int representing the number of frames stepped so far.
+        _model: An instance of the Model class
+        _current_time: An int representing the timer value at the last
+            frame the score was increased.
+        _can_increase_score: A bool representing if the next scroll while
+            moving upwards should increase the score.
+        _profiler: A FrameProfiler that times the phases of each step, or
+            None if steps are not timed.
+    """
+
+    def __init__(
+        self,
+        width,
+        height,
+        difficulty=0.5,
+        fps=60,
+        headless=True,
+        seed=None,
+    ) -> None:
+        """
+        Initializes the session with the ground platform.
+
+        Args:
+            width: int representing the width of the display screen
+            height: int representing the height of the display screen
+            difficulty: float indicating the difficulty of the game
+                1 is hard, 0.75 is medium, 0.5 is easy. Defaults to 0.5.
+            fps: An int representing the frames per second the game is
+                designed to run at. Defaults to 60.
+            headless: A bool representing if the model should skip loading
+                sounds and images. Defaults to True.
+            seed: An int used to seed platform generation, or None for a
+                random seed. Defaults to None.
+        """
+        self._fps = fps
+        self._timer = 60 * fps
+        self._frames = 0
+        ground = Platform(
+            surf=pygame.Surface((200, 20)), center=(width / 2, height - 5)
+        )
+        platforms = PlatformIndex(ground)
+        self._model = Model(platforms, width, height, headless, seed)
+        self._model.set_difficulty(difficulty)
+        self._current_time = 0
+        self._can_increase_score = True
+        self._profiler = None
+
+    def step(self, x_acceleration, jumping):
+        """
+        Advances the session by one frame.
+
+        Args:
+            x_acceleration: A float representing how fast the character
+                accelerates in a horizontal direction.
+            jumping: A bool representing if the character is jumping
+                or not.
+        """
+        profiler = self._profiler
+        self._model.save_previous_state()
+        if self._model.scroll() and self._model.player.state.vy < 0:
+            if self._can_increase_score:
+                self._model.increase_score()
+            self._current_time = self._timer
+            self._can_increase_score = False
+        if self._current_time - self._timer > 1:
+            self._can_increase_score = True
+        if profiler is not None:
+            profiler.mark("camera")
+
+        self._model.platform_generation()
+        if profiler is not None:
+            profiler.mark("generation")
+            profiler.add_count("platforms", self._model.generated)
+        self._model.update(x_acceleration, jumping)
+        self._model.check_player_off_screen()
+        self._timer -= 1
+        self._frames += 1
+        if profiler is not None:
+            profiler.mark("update")
+
+    def set_profiler(self, profiler):
+        """
+        Sets the profiler that times the phases of each step
+
+        Args:
+            profiler: A FrameProfiler, or None to stop timing steps
+        """
+        self._profiler = profiler
+
+    def run(self, policy, max_frames=None):
+        """
+        Steps the session until it is finished.
+
+        Args:
+            policy: A function that takes the Model and returns a tuple of
+                the x acceleration and jumping bool for the next frame.
+            max_frames: An int representing the maximum number of frames
+                to step, or None to run until the session is finished.
+                Defaults to None.
+
+        Returns:
+            An int representing the number of frames stepped by this call
+        """
+        stepped = 0
+        while not self.finished and (
+            max_frames is None or stepped < max_frames
+        ):
+            self.step(*policy(self._model))
+            stepped += 1
+        return stepped
+
+    @property
+    def model(self):
+        """
+        Allows private attribute _model to be accessed
+
+        Args:
+            none
+
+        Returns:
+            The Model instance being simulated
+        """
+        return self._model
+
+    @property
+    def timer(self):
+        """
+        Allows private attribute _timer to be accessed
+
+        Args:
+            none
+
+        Returns:
+            An int representing the number of frames left
+        """
+        return self._timer
+
+    @property
+    def time_left(self):
+        """
+        Returns the fuel left in seconds
+
+        Args:
+            none
+
+        Returns:
+            A float representing the seconds left on the timer
+        """
+        return self._timer / self._fps
+
+    @property
+    def frames(self):
+        """
+        Allows private attribute _frames to be accessed
+
+        Args:
+            none
+
+        Returns:
+            An int representing the number of frames stepped so far
+        """
+        return self._frames
+
+    @property
+    def finished(self):
+        """
+        Returns if the session is over, either by the player leaving the
+        screen or by running out of fuel
+
+        Args:
+            none
+
+        Returns:
+            A bool representing if the session is over
+        """
+        return self._model.game_over or self._timer <= 0
@@ -0,0 +1,59 @@
+"""
+This module contains unit tests for the RocketAnimation class in
+animation.py.
+"""
+
+import pytest
+from animation import RocketAnimation
+
+
+# Test cases
+
+animation = RocketAnimation(35, 53)
+
+frame_picks = [
+    # Falling shows the idle frame, which covers the hitbox exactly
+    (False, 0.0, 0, (35, 53), (0, 0)),
+    # Rising shows a flame frame with the body still over the hitbox
+    (True, 0.0, 0, (35, 83), (0, 15)),
+    # Moving fast tilts the rocket, with the flame behind it
+    (True, 4.0, 0, None, (-3, 15)),
+    (True, -4.0, 0, None, (3, 15)),
+]
+
+
+@pytest.mark.parametrize("rising,x_velocity,ticks,size,offset", frame_picks)
+def test_frame(rising, x_velocity, ticks, size, offset):
+    """
+    Checks that the right frame is picked and placed so the rocket's body
+    stays over the hitbox.
+
+    Args:
+        rising: A bool representing if the rocket is moving up
+        x_velocity: A float representing the rocket's x velocity
+        ticks: An int representing the milliseconds since the game started
+        size: A tuple of the expected sprite size, or None if rotated
+        offset: A tuple of the expected offset of the sprite's center
+    """
+    surface, sprite_offset = animation.frame(rising, x_velocity, ticks)
+
+    if size is not None:
+        assert surface.get_size() == size
+    assert sprite_offset == offset
+
+
+def test_frames_cached():
+    """
+    Checks that frames are made once, the flame frames cycle over time and
+    slow movement leaves the rocket upright.
+
+    Args:
+        none
+    """
+    first = animation.frame(True, 1.0, 0)
+    second = animation.frame(True, 1.0, 80)
+
+    assert animation.frame(True, 0.0, 0) is first
+    assert second is not first
+    assert animation.frame(True, 1.0, 160) is first
+    assert animation.frame(True, 100.0, 0) is animation.frame(True, 4.2, 0)
@@ -0,0 +1,97 @@
+"""
+This module contains unit tests for the AssetCache class in assets.py.
+
+Not tested:
+    AssetCache:
+        conversion to the display format: needs a display, and converted
+            surfaces draw the same as unconverted ones
+"""
+
+import pygame
+import pytest
+from assets import AssetCache
+
+
+# Test cases
+
+image_sizes = [
+    # Scaling keeps the aspect ratio, rounding the height down
+    ("sprites/TestRocket.png", 35, (35, 53)),
+    ("sprites/rocket_move_0.png", 35, (35, 83)),
+    # No width keeps the original size
+    ("sprites/TestRocket.png", None, (775, 1184)),
+]
+
+
+@pytest.mark.parametrize("path,width,size", image_sizes)
+def test_image_size(path, width, size):
+    """
+    Checks that images are scaled to the same size the player and view
+    used to scale them to.
+
+    Args:
+        path: A string representing the path of the image file
+        width: An int representing the width to scale to, or None
+        size: A tuple representing the expected width and height
+    """
+    assert AssetCache().image(path, width).get_size() == size
+
+
+def test_image_loaded_once(monkeypatch):
+    """
+    Checks that an image is only loaded from disk once, and each size of
+    it is only scaled once.
+
+    Args:
+        monkeypatch: pytest fixture used to count image loads
+    """
+    loads = []
+    load = pygame.image.load
+
+    def counting_load(path):
+        loads.append(path)
+        return load(path)
+
+    monkeypatch.setattr(pygame.image, "load", counting_load)
+    cache = AssetCache()
+    small = cache.image("sprites/TestRocket.png", 35)
+    large = cache.image("sprites/TestRocket.png", 70)
+
+    assert cache.image("sprites/TestRocket.png", 35) is small
+    assert cache.image("sprites/TestRocket.png", 70) is large
+    assert small is not large
+    assert loads == ["sprites/TestRocket.png"]
+
+
+def test_sound_loaded_once():
+    """
+    Checks that a sound is only loaded once.
+
+    Args:
+        none
+    """
+    cache = AssetCache()
+    sound = cache.sound("sounds/end_sound.wav")
+
+    assert cache.sound("sounds/end_sound.wav") is sound
+
+
+def test_preload():
+    """
+    Checks that preloaded files become ready and are the same files
+    returned when they are asked for.
+
+    Args:
+        none
+    """
+    cache = AssetCache()
+    cache.preload(["sprites/TestRocket.png"], ["sounds/end_sound.wav"])
+    sound = cache.sound("sounds/end_sound.wav")
+    image = cache.image("sprites/TestRocket.png", 35)
+
+    assert cache.ready("sounds/end_sound.wav")
+    assert cache.ready("sprites/TestRocket.png")
+    assert not cache.ready("sprites/rocket_move_0.png")
+    assert cache.sound("sounds/end_sound.wav") is sound
+    assert cache.image("sprites/TestRocket.png", 35) is image
+    assert image.get_size() == (35, 53)
@@ -0,0 +1,51 @@
+"""
+This module contains unit tests for the SoundPool class in audio.py.
+"""
+
+import pygame
+from assets import ASSETS
+from audio import SoundPool
+
+
+# Test cases
+
+
+def test_rate_limit():
+    """
+    Checks that a sound started again too soon is skipped, and that other
+    sounds are not limited by it.
+
+    Args:
+        none
+    """
+    jump = ASSETS.sound("sounds/rocketbrrrnoises.wav")
+    end = ASSETS.sound("sounds/end_sound.wav")
+    pool = SoundPool(channels=2, min_interval=100)
+
+    assert pool.play(jump, now=1000) is not None
+    assert pool.play(jump, now=1050) is None
+    assert pool.play(end, now=1050) is not None
+    assert pool.play(jump, now=1100) is not None
+    pygame.mixer.stop()
+
+
+def test_reserved_channels():
+    """
+    Checks that the pool can play sounds when every other channel is
+    busy, and that it reuses its own channels in turn when they are all
+    busy.
+
+    Args:
+        none
+    """
+    effect = ASSETS.sound("sounds/end_sound.wav")
+    other = ASSETS.sound("sounds/rocketbrrrnoises.wav")
+    pool = SoundPool(channels=2, min_interval=0)
+    while other.play() is not None:
+        pass
+    used = [pool.play(effect, now=time) for time in range(3)]
+
+    assert used[0] is not used[1]
+    assert used[2] is used[0]
+    assert all(channel.get_sound() is effect for channel in used)
+    pygame.mixer.stop()
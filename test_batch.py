@@ -0,0 +1,118 @@
+"""
+This module contains unit tests for the BatchSimulation class in batch.py.
+
+The batch is checked against Simulation instances stepped with the same
+inputs. Platform generation is turned off in both because the batch uses
+its own random numbers to generate platforms.
+
+Not tested:
+    BatchSimulation:
+        positions, velocities, platforms, alive, scores, timers, frames,
+        game_over: getter functions, uneccessary to test
+"""
+
+import numpy as np
+import pytest
+from batch import BatchSimulation
+from simulation import Simulation
+
+
+# Test cases
+
+batch_difficulties = [
+    # Easy, medium and hard sessions
+    0.5,
+    0.75,
+    1,
+]
+
+
+def make_simulations(count, difficulty):
+    """
+    Creates Simulations with their platforms generated and platform
+    generation turned off afterwards.
+
+    Args:
+        count: An int representing the number of Simulations
+        difficulty: A float representing the difficulty of each Simulation
+
+    Returns:
+        A list of Simulation instances
+    """
+    simulations = []
+    for _ in range(count):
+        simulation = Simulation(400, 450, difficulty)
+        simulation.model.platform_generation()
+        simulation.model.platform_generation = lambda: None
+        simulations.append(simulation)
+    return simulations
+
+
+@pytest.mark.parametrize("difficulty", batch_difficulties)
+def test_step_matches_simulation(difficulty):
+    """
+    Checks that stepping the batch gives the same positions, velocities,
+    scores and game over states as stepping each Simulation on its own.
+
+    Args:
+        difficulty: A float representing the difficulty of the sessions
+    """
+    rng = np.random.default_rng(7)
+    simulations = make_simulations(16, difficulty)
+    batch = BatchSimulation.from_simulations(simulations, generate=False)
+
+    for _ in range(600):
+        x_acceleration = rng.choice([-0.5, 0.0, 0.5], len(simulations))
+        jumping = rng.random(len(simulations)) < 0.5
+        for row, simulation in enumerate(simulations):
+            if not simulation.finished:
+                simulation.step(x_acceleration[row], bool(jumping[row]))
+        batch.step(x_acceleration, jumping)
+
+        for row, simulation in enumerate(simulations):
+            player = simulation.model.player
+            assert tuple(batch.positions[row]) == tuple(player.position)
+            assert tuple(batch.velocities[row]) == tuple(player.velocity)
+            assert batch.camera_offsets[row] == simulation.model.camera_offset
+            assert batch.scores[row] == simulation.model.score
+            assert batch.game_over[row] == simulation.model.game_over
+            assert batch.alive[row].sum() == len(simulation.model.platforms)
+
+
+def test_finished_sessions_are_frozen():
+    """
+    Checks that a session that has ended is not stepped any further.
+
+    Args:
+        none
+    """
+    batch = BatchSimulation.from_simulations(
+        make_simulations(2, 0.5), generate=False
+    )
+    for _ in range(300):
+        batch.step([-0.5, 0.0], False)
+    assert list(batch.game_over) == [True, False]
+
+    position = tuple(batch.positions[0])
+    frames = tuple(batch.frames)
+    batch.step([-0.5, 0.0], False)
+
+    assert tuple(batch.positions[0]) == position
+    assert batch.frames[0] == frames[0]
+    assert batch.frames[1] == frames[1] + 1
+
+
+def test_generation_refills_platforms():
+    """
+    Checks that sessions that scroll platforms off the screen are refilled
+    to the platform count.
+
+    Args:
+        none
+    """
+    batch = BatchSimulation([[[100, 435, 200, 20]]] * 4, 400, 450, seed=3)
+    rng = np.random.default_rng(3)
+    for _ in range(600):
+        batch.step(rng.choice([-0.5, 0.0, 0.5], 4), True)
+        for row in np.flatnonzero(~batch.finished):
+            assert batch.alive[row].sum() == 30
@@ -0,0 +1,39 @@
+"""
+This module contains unit tests for the functions in benchmark.py.
+
+Not tested:
+    bench_*: timing setups, run by benchmark.py itself
+    time_case, main: depend on the speed of the machine
+"""
+
+import pytest
+from benchmark import compare
+
+
+# Test cases
+
+comparisons = [
+    # Slower than the threshold allows
+    ({"a": 1.5}, {"a": 1.0}, 0.2, {"a": 0.5}),
+    # Slower but within the threshold
+    ({"a": 1.1}, {"a": 1.0}, 0.2, {}),
+    # Faster
+    ({"a": 0.5}, {"a": 1.0}, 0.2, {}),
+    # Cases missing from the baseline are not compared
+    ({"a": 1.0, "b": 9.0}, {"a": 1.0}, 0.2, {}),
+]
+
+
+@pytest.mark.parametrize("results,baseline,threshold,expected", comparisons)
+def test_compare(results, baseline, threshold, expected):
+    """
+    Checks that only cases slower than the baseline by more than the
+    threshold are reported.
+
+    Args:
+        results: A dict mapping case names to seconds per call
+        baseline: A dict mapping case names to seconds per call
+        threshold: A float representing the allowed fraction slower
+        expected: A dict of the expected regressions
+    """
+    assert compare(results, baseline, threshold) == pytest.approx(expected)
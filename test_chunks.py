@@ -0,0 +1,122 @@
+"""
+This module contains unit tests for the PlatformChunkWorker class in
+chunks.py.
+
+Not tested:
+    PlatformChunkWorker:
+        chunks_ready: getter function, uneccessary to test
+    spec_rect: used to chain specs in every test
+"""
+
+import itertools
+import random
+import pygame
+import pytest
+from chunks import PlatformChunkWorker, spec_rect
+
+
+# Test cases
+
+GROUND = pygame.Rect(100, 440, 200, 20)
+
+
+def make_spec_function(seed, fail_after=None):
+    """
+    Creates a spec function that places each platform a random distance
+    above and to the side of the one before
+
+    Args:
+        seed: An int used to seed the placement
+        fail_after: An int representing the number of specs made before
+            it raises a ValueError, or None to never raise. Defaults to
+            None.
+
+    Returns:
+        A function taking the pygame.Rect of the previous platform and
+        returning a tuple of the (width, height) and center of the next
+    """
+    placement = random.Random(seed)
+    made = itertools.count()
+
+    def spec_function(previous_rect):
+        if fail_after is not None and next(made) >= fail_after:
+            raise ValueError("no more platforms")
+        return (60, 15), (
+            placement.randint(30, 370),
+            previous_rect.centery - placement.randint(40, 120),
+        )
+
+    return spec_function
+
+
+def chain(spec_function, count):
+    """
+    Computes specs in order on the calling thread
+
+    Args:
+        spec_function: A function returning the spec above a rect
+        count: An int representing the number of specs
+
+    Returns:
+        A list of count specs
+    """
+    specs = []
+    previous_rect = GROUND
+    for _ in range(count):
+        specs.append(spec_function(previous_rect))
+        previous_rect = spec_rect(specs[-1])
+    return specs
+
+
+@pytest.mark.parametrize("taken_before_stop", [0, 3, 20])
+def test_specs_after_stop(taken_before_stop):
+    """
+    Checks that specs keeps yielding the same sequence after the worker
+    is stopped, whether or not any specs were taken before it stopped.
+
+    Args:
+        taken_before_stop: An int representing the number of specs taken
+            before stopping the worker
+    """
+    expected = chain(make_spec_function(1), 60)
+    worker = PlatformChunkWorker(make_spec_function(1), GROUND)
+    specs = worker.specs()
+    taken = list(itertools.islice(specs, taken_before_stop))
+    worker.stop()
+    taken += itertools.islice(specs, 60 - taken_before_stop)
+
+    assert taken == expected
+
+
+def test_worker_error_raised():
+    """
+    Checks that an error in the spec function is raised from specs once
+    the specs made before it are used, instead of leaving specs waiting
+    forever.
+
+    Args:
+        none
+    """
+    expected = chain(make_spec_function(1), 8)
+    worker = PlatformChunkWorker(make_spec_function(1, 12), GROUND)
+    specs = worker.specs()
+
+    assert list(itertools.islice(specs, 8)) == expected
+    with pytest.raises(ValueError, match="no more platforms"):
+        next(specs)
+    worker.stop()
+
+
+def test_worker_error_raised_after_stop():
+    """
+    Checks that an error the worker stopped on is still raised when specs
+    is used after the worker is stopped.
+
+    Args:
+        none
+    """
+    worker = PlatformChunkWorker(make_spec_function(1, 0), GROUND)
+    worker.stop()
+
+    with pytest.raises(ValueError, match="no more platforms"):
+        next(worker.specs())
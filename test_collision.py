@@ -0,0 +1,97 @@
+"""
+This module contains unit tests for the PlatformIndex class in
+collision.py.
+
+Not tested:
+    PlatformIndex:
+        add_internal, remove_internal: covered by the query tests after
+            adding and killing platforms
+"""
+
+import random
+import pygame
+import pytest
+from collision import PlatformIndex
+from platforms import Platform
+
+
+# Test cases
+
+nearest_contacts = [
+    # Player overlapping both platforms, feet closest to the lower one
+    (pygame.Rect(100, 250, 35, 53), 300),
+    # Player feet inside the upper platform only
+    (pygame.Rect(100, 230, 35, 53), 280),
+    # Player not touching either platform
+    (pygame.Rect(300, 250, 35, 53), None),
+]
+
+
+def make_platforms(count, seed):
+    """
+    Creates platforms of random sizes scattered over a tall area.
+
+    Args:
+        count: An int representing the number of platforms
+        seed: An int used to seed the platform positions
+
+    Returns:
+        A list of Platform instances
+    """
+    rng = random.Random(seed)
+    return [
+        Platform(
+            pygame.Surface((rng.randint(50, 100), rng.choice((15, 20)))),
+            (rng.randint(0, 400), rng.randint(-2000, 450)),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_query_matches_spritecollide():
+    """
+    Checks that querying the index finds the same platforms as checking
+    every platform, including after some platforms are killed.
+
+    Args:
+        none
+    """
+    platforms = make_platforms(300, 1)
+    group = pygame.sprite.Group(*platforms)
+    index = PlatformIndex(*platforms)
+    for platform in platforms[::3]:
+        platform.kill()
+
+    rng = random.Random(2)
+    for _ in range(500):
+        player = pygame.sprite.Sprite()
+        player.rect = pygame.Rect(
+            rng.randint(-20, 400), rng.randint(-2100, 460), 35, 53
+        )
+        expected = pygame.sprite.spritecollide(player, group, False)
+
+        assert len(index) == len(group)
+        assert set(index.query(player.rect)) == set(expected)
+
+
+@pytest.mark.parametrize("rect,top", nearest_contacts)
+def test_nearest_contact(rect, top):
+    """
+    Checks that the platform closest to the bottom of the player is the
+    one picked when the player touches more than one.
+
+    Args:
+        rect: A pygame.Rect representing the player hitbox
+        top: An int representing the top of the expected platform, or None
+            if no platform should be touched
+    """
+    index = PlatformIndex(
+        Platform(pygame.Surface((100, 15)), (150, 307)),
+        Platform(pygame.Surface((100, 20)), (150, 290)),
+    )
+    contact = index.nearest_contact(rect)
+
+    if top is None:
+        assert contact is None
+    else:
+        assert contact.rect.top == top
@@ -1,5 +1,9 @@
 """
 This module contains unit tests for the classes in controller.py
+
+Not tested:
+    filter_events: changes which events pygame queues for the whole
+        process, so is left to the game
 """
 
 import pygame
@@ -126,3 +130,108 @@ def test_controller_updates(keystroke, x_move, y_move):
     # Check the correct value result
     assert x_move_result == x_move
     assert y_move_result == y_move
+
+
+def test_f3_toggles_profile():
+    """
+    Checks that pressing F3 shows the frame timing overlay and pressing it
+    again hides it.
+
+    Args:
+        none
+    """
+    pygame.init()
+    instance = Controller(None)
+    press = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_F3})
+
+    assert not instance.show_profile
+    pygame.event.post(press)
+    instance.update_game()
+    assert instance.show_profile
+    pygame.event.post(press)
+    instance.update_game()
+    assert not instance.show_profile
+
+
+def test_dispatch_given_events():
+    """
+    Checks that events can be passed in directly, that events without a
+    handler are ignored and that a key released after the other direction
+    was pressed does not stop the player.
+
+    Args:
+        none
+    """
+    instance = Controller(None)
+    instance.update_game(
+        [
+            pygame.event.Event(pygame.MOUSEMOTION, {"pos": (0, 0)}),
+            pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_a}),
+            pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_LEFT}),
+            pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_RIGHT}),
+            pygame.event.Event(pygame.KEYUP, {"key": pygame.K_LEFT}),
+        ]
+    )
+
+    assert instance.left_right == 0.5
+    assert not instance.jumping
+
+
+def test_consume_inputs(monkeypatch):
+    """
+    Checks that each movement key event is reported once, with the time
+    from it being handled to the inputs being consumed.
+
+    Args:
+        monkeypatch: pytest fixture used to control the clock
+    """
+    clock = [10.0]
+    monkeypatch.setattr("controller.time.perf_counter", lambda: clock[0])
+    instance = Controller(None)
+    instance.update_game(
+        [pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_SPACE})]
+    )
+    clock[0] += 0.01
+    instance.update_game(
+        [
+            pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_RIGHT}),
+            pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_F3}),
+        ]
+    )
+    clock[0] += 0.005
+
+    assert instance.consume_inputs() == pytest.approx([0.015, 0.005])
+    assert not instance.consume_inputs()
+
+
+def test_pause_toggle():
+    """
+    Checks that P pauses the game, keys released while paused still stop
+    the player and Escape unpauses it.
+
+    Args:
+        none
+    """
+    instance = Controller(None)
+    instance.update_game(
+        [
+            pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_RIGHT}),
+            pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_p}),
+        ]
+    )
+    assert instance.paused
+
+    instance.update_paused(
+        [
+            pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_LEFT}),
+            pygame.event.Event(pygame.KEYUP, {"key": pygame.K_RIGHT}),
+        ]
+    )
+    assert instance.paused
+    assert instance.left_right == 0.0
+
+    instance.update_paused(
+        [pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_ESCAPE})]
+    )
+    assert not instance.paused
+    assert not instance.consume_inputs()
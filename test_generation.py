@@ -0,0 +1,152 @@
+"""
+This module contains unit tests for the functions in generation.py.
+
+Not tested:
+    jump_envelope: same formulas as the Model's platform tests check
+    round_half_away: covered by the batch tests matching the Model
+"""
+
+import random
+import numpy as np
+import pygame
+import pytest
+from generation import landing_intervals, next_platform_rects
+from generation import sample_x_landing
+from model import Model
+from platforms import Platform
+
+
+# Test cases
+
+landing_ranges = [
+    # Easy, medium and hard ranges that fit on screen
+    (20, 380, 0.5),
+    (20, 380, 0.75),
+    (20, 380, 1),
+    # Ranges clamped to one side of the screen
+    (0, 150, 0.5),
+    (250, 400, 0.75),
+    # A range so small the excluded band is empty
+    (100, 102, 0.5),
+    # A single value
+    (100, 101, 1),
+]
+
+generation_difficulties = [0.5, 0.75, 1]
+
+
+def candidates(max_left, max_right, difficulty):
+    """
+    Lists every landing point the same way the Model used to, with a
+    list of every candidate
+
+    Args:
+        max_left: int that represents the maximum left x point
+        max_right: int that represents the maximum right x point
+        difficulty: float indicating the difficulty of the game
+
+    Returns:
+        A list of ints of every allowed landing point
+    """
+    full_range = max_right - max_left
+    minimum_left_x = int(max_left + (full_range / 2) * (1 - difficulty)) + 1
+    minimum_right_x = int(max_right - (full_range / 2) * (1 - difficulty)) - 1
+    return [
+        i
+        for i in range(max_left, max_right)
+        if i not in range(minimum_left_x, minimum_right_x)
+    ]
+
+
+@pytest.mark.parametrize("max_left,max_right,difficulty", landing_ranges)
+def test_landing_intervals(max_left, max_right, difficulty):
+    """
+    Checks that the landing intervals contain exactly the candidates the
+    list based landing calculation allowed.
+
+    Args:
+        max_left: int that represents the maximum left x point
+        max_right: int that represents the maximum right x point
+        difficulty: float indicating the difficulty of the game
+    """
+    allowed = []
+    for start, stop in landing_intervals(max_left, max_right, difficulty):
+        allowed.extend(range(start, stop))
+
+    assert allowed == candidates(max_left, max_right, difficulty)
+
+
+@pytest.mark.parametrize("max_left,max_right,difficulty", landing_ranges)
+def test_sample_x_landing_matches_choice(max_left, max_right, difficulty):
+    """
+    Checks that a seeded sample picks the same landing point as choosing
+    from the list of every candidate with the same seed.
+
+    Args:
+        max_left: int that represents the maximum left x point
+        max_right: int that represents the maximum right x point
+        difficulty: float indicating the difficulty of the game
+    """
+    sample_rng = random.Random(5)
+    choice_rng = random.Random(5)
+    for _ in range(50):
+        assert sample_x_landing(
+            sample_rng, max_left, max_right, difficulty
+        ) == choice_rng.choice(candidates(max_left, max_right, difficulty))
+
+
+def test_sample_x_landing_empty():
+    """
+    Checks that sampling from an empty range raises the same error as
+    choosing from an empty list.
+
+    Args:
+        none
+    """
+    with pytest.raises(IndexError):
+        sample_x_landing(random.Random(), 100, 100, 0.5)
+
+
+@pytest.mark.parametrize("difficulty", generation_difficulties)
+def test_next_platform_rects_matches_model(difficulty):
+    """
+    Checks that platforms generated in one vectorized call have the same
+    heights and widths, and a similar spread of horizontal positions, as
+    platforms the Model generates one at a time.
+
+    Args:
+        difficulty: float indicating the difficulty of the game
+    """
+    samples = 3000
+    model_rects = []
+    for seed in range(samples):
+        platforms = pygame.sprite.Group()
+        platforms.add(
+            Platform(surf=pygame.Surface((200, 20)), center=(200, 445))
+        )
+        model = Model(platforms, 400, 450, headless=True, seed=seed)
+        model.set_difficulty(difficulty)
+        model._platform_num = 2  # pylint: disable=protected-access
+        model.platform_generation()
+        rect = model.platforms.sprites()[1].rect
+        model_rects.append((rect.left, rect.top, rect.width, rect.height))
+    model_rects = np.array(model_rects)
+
+    rects = next_platform_rects(
+        np.random.default_rng(11),
+        [(100, 435, 200, 20)] * samples,
+        difficulty,
+        400,
+        35,
+        (0.35, -10),
+    )
+
+    for column in (1, 2, 3):
+        assert set(rects[:, column]) == set(model_rects[:, column])
+    # Total variation distance between histograms of the left edges
+    bins = np.arange(0, 420, 20)
+    histogram = np.histogram(rects[:, 0], bins)[0] / samples
+    model_histogram = np.histogram(model_rects[:, 0], bins)[0] / samples
+    assert np.abs(histogram - model_histogram).sum() / 2 < 0.05
+    assert rects[:, 0].min() >= 0
+    assert (rects[:, 0] + rects[:, 2]).max() <= 400
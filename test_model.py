@@ -6,18 +6,18 @@ Not tested:
         update: uses built in pygames functions and other tested functions,
             uneccessary to test
         set_difficulty: setter function, uneccessary to test
-    Platform:
-        set_rect: setter function, uneccessary to test
     Player:
         update: runs built in pygame function, uneccessary to test
         set_position: setter function, uneccessary to test
         set_velocity: setter function, uneccessary to test
+        state: getter function, uneccessary to test
 """
 
 import math
 import pygame
 import pytest
-from model import Model, Player, Platform
+from model import Model, Player
+from platforms import Platform
 
 pygame.init()
 VECTOR = pygame.math.Vector2
@@ -422,3 +422,130 @@ def test_move(x_accel, jumping, on_platform, out_position):
     exp_position = instance.position
 
     assert exp_position == out_position
+
+
+@pytest.mark.parametrize("jumping,out_velocity", [(False, 0), (True, -10)])
+def test_land(jumping, out_velocity):
+    """
+    Checks that landing stands the player on the platform top, jumping off
+    it if the player is jumping, without changing the gravity given to
+    the player.
+
+    Args:
+        jumping: A bool representing if the character is jumping or not
+        out_velocity: A float representing the expected y velocity
+    """
+    gravity = VECTOR(0, 0.35)
+    instance = Player(gravity, 0.12, headless=True)
+    instance.move(0.5)
+    instance.land(400, jumping)
+
+    assert instance.position.y == 400 - instance.rect.height / 2
+    assert instance.velocity == [0.5, out_velocity]
+    assert gravity == [0, 0.35]
+
+
+def test_added_platform_collides():
+    """
+    Checks that a platform added to the model's platforms after the model
+    is created is landed on like the platforms it started with.
+
+    Args:
+        none
+    """
+    instance = Model(pygame.sprite.Group(), 400, 450, headless=True)
+    instance.platforms.add(
+        Platform(surf=pygame.Surface((100, 15)), center=(200, 307))
+    )
+    player = instance.player
+    player.set_position(VECTOR(200, 300 - player.rect.height / 2))
+    player.set_velocity(VECTOR(0, 0))
+    player.update()
+    instance.update(0, False)
+
+    assert player.velocity.y == 0
+    assert player.position.y == 300 - player.rect.height / 2
+
+
+def test_seeded_platform_generation():
+    """
+    Checks that two models with the same seed generate the same platforms
+    and that a different seed generates different platforms.
+
+    Args:
+        none
+    """
+    rects = []
+    for seed in (3, 3, 4):
+        platforms = pygame.sprite.Group()
+        platforms.add(
+            Platform(surf=pygame.Surface((200, 20)), center=(200, 445))
+        )
+        instance = Model(platforms, 400, 450, headless=True, seed=seed)
+        instance.platform_generation()
+        rects.append([platform.rect for platform in instance.platforms])
+
+    assert rects[0] == rects[1]
+    assert rects[0] != rects[2]
+
+
+def test_platform_generation_lookahead():
+    """
+    Checks that with a lookahead set, platforms are generated until the
+    highest one is at least the lookahead above the screen, and that the
+    number of platforms stays the same as the screen scrolls.
+
+    Args:
+        none
+    """
+    platforms = pygame.sprite.Group()
+    platforms.add(Platform(surf=pygame.Surface((200, 20)), center=(200, 445)))
+    instance = Model(platforms, 400, 450, headless=True, seed=1)
+    instance.set_lookahead(300)
+    instance.platform_generation()
+    highest = instance.platforms.sprites()[-1]
+    below_highest = instance.platforms.sprites()[-2]
+
+    assert highest.rect.top <= -300 < below_highest.rect.top
+
+    counts = set()
+    instance.player.set_velocity(VECTOR(0, -10))
+    for _ in range(500):
+        instance.player.set_position(VECTOR(200, 100 - instance.camera_offset))
+        instance.player.update()
+        instance.scroll()
+        instance.platform_generation()
+        counts.add(len(instance.platforms))
+
+    highest = instance.platforms.sprites()[-1]
+    assert highest.rect.top + instance.camera_offset <= -300
+    assert max(counts) - min(counts) <= 2
+
+
+def test_platform_generation_budget():
+    """
+    Checks that with a budget, refilling is spread over several calls,
+    except that platforms are always generated up to the minimum
+    lookahead above the screen.
+
+    Args:
+        none
+    """
+    platforms = pygame.sprite.Group()
+    platforms.add(Platform(surf=pygame.Surface((200, 20)), center=(200, 445)))
+    instance = Model(platforms, 400, 450, headless=True, seed=1)
+    instance.set_generation_budget(2, min_lookahead=100)
+    instance.platform_generation()
+    first = instance.generated
+    highest = instance.platforms.sprites()[-1]
+
+    assert first > 2
+    assert highest.rect.top < -100
+    assert len(instance.platforms) < 30
+
+    made = []
+    while len(instance.platforms) < 30:
+        instance.platform_generation()
+        made.append(instance.generated)
+    assert set(made) <= {1, 2}
+    assert first + sum(made) == 29
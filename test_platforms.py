@@ -0,0 +1,57 @@
+"""
+This module contains unit tests for the PlatformPool class in
+platforms.py.
+
+Not tested:
+    Platform:
+        set_rect: setter function, uneccessary to test
+        reset: setter function, covered by the PlatformPool tests
+"""
+
+import pygame
+from platforms import PlatformPool
+
+
+# Test cases
+
+
+def test_platform_pool_shares_surfaces():
+    """
+    Checks that platforms of the same size share one filled surface and
+    platforms of different sizes do not.
+
+    Args:
+        none
+    """
+    pool = PlatformPool()
+    first = pool.acquire((60, 15), (100, 100))
+    second = pool.acquire((60, 15), (200, 200))
+    third = pool.acquire((70, 15), (300, 300))
+
+    assert first is not second
+    assert first.surf is second.surf
+    assert first.surf is not third.surf
+    assert first.surf.get_at((0, 0)) == (128, 128, 128, 255)
+
+
+def test_platform_pool_reuses_platforms():
+    """
+    Checks that a released platform is removed from its groups and reused
+    at its new size and location.
+
+    Args:
+        none
+    """
+    pool = PlatformPool()
+    platform = pool.acquire((60, 15), (100, 100))
+    group = pygame.sprite.Group(platform)
+    pool.release(platform)
+
+    assert len(group) == 0
+    assert len(pool) == 1
+
+    reused = pool.acquire((80, 15), (200, 300.5))
+
+    assert reused is platform
+    assert len(pool) == 0
+    assert reused.rect == pygame.Surface((80, 15)).get_rect(center=(200, 300.5))
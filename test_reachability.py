@@ -0,0 +1,134 @@
+"""
+This module contains unit tests for the ReachabilityChecker class and
+functions in reachability.py.
+
+Not tested:
+    ReachabilityChecker:
+        landing_frames: used by check, covered by the witness tests
+        inputs: used to replay witnesses in the witness tests
+    unreachable_platforms: wraps check over many seeds, covered by the
+        easy difficulty test
+"""
+
+import numpy as np
+import pygame
+import pytest
+from model import Model
+from platforms import Platform
+from reachability import ReachabilityChecker, level_edges
+from reachability import unreachable_platforms
+
+
+# Test cases
+
+checker = ReachabilityChecker()
+
+witness_levels = [
+    (seed, difficulty) for seed in range(3) for difficulty in (0.5, 1)
+]
+
+reachable_cases = [
+    # Directly above, within a jump
+    ([150, 400, 100, 15], [150, 280, 100, 15], True),
+    # Directly above, higher than a jump
+    ([150, 400, 100, 15], [150, 240, 100, 15], False),
+    # To the side and a little above
+    ([150, 400, 100, 15], [0, 300, 30, 15], True),
+]
+
+
+def land_witness(source, target, candidate, takeoff_x):
+    """
+    Plays a witness jump in a Model holding only the source and target
+    platforms.
+
+    Args:
+        source: A sequence of the left, top, width and height of the
+            platform jumped from
+        target: A sequence of the platform to land on
+        candidate: An int representing the candidate index of the jump
+        takeoff_x: A float representing the x position of the takeoff
+
+    Returns:
+        A tuple of the string "target", "source" or "off" describing how
+        the jump ended and the int frame it ended on
+    """
+    platforms = pygame.sprite.Group()
+    for left, top, width, height in (source, target):
+        platform = Platform(pygame.Surface((int(width), int(height))), (0, 0))
+        platform.rect.topleft = (int(left), int(top))
+        platforms.add(platform)
+    model = Model(platforms, 400, 450, headless=True)
+    speed, inputs = checker.inputs(candidate)
+    player = model.player
+    player.set_position(pygame.math.Vector2(takeoff_x, source[1] - 26.5))
+    player.set_velocity(pygame.math.Vector2(speed, -10))
+    player.update()
+    for frame, left_right in enumerate(inputs, 1):
+        model.update(left_right, False)
+        if not 0 <= player.position.x <= 400:
+            return "off", frame
+        if player.velocity.y == 0:
+            landed_on = player.position.y == target[1] - 26.5
+            return ("target" if landed_on else "source"), frame
+    return "off", None
+
+
+@pytest.mark.parametrize("seed,difficulty", witness_levels)
+def test_witness_lands(seed, difficulty):
+    """
+    Checks that the jump found for each generated platform lands on it in
+    the game on the predicted frame.
+
+    Args:
+        seed: An int used to seed platform generation
+        difficulty: float indicating the difficulty of the game
+    """
+    sources, targets = level_edges(seed, difficulty, 15)
+    reachable, witness = checker.check(sources, targets)
+    for index in np.flatnonzero(reachable):
+        candidate, takeoff_x, frame = witness[index]
+        assert land_witness(
+            sources[index], targets[index], int(candidate), takeoff_x
+        ) == ("target", int(frame))
+
+
+@pytest.mark.parametrize("source,target,expected", reachable_cases)
+def test_check(source, target, expected):
+    """
+    Checks that targets within reach are found and targets out of reach
+    are not.
+
+    Args:
+        source: A list of the left, top, width and height of the platform
+            jumped from
+        target: A list of the platform to land on
+        expected: A bool representing if the target can be reached
+    """
+    reachable, witness = checker.check([source], [target])
+    assert reachable[0] == expected
+    assert np.isnan(witness[0]).all() != expected
+
+
+def test_check_empty():
+    """
+    Checks that checking no platforms gives empty results.
+
+    Args:
+        none
+    """
+    reachable, witness = checker.check(np.zeros((0, 4)), np.zeros((0, 4)))
+    assert reachable.shape == (0,)
+    assert witness.shape == (0, 3)
+
+
+def test_easy_levels_reachable():
+    """
+    Checks that every generated platform can be reached on easy.
+
+    Args:
+        none
+    """
+    checked, unreachable = unreachable_platforms(checker, range(20), 0.5, 30)
+    assert checked == 600
+    assert not unreachable
@@ -0,0 +1,70 @@
+"""
+This module contains unit tests for the InputRecorder class and replay
+function in replay.py.
+
+Not tested:
+    InputRecorder:
+        seed, difficulty, runs: getter functions, uneccessary to test
+"""
+
+import random
+import pytest
+from replay import InputRecorder, replay
+from simulation import Simulation
+
+
+# Test cases
+
+replay_difficulties = [0.5, 0.75, 1]
+
+
+def test_run_length_encoding():
+    """
+    Checks that repeated inputs are stored as one run and read back in
+    order.
+
+    Args:
+        none
+    """
+    recorder = InputRecorder(1, 0.5)
+    inputs = [(0.0, False)] * 3 + [(0.5, True)] * 2 + [(0.0, False)]
+    for left_right, jumping in inputs:
+        recorder.record(left_right, jumping)
+
+    assert recorder.runs == [[0.0, False, 3], [0.5, True, 2], [0.0, False, 1]]
+    assert recorder.frames == 6
+    assert list(recorder.inputs()) == inputs
+
+
+@pytest.mark.parametrize("difficulty", replay_difficulties)
+def test_replay_reproduces_session(difficulty, tmp_path):
+    """
+    Checks that replaying a saved recording ends in exactly the same
+    state as the recorded session.
+
+    Args:
+        difficulty: float indicating the difficulty of the game
+        tmp_path: pytest fixture of a temporary directory to save to
+    """
+    rng = random.Random(difficulty)
+    simulation = Simulation(400, 450, difficulty, seed=7)
+    recorder = InputRecorder(7, difficulty)
+    left_right, jumping = 0.0, False
+    while not simulation.finished and simulation.frames < 1500:
+        if rng.random() < 0.05:
+            left_right = rng.choice((-0.5, 0.0, 0.5))
+            jumping = rng.random() < 0.8
+        recorder.record(left_right, jumping)
+        simulation.step(left_right, jumping)
+    recorder.save(tmp_path / "session.json")
+
+    replayed = replay(InputRecorder.load(tmp_path / "session.json"))
+
+    assert replayed.frames == simulation.frames
+    assert replayed.timer == simulation.timer
+    assert replayed.model.score == simulation.model.score
+    assert replayed.model.camera_offset == simulation.model.camera_offset
+    assert replayed.model.player.position == simulation.model.player.position
+    assert [platform.rect for platform in replayed.model.platforms] == [
+        platform.rect for platform in simulation.model.platforms
+    ]
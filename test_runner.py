@@ -0,0 +1,76 @@
+"""
+This module contains unit tests for the functions and RunningStats class
+in runner.py.
+
+Not tested:
+    idle, random_inputs: scripted controllers, run by the episode tests
+    RunningStats:
+        count, mean, minimum, maximum: getter functions, checked by the
+            statistics test
+"""
+
+import statistics
+import pytest
+from runner import RunningStats, climb, run_episode, run_episodes
+from runner import summarize
+from simulation import Simulation
+
+
+# Test cases
+
+episode_tasks = [
+    (seed, difficulty, controller)
+    for seed in range(2)
+    for difficulty in (0.5, 1)
+    for controller in ("climb", "random")
+]
+
+
+def test_running_stats():
+    """
+    Checks that statistics kept as values arrive match the statistics of
+    all the values at once.
+
+    Args:
+        none
+    """
+    values = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.stdev == pytest.approx(statistics.stdev(values))
+    assert (stats.minimum, stats.maximum) == (1, 9)
+
+
+def test_climb_scores():
+    """
+    Checks that the climbing controller keeps the player climbing on easy.
+
+    Args:
+        none
+    """
+    simulation = Simulation(400, 450, difficulty=0.5, seed=1)
+    simulation.run(climb, max_frames=600)
+
+    assert simulation.model.score > 0
+
+
+def test_pool_matches_sequential():
+    """
+    Checks that episodes run across processes end the same way as when
+    run one after another, and are all summarized.
+
+    Args:
+        none
+    """
+    expected = {task: run_episode(task)[3:5] for task in episode_tasks}
+    results = list(run_episodes(episode_tasks, processes=2, chunksize=1))
+
+    assert {result[:3]: result[3:5] for result in results} == expected
+    summary = summarize(results)
+    assert sum(group["score"].count for group in summary.values()) == len(
+        episode_tasks
+    )
@@ -0,0 +1,194 @@
+"""
+This module contains unit tests for the Simulation class in simulation.py
+and the headless mode of the Model.
+
+Not tested:
+    Simulation:
+        model, timer, frames: getter functions, uneccessary to test
+"""
+
+import pygame
+import pytest
+from model import Model, Player
+from runner import climb
+from simulation import Simulation
+
+VECTOR = pygame.math.Vector2
+
+
+# Test cases
+
+simulation_policies = [
+    # Standing still on the ground lasts until the fuel runs out
+    (lambda model: (0.0, False), 60 * 60, False),
+    # Holding left walks off the ground and falls off the screen early
+    (lambda model: (-0.5, False), None, True),
+]
+
+
+def test_headless_model_without_io(monkeypatch):
+    """
+    Checks that a headless Model can be built and stepped without loading
+    any sounds or images.
+
+    Args:
+        monkeypatch: pytest fixture used to make sound and image loading
+            fail if they are called.
+    """
+
+    def fail(*args):
+        raise AssertionError(f"loaded {args} while headless")
+
+    monkeypatch.setattr(pygame.mixer, "Sound", fail)
+    monkeypatch.setattr(pygame.image, "load", fail)
+    instance = Model(pygame.sprite.Group(), 400, 450, headless=True)
+    instance.update(0.5, False)
+    instance.check_player_off_screen()
+
+    assert not instance.game_over
+
+
+def test_headless_player_matches_sprite_size():
+    """
+    Checks that the blank headless player surface has the same hitbox as
+    the player loaded from the sprite image.
+
+    Args:
+        none
+    """
+    headless = Player(VECTOR(0, 0.35), 0.12, headless=True)
+    loaded = Player(VECTOR(0, 0.35), 0.12)
+
+    assert headless.rect == loaded.rect
+
+
+@pytest.mark.parametrize("policy,frames,game_over", simulation_policies)
+def test_run(policy, frames, game_over):
+    """
+    Checks that running a session steps until the player either runs out
+    of fuel or leaves the screen.
+
+    Args:
+        policy: A function returning the input for each frame.
+        frames: An int representing the expected number of frames, or None
+            if the session should end before the timer.
+        game_over: A bool representing if the player should have left the
+            screen.
+    """
+    instance = Simulation(400, 450)
+    stepped = instance.run(policy)
+
+    assert instance.finished
+    assert instance.model.game_over == game_over
+    assert stepped == instance.frames
+    if frames is None:
+        assert stepped < 60 * 60
+    else:
+        assert stepped == frames
+        assert instance.timer == 0
+
+
+def test_scroll():
+    """
+    Checks that the screen only scrolls when the player is in the top
+    third of the screen, and that scrolling moves the camera instead of
+    the player and platforms.
+
+    Args:
+        none
+    """
+    instance = Simulation(400, 450)
+    model = instance.model
+    model.platform_generation()
+    assert not model.scroll()
+
+    model.player.set_position(VECTOR(200, 100))
+    model.player.set_velocity(VECTOR(0, -5))
+    model.player.update()
+    rects = [platform.rect.copy() for platform in model.platforms]
+    assert model.scroll()
+
+    assert model.camera_offset == 5
+    assert model.player.position.y == 100
+    assert [platform.rect for platform in model.platforms] == rects
+
+
+def test_scroll_removes_platforms_below_screen():
+    """
+    Checks that platforms are removed once the camera has scrolled past
+    them, and that the player is off screen below the scrolled view.
+
+    Args:
+        none
+    """
+    instance = Simulation(400, 450)
+    model = instance.model
+    model.platform_generation()
+    model.player.set_velocity(VECTOR(0, -20))
+    while model.camera_offset < 300:
+        model.player.set_position(VECTOR(200, 100 - model.camera_offset))
+        model.player.update()
+        model.scroll()
+
+    screen_bottom = 450 - model.camera_offset
+    assert all(p.rect.top < screen_bottom for p in model.platforms)
+    model.player.set_position(VECTOR(200, screen_bottom + 1))
+    model.check_player_off_screen()
+    assert model.game_over
+
+
+def test_interpolate_between_steps():
+    """
+    Checks that interpolating blends from the state before the last step
+    to the state after it.
+
+    Args:
+        none
+    """
+    instance = Simulation(400, 450, seed=3)
+    for _ in range(40):
+        instance.step(0.5, True)
+    model = instance.model
+    before = VECTOR(model.player.position)
+    before_offset = model.camera_offset
+    instance.step(0.5, True)
+
+    position, camera_offset = model.interpolate(0)
+    assert position == before
+    assert camera_offset == before_offset
+    position, camera_offset = model.interpolate(1)
+    assert position == model.player.position
+    assert camera_offset == model.camera_offset
+    position, _ = model.interpolate(0.5)
+    assert position == before.lerp(model.player.position, 0.5)
+
+
+@pytest.mark.parametrize("seed", [1, 7])
+def test_background_generation_matches(seed):
+    """
+    Checks that computing platforms on a background thread generates the
+    same platforms, and so the same session, as computing them when
+    needed.
+
+    Args:
+        seed: An int used to seed platform generation
+    """
+    sessions = []
+    for background in (False, True):
+        simulation = Simulation(400, 450, difficulty=0.5, seed=seed)
+        simulation.model.set_background_generation(background)
+        simulation.run(climb, max_frames=1500)
+        simulation.model.stop_generation()
+        sessions.append(
+            (
+                simulation.model.score,
+                simulation.model.player.position,
+                [
+                    tuple(platform.rect)
+                    for platform in simulation.model.platforms
+                ],
+            )
+        )
+
+    assert sessions[0][0] > 0
+    assert sessions[0] == sessions[1]
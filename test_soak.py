@@ -0,0 +1,88 @@
+"""
+This module contains a soak test that runs a long headless session with
+the view drawing offscreen, checking memory held stops growing once the
+session has warmed up, and unit tests for the AllocationTracker class in
+memory.py.
+
+Not tested:
+    AllocationTracker:
+        stop, report, traced_growth: used by the soak test
+"""
+
+import pygame
+from memory import AllocationTracker
+from runner import climb
+from simulation import Simulation
+from view import View
+
+
+# Test cases
+
+WARM_UP_FRAMES = 1000
+SOAK_FRAMES = 2500
+# Bytes held memory may change by over SOAK_FRAMES once warmed up. A leak
+# of 8 bytes a frame would go over it.
+ALLOWED_GROWTH = 16 * 1024
+
+
+def test_steady_state_memory():
+    """
+    Checks that memory held does not grow over thousands of frames of
+    play, once platforms, pools and caches have filled up. Frames are
+    drawn offscreen so the view's text and sprite caches are included.
+
+    Args:
+        none
+    """
+    # A high frame rate gives a session long enough to soak
+    simulation = Simulation(400, 450, difficulty=0.5, fps=1000, seed=1)
+    view = View(simulation.model)
+    surface = pygame.Surface((400, 450))
+    tracker = AllocationTracker(interval=SOAK_FRAMES)
+
+    def frame():
+        simulation.step(*climb(simulation.model))
+        view.draw_game(surface)
+        view.draw_score(surface)
+        view.draw_timer(format(simulation.time_left, ".2f"), surface)
+        view.dirty_rects()
+
+    for _ in range(WARM_UP_FRAMES):
+        frame()
+    tracker.start()
+    try:
+        # The first interval settles allocations left from warming up
+        for _ in range(2 * SOAK_FRAMES):
+            frame()
+            tracker.end_frame()
+    finally:
+        tracker.stop()
+
+    assert not simulation.finished
+    assert simulation.model.score > 0
+    assert tracker.traced_growth < ALLOWED_GROWTH, tracker.format_report()
+
+
+def test_tracker_finds_growth():
+    """
+    Checks that memory kept every frame is reported against the line that
+    allocated it.
+
+    Args:
+        none
+    """
+    kept = []
+    tracker = AllocationTracker(interval=100, top=3)
+    tracker.start()
+    try:
+        for _ in range(100):
+            kept.append(bytearray(1000))
+            assert tracker.end_frame() == (len(kept) == 100)
+    finally:
+        tracker.stop()
+
+    location, size, count = tracker.report[0]
+    assert location.rsplit(":", 1)[0].endswith("test_soak.py")
+    assert size >= 1000
+    assert count >= 1
+    assert tracker.traced_growth >= 100 * 1000
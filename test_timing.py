@@ -0,0 +1,140 @@
+"""
+This module contains unit tests for the FrameProfiler class and functions
+in timing.py.
+
+Not tested:
+    FrameProfiler:
+        enabled, report: getter functions, uneccessary to test
+"""
+
+import pytest
+from timing import PHASES, FrameProfiler, percentile
+
+
+# Test cases
+
+percentiles = [
+    # Nearest rank of 1 to 100
+    (list(range(1, 101)), 50, 50),
+    (list(range(1, 101)), 99, 99),
+    # Order of the values does not matter
+    ([5, 1, 4, 2, 3], 50, 3),
+    # With few values the 99th percentile is the largest
+    ([5, 1, 4, 2, 3], 99, 5),
+    ([7], 50, 7),
+]
+
+
+@pytest.mark.parametrize("values,percent,expected", percentiles)
+def test_percentile(values, percent, expected):
+    """
+    Checks that percentiles use the nearest rank.
+
+    Args:
+        values: A list of numbers
+        percent: A float representing the percentile
+        expected: The expected percentile value
+    """
+    assert percentile(values, percent) == expected
+
+
+def test_disabled_profiler_records_nothing():
+    """
+    Checks that no frames are recorded until timing is enabled.
+
+    Args:
+        none
+    """
+    profiler = FrameProfiler()
+    profiler.start_frame()
+    profiler.mark("events")
+    profiler.end_frame()
+
+    assert profiler.report is None
+
+
+def test_ring_buffer_and_report(monkeypatch):
+    """
+    Checks that marks add time to their phase, only the most recent frames
+    are kept, and the report is only updated every refresh frames.
+
+    Args:
+        monkeypatch: pytest fixture used to control the clock
+    """
+    clock = [0.0]
+    monkeypatch.setattr("timing.time.perf_counter", lambda: clock[0])
+    profiler = FrameProfiler(size=4, refresh=2)
+    profiler.set_enabled(True)
+
+    def frame(update_seconds):
+        profiler.start_frame()
+        for _ in range(2):
+            clock[0] += update_seconds
+            profiler.mark("update")
+        clock[0] += 0.001
+        profiler.mark("draw")
+        profiler.end_frame()
+
+    frame(0.1)
+    first = profiler.report
+    assert first["update"] == pytest.approx((0.2, 0.2))
+    assert first["total"] == pytest.approx((0.201, 0.201))
+    assert first["events"] == (0.0, 0.0)
+    assert set(first) == set(PHASES) | {"total"}
+
+    frame(0.2)
+    assert profiler.report is first
+    frame(0.2)
+    assert profiler.report["update"] == pytest.approx((0.4, 0.4))
+    for _ in range(4):
+        frame(0.3)
+    # The first three frames have been dropped from the buffer
+    assert profiler.report["update"] == pytest.approx((0.6, 0.6))
+
+
+def test_input_latency_report():
+    """
+    Checks that input latencies are only kept while timing is enabled and
+    are added to the report as "input".
+
+    Args:
+        none
+    """
+    profiler = FrameProfiler(refresh=1)
+    profiler.add_latency(1.0)
+    profiler.set_enabled(True)
+    profiler.start_frame()
+    profiler.end_frame()
+    assert "input" not in profiler.report
+
+    for seconds in (0.004, 0.001, 0.002):
+        profiler.add_latency(seconds)
+    profiler.start_frame()
+    profiler.end_frame()
+    assert profiler.report["input"] == (0.002, 0.004)
+
+
+def test_counts_report():
+    """
+    Checks that counts added over a frame are summed, counts are only
+    reported once added and later frames with nothing counted count as
+    zero.
+
+    Args:
+        none
+    """
+    profiler = FrameProfiler(refresh=1)
+    profiler.set_enabled(True)
+    profiler.start_frame()
+    profiler.end_frame()
+    assert "platforms" not in profiler.report
+
+    profiler.start_frame()
+    profiler.add_count("platforms", 1)
+    profiler.add_count("platforms", 2)
+    profiler.end_frame()
+    assert profiler.report["platforms"] == (3, 3)
+
+    profiler.start_frame()
+    profiler.end_frame()
+    assert profiler.report["platforms"] == (0, 3)
@@ -0,0 +1,173 @@
+"""
+This module contains unit tests for the View, CachedText and GlyphAtlas
+classes in view.py, drawing offscreen.
+
+Not tested:
+    View:
+        draw_menu, draw_game_over, draw_profile: draw whole screens that
+            are checked by eye
+    GlyphAtlas:
+        size: used by draw
+"""
+
+import random
+import pygame
+import pytest
+from assets import ASSETS
+from runner import climb
+from simulation import Simulation
+from view import FONT_PATH, FONT_SIZE, CachedText, GlyphAtlas, View
+
+pygame.init()
+WHITE = (255, 255, 255)
+
+
+# Test cases
+
+font = ASSETS.font(FONT_PATH, FONT_SIZE)
+
+atlas_strings = [
+    # Timer values, including a timer that has run out
+    "59.98",
+    "0.00",
+    "-0.02",
+    # Score strings, with characters the atlas renders when first used
+    "SCORE: 0",
+    "SCORE: 1234567890",
+]
+
+
+class CountingFont(pygame.font.Font):
+    """
+    A font that counts how many times text is rendered with it.
+
+    Attributes:
+        renders: An int representing the number of renders
+    """
+
+    def __init__(self, path, size):
+        """
+        Loads the font with the count at zero.
+
+        Args:
+            path: A string representing the path of the font file
+            size: An int representing the font size
+        """
+        super().__init__(path, size)
+        self.renders = 0
+
+    def render(self, *args, **kwargs):
+        """
+        Renders text like pygame.font.Font.render, counting the render
+
+        Args:
+            args: Positional arguments passed to pygame.font.Font.render
+            kwargs: Keyword arguments passed to pygame.font.Font.render
+
+        Returns:
+            A pygame.Surface() of the rendered text
+        """
+        self.renders += 1
+        return super().render(*args, **kwargs)
+
+
+@pytest.mark.parametrize("text", atlas_strings)
+def test_atlas_matches_font(text):
+    """
+    Checks that text drawn from the atlas covers the same area and has
+    the same pixels as the text rendered whole by the font.
+
+    Args:
+        text: A string to draw
+    """
+    atlas = GlyphAtlas(font, "0123456789.-", WHITE)
+    from_atlas = pygame.Surface((400, 100))
+    drawn = atlas.draw(from_atlas, text, center=(200, 50))
+
+    rendered = font.render(text, True, WHITE)
+    from_font = pygame.Surface((400, 100))
+    blitted = from_font.blit(rendered, rendered.get_rect(center=(200, 50)))
+
+    assert drawn == blitted
+    assert pygame.image.tobytes(from_atlas, "RGB") == pygame.image.tobytes(
+        from_font, "RGB"
+    )
+
+
+def test_cached_text_renders_on_change():
+    """
+    Checks that text is only rendered again when the value changes, and
+    that the same surface is returned while it does not.
+
+    Args:
+        none
+    """
+    counting_font = CountingFont(FONT_PATH, FONT_SIZE)
+    text = CachedText(counting_font, WHITE)
+
+    first = text.render(10, "SCORE: {}")
+    assert text.render(10, "SCORE: {}") is first
+    assert counting_font.renders == 1
+
+    second = text.render(20, "SCORE: {}")
+    assert second is not first
+    assert counting_font.renders == 2
+    assert text.render(20, "SCORE: {}") is second
+    assert counting_font.renders == 2
+    assert pygame.image.tobytes(second, "RGB") == pygame.image.tobytes(
+        font.render("SCORE: 20", True, WHITE), "RGB"
+    )
+
+
+def test_dirty_rendering_matches_full_redraw(monkeypatch):
+    """
+    Checks that a view redrawing only what changed leaves the screen the
+    same as a view redrawing everything, every frame of a session that
+    scrolls and is paused and resumed.
+
+    Args:
+        monkeypatch: The pytest fixture used to fix the animation clock
+    """
+    frame = 0
+    # Both views must pick the same flame frame
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: frame * 16)
+    simulation = Simulation(400, 450, seed=2)
+    model = simulation.model
+    full_view = View(model)
+    dirty_view = View(model, dirty_rendering=True)
+    full_screen = pygame.Surface((400, 450))
+    dirty_screen = pygame.Surface((400, 450))
+    moves = random.Random(1)
+    partial_frames = 0
+
+    for frame in range(1500):
+        x_acceleration, jumping = climb(model)
+        # Wander off the climbing path now and then
+        if moves.random() < 0.3:
+            x_acceleration = moves.choice((-0.5, 0, 0.5))
+        simulation.step(x_acceleration, jumping)
+        if simulation.finished:
+            break
+        time_left = format(simulation.time_left, ".2f")
+        for view, screen in (
+            (full_view, full_screen),
+            (dirty_view, dirty_screen),
+        ):
+            view.draw_game(screen)
+            view.draw_score(screen)
+            view.draw_timer(time_left, screen)
+            # Pause for a frame every so often, then carry on
+            if frame % 200 == 100:
+                view.draw_paused(screen)
+        full_view.dirty_rects()
+        if sum(rect.w * rect.h for rect in dirty_view.dirty_rects()) < (
+            400 * 450
+        ):
+            partial_frames += 1
+        assert pygame.image.tobytes(full_screen, "RGB") == pygame.image.tobytes(
+            dirty_screen, "RGB"
+        ), f"frame {frame}"
+
+    assert frame > 1000
+    assert model.camera_offset > 450
+    assert partial_frames > 100
@@ -0,0 +1,214 @@
+"""
+This module creates a class to time each phase of a frame, keeping the
+most recent frames so slow phases can be spotted while the game runs.
+"""
+
+from collections import deque
+import time
+
+# The phases of a frame, in the order they run
+PHASES = ("events", "camera", "generation", "update", "draw", "display")
+
+# Things counted each frame, reported as counts rather than times
+COUNTS = ("platforms",)
+
+
+class FrameProfiler:
+    """
+    Splits each frame into phases and keeps how long each phase took over
+    the most recent frames.
+
+    A frame is timed by calling start_frame, then mark after each phase
+    with the phase's name, then end_frame. The time since the previous
+    mark is added to the named phase, so a phase can be marked more than
+    once a frame, such as when several physics steps run before drawing.
+
+    Attributes:
+        _enabled: A bool representing if frames are being timed
+        _refresh: An int representing the number of frames between
+            updates of the report
+        _size: An int representing the number of frames kept
+        _history: A dict mapping each phase name, and "total" for the
+            whole frame, to a deque of the seconds it took in the most
+            recent frames
+        _frame: A dict mapping each phase name to the seconds it has taken
+            so far this frame
+        _last_mark: A float representing the time.perf_counter() value of
+            the last mark
+        _frames_since_report: An int representing the number of frames
+            ended since the report was last updated
+        _latency: A deque of the seconds the most recent inputs waited
+            before a physics step used them
+        _counts: A dict mapping each name in COUNTS that has been counted
+            to a deque of its count in the most recent frames
+        _frame_counts: A dict mapping each name in COUNTS to its count so
+            far this frame
+        _report: A dict mapping each phase name and "total", and "input"
+            once any input latencies are added, to a tuple of the 50th and
+            99th percentile seconds, and each name in COUNTS once counted
+            to a tuple of its 50th and 99th percentile count, or None
+            before any frames have been timed
+    """
+
+    def __init__(self, size=300, refresh=30) -> None:
+        """
+        Initializes an empty, disabled profiler.
+
+        Args:
+            size: An int representing the number of frames to keep.
+                Defaults to 300, 5 seconds at 60 frames per second.
+            refresh: An int representing the number of frames between
+                updates of the report. Defaults to 30.
+        """
+        self._enabled = False
+        self._refresh = refresh
+        self._history = {
+            phase: deque(maxlen=size) for phase in PHASES + ("total",)
+        }
+        self._frame = dict.fromkeys(PHASES, 0.0)
+        self._last_mark = 0.0
+        self._frames_since_report = 0
+        self._latency = deque(maxlen=size)
+        self._size = size
+        self._counts = {}
+        self._frame_counts = dict.fromkeys(COUNTS, 0)
+        self._report = None
+
+    def start_frame(self):
+        """
+        Starts timing a frame
+
+        Args:
+            none
+        """
+        if self._enabled:
+            for phase in self._frame:
+                self._frame[phase] = 0.0
+            for name in self._frame_counts:
+                self._frame_counts[name] = 0
+            self._last_mark = time.perf_counter()
+
+    def mark(self, phase):
+        """
+        Adds the time since the last mark to a phase
+
+        Args:
+            phase: A string in PHASES naming the phase that just finished
+        """
+        if self._enabled:
+            now = time.perf_counter()
+            self._frame[phase] += now - self._last_mark
+            self._last_mark = now
+
+    def end_frame(self):
+        """
+        Stores the times of the current frame, updating the report every
+        _refresh frames
+
+        Args:
+            none
+        """
+        if not self._enabled:
+            return
+        for phase, seconds in self._frame.items():
+            self._history[phase].append(seconds)
+        self._history["total"].append(sum(self._frame.values()))
+        for name, counts in self._counts.items():
+            counts.append(self._frame_counts[name])
+        self._frames_since_report += 1
+        if self._report is None or self._frames_since_report >= self._refresh:
+            self._report = {
+                phase: (percentile(times, 50), percentile(times, 99))
+                for phase, times in self._history.items()
+            }
+            if self._latency:
+                self._report["input"] = (
+                    percentile(self._latency, 50),
+                    percentile(self._latency, 99),
+                )
+            for name, counts in self._counts.items():
+                self._report[name] = (
+                    percentile(counts, 50),
+                    percentile(counts, 99),
+                )
+            self._frames_since_report = 0
+
+    def add_latency(self, seconds):
+        """
+        Adds how long an input waited before a physics step used it
+
+        Args:
+            seconds: A float representing the input latency
+        """
+        if self._enabled:
+            self._latency.append(seconds)
+
+    def add_count(self, name, count):
+        """
+        Adds to a count for the current frame
+
+        Args:
+            name: A string in COUNTS naming what was counted
+            count: An int to add to the frame's count
+        """
+        if self._enabled:
+            if name not in self._counts:
+                self._counts[name] = deque(maxlen=self._size)
+            self._frame_counts[name] += count
+
+    def set_enabled(self, enabled):
+        """
+        Turns timing on or off. Frames timed before turning it off are
+        kept.
+
+        Args:
+            enabled: A bool representing if frames should be timed
+        """
+        self._enabled = enabled
+
+    @property
+    def enabled(self):
+        """
+        Allows private attribute _enabled to be accessed
+
+        Args:
+            none
+
+        Returns:
+            A bool representing if frames are being timed
+        """
+        return self._enabled
+
+    @property
+    def report(self):
+        """
+        Allows private attribute _report to be accessed. The same dict is
+        returned until the report is next updated.
+
+        Args:
+            none
+
+        Returns:
+            A dict mapping each phase name, "total" and "input" to a tuple
+            of the 50th and 99th percentile seconds and each name in
+            COUNTS to a tuple of the 50th and 99th percentile count, or
+            None before any frames have been timed
+        """
+        return self._report
+
+
+def percentile(values, percent):
+    """
+    Finds a percentile of some values using the nearest rank
+
+    Args:
+        values: A non-empty iterable of floats
+        percent: A float from 0 to 100 representing the percentile
+
+    Returns:
+        A float representing the smallest value with at least percent of
+        the values at or below it
+    """
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
@@ -2,15 +2,20 @@
 This module creates a class to generate a view for a user based on the model.
 It acts as the View section of MVC architecture.
 
-Note: This file cannot be tested as it controls display and visuals.
+Note: The View and Button classes control display and visuals, so only
+the text caches and what ends up drawn to an offscreen surface are
+tested.
 """
 
 import pygame
+from animation import RocketAnimation
+from assets import ASSETS
+from timing import COUNTS
 
 
-pygame.font.init()
-pygame.mixer.init()
-FONT = pygame.font.Font("Font/PressStart2P-Regular.ttf", 15)
+FONT_PATH = "Font/PressStart2P-Regular.ttf"
+FONT_SIZE = 15
+BACKGROUND_SOUND = "sounds/background_sound.mp3"
 
 
 class View:
@@ -19,10 +24,9 @@ class View:
 
     Attributes:
         _model: An instance of Model class
-        _background_sound: pygame.mixer.Sound() that
-            is the background music of the game
-        _end_sound: pygame.mixer.Sound() that is the
-            end screen sound effect played
+        _font: A pygame.font.Font used for all text
+        _music_started: A bool representing if the background music has
+            been started
         _easy_button: An instance of the Button class
             that represents the button on the menu screen
             that is used to select easy mode
@@ -32,40 +36,64 @@ class View:
         _hard_button: An instance of the Button class
             that represents the button on the menu screen
             that is used to select hard mode
-        _rocket_move_sprite: A pygame.Surface() that represents
-            the rocket jumping sprite
+        _animation: A RocketAnimation of the player's sprites, or None
+            until the game screen is first drawn
+        _score_text: A CachedText that holds the rendered score
+        _timer_glyphs: A GlyphAtlas used to draw the timer
+        _dirty_rendering: A bool representing if only the changed parts of
+            the game screen are redrawn
+        _dirty_rects: A list of pygame.Rect areas of the display changed
+            since the last call to dirty_rects
+        _drawn_offset: An int representing the camera offset the game
+            screen was last fully drawn at, or None to force a full redraw
+        _full_redraw: A bool representing if the current frame redrew the
+            whole game screen
+        _player_sprite: The pygame.Surface() last drawn for the player
+        _player_sprite_rect: A pygame.Rect of where the player sprite was
+            last placed, which may be partly off screen
+        _player_drawn_rect: A pygame.Rect of the area of the display the
+            player was last drawn over
+        _hud_rects: A dict mapping a HUD element name to the pygame.Rect
+            it was last drawn at
+        _profile_report: The frame timing report last drawn by
+            draw_profile, or None
+        _profile_surface: A pygame.Surface of the rendered frame timing
+            overlay, or None
     """
 
-    def __init__(self, model) -> None:
+    def __init__(self, model, dirty_rendering=False) -> None:
         """
         Initializes attributes that will be used to
         display the model
 
         Args:
             model: An instance of the Model class
+            dirty_rendering: A bool representing if only the changed parts
+                of the game screen should be redrawn while the camera is
+                not scrolling. Defaults to False.
         """
         self._model = model
-        self._background_sound = pygame.mixer.Sound(
-            "sounds/background_sound.mp3"
-        )
-        self._background_sound.play(loops=-1)
-        self._end_sound = pygame.mixer.Sound("sounds/end_sound.wav")
-        self._easy_button = Button((25, 200), "EASY")
-        self._medium_button = Button((150, 200), "MEDIUM")
-        self._hard_button = Button((275, 200), "HARD")
-        self._rocket_move_sprite = pygame.image.load(
-            "sprites/rocket_move_0.png"
-        )
-        self._rocket_move_sprite = pygame.transform.scale(
-            self._rocket_move_sprite,
-            (
-                self._model.player.rect.width,
-                self._model.player.rect.width
-                * (
-                    self._rocket_move_sprite.get_height()
-                    / self._rocket_move_sprite.get_width()
-                ),
-            ),
+        self._dirty_rendering = dirty_rendering
+        self._dirty_rects = []
+        self._drawn_offset = None
+        self._full_redraw = True
+        self._player_sprite = None
+        self._player_sprite_rect = None
+        self._player_drawn_rect = None
+        self._hud_rects = {}
+        self._profile_report = None
+        self._profile_surface = None
+        # Sounds and sprites are only needed once the game starts, so
+        # they are fetched then instead of holding up the menu
+        self._font = ASSETS.font(FONT_PATH, FONT_SIZE)
+        self._music_started = False
+        self._animation = None
+        self._easy_button = Button((25, 200), "EASY", self._font)
+        self._medium_button = Button((150, 200), "MEDIUM", self._font)
+        self._hard_button = Button((275, 200), "HARD", self._font)
+        self._score_text = CachedText(self._font, (255, 255, 255))
+        self._timer_glyphs = GlyphAtlas(
+            self._font, "0123456789.-", (255, 255, 255)
         )
 
     def draw_menu(self, display_surface):
@@ -75,54 +103,233 @@ class View:
         Args:
             display_surface: A surface object representing the menu window
         """
+        self.play_background_sound()
         display_surface.fill((0, 0, 0))
         self._easy_button.display(display_surface)
         self._medium_button.display(display_surface)
         self._hard_button.display(display_surface)
 
-    def draw_game(self, display_surface):
+    def draw_game(self, display_surface, alpha=1.0):
         """
-        Draws game screen for the user to view
+        Draws game screen for the user to view. With dirty rendering, the
+        whole screen is only redrawn when the camera has moved. Otherwise
+        just the player is erased and drawn again.
 
         Args:
             display_surface: A pygame.display representing the window
                 to view
+            alpha: A float from 0 to 1 representing how far between the
+                previous and current physics step to draw. Defaults to 1.0,
+                the current step.
         """
-        display_surface.fill((0, 0, 0))
-        for platform in self._model.platforms:
-            display_surface.blit(platform.surf, platform.rect)
-        if self._model.player.velocity.y < 0:
-            display_surface.blit(
-                self._rocket_move_sprite, self._model.player.rect
+        player = self._model.player
+        if self._animation is None:
+            self._animation = RocketAnimation(
+                player.rect.width, player.rect.height
+            )
+        # The model is in world coordinates, so everything is shifted down
+        # by how far the camera has scrolled
+        position, camera_offset = self._model.interpolate(alpha)
+        offset = round(camera_offset)
+        player_rect = player.rect.copy()
+        player_rect.center = position
+        player_rect.move_ip(0, offset)
+        self._player_sprite, (sprite_x, sprite_y) = self._animation.frame(
+            player.state.vy < 0, player.state.vx, pygame.time.get_ticks()
+        )
+        self._player_sprite_rect = self._player_sprite.get_rect(
+            center=(
+                player_rect.centerx + sprite_x,
+                player_rect.centery + sprite_y,
             )
+        )
+
+        self._full_redraw = (
+            not self._dirty_rendering or offset != self._drawn_offset
+        )
+        if self._full_redraw:
+            display_surface.fill((0, 0, 0))
+            for platform in self._model.platforms:
+                display_surface.blit(
+                    platform.surf, platform.rect.move(0, offset)
+                )
+            self._dirty_rects = [display_surface.get_rect()]
+            self._drawn_offset = offset
         else:
-            display_surface.blit(
-                self._model.player.image, self._model.player.rect
+            self._restore_background(
+                display_surface, self._player_drawn_rect, draw_player=False
             )
+            self._dirty_rects.append(self._player_drawn_rect)
+        self._player_drawn_rect = display_surface.blit(
+            self._player_sprite, self._player_sprite_rect
+        )
+        if not self._full_redraw:
+            self._dirty_rects.append(self._player_drawn_rect)
+
+    def play_background_sound(self):
+        """
+        Starts the background music looping if it has not started yet.
+        The music is streamed from disk by pygame.mixer.music instead of
+        being decoded into memory up front. If the file cannot be played
+        the game carries on without music.
+
+        Args:
+            none
+        """
+        if self._music_started:
+            return
+        self._music_started = True
+        try:
+            pygame.mixer.music.load(BACKGROUND_SOUND)
+            pygame.mixer.music.play(loops=-1)
+        except pygame.error:
+            pass
+
+    def _restore_background(self, display_surface, rect, draw_player=True):
+        """
+        Redraws the game screen behind an area, so something drawn there
+        can be erased without redrawing the whole screen
+
+        Args:
+            display_surface: A pygame.display representing the window
+                to view
+            rect: A pygame.Rect in screen coordinates to redraw
+            draw_player: A bool representing if the player should be
+                redrawn if it overlaps the area. Defaults to True.
+        """
+        offset = self._drawn_offset
+        display_surface.set_clip(rect)
+        display_surface.fill((0, 0, 0))
+        for platform in self._model.platforms_overlapping(
+            rect.move(0, -offset)
+        ):
+            display_surface.blit(platform.surf, platform.rect.move(0, offset))
+        if draw_player and self._player_drawn_rect.colliderect(rect):
+            display_surface.blit(self._player_sprite, self._player_sprite_rect)
+        display_surface.set_clip(None)
+
+    def _erase_hud(self, display_surface, name):
+        """
+        Erases a HUD element from where it was last drawn, when the rest
+        of the screen was not redrawn this frame
+
+        Args:
+            display_surface: A pygame.display representing the window
+                to view
+            name: A string naming the HUD element
+        """
+        previous = self._hud_rects.get(name)
+        if not self._full_redraw and previous is not None:
+            self._restore_background(display_surface, previous)
+            self._dirty_rects.append(previous)
+
+    def _record_hud(self, name, rect):
+        """
+        Remembers where a HUD element was drawn so it can be erased on the
+        next frame
+
+        Args:
+            name: A string naming the HUD element
+            rect: A pygame.Rect of the area the element was drawn over
+        """
+        self._hud_rects[name] = rect
+        if not self._full_redraw:
+            self._dirty_rects.append(rect)
+
+    def dirty_rects(self):
+        """
+        Returns the areas of the display changed since the last call, to
+        pass to pygame.display.update
+
+        Args:
+            none
+
+        Returns:
+            A list of pygame.Rect areas of the display
+        """
+        rects = self._dirty_rects
+        self._dirty_rects = []
+        return rects
 
     def draw_timer(self, time, display_surface):
         """
-        Draws the timer for the user to view during gameplay
+        Draws the timer for the user to view during gameplay. The timer
+        changes every frame, so it is drawn from pre-rendered characters
+        instead of rendering the text.
 
         Args:
+            time: A string representing the seconds left
             display_surface: A A pygame.display object representing the window
                 to view.
         """
-        timer_text = FONT.render(time, True, (255, 255, 255))
-        display_surface.blit(timer_text, timer_text.get_rect(center=(200, 50)))
+        self._erase_hud(display_surface, "timer")
+        drawn = self._timer_glyphs.draw(display_surface, time, center=(200, 50))
+        self._record_hud("timer", drawn)
 
     def draw_score(self, display_surface):
         """
-        Draws the score onto the display
+        Draws the score onto the display. The text is only rendered again
+        when the score changes.
 
         Args:
             display_surface: A pygame.display representing the window
                 to view
         """
-        score_text = FONT.render(
-            f"SCORE: {self._model.score}", True, (255, 255, 255)
+        score_text = self._score_text.render(self._model.score, "SCORE: {}")
+        self._erase_hud(display_surface, "score")
+        self._record_hud("score", display_surface.blit(score_text, (10, 10)))
+
+    def draw_profile(self, display_surface, report):
+        """
+        Draws the frame timing overlay in the bottom left corner, showing
+        the 50th and 99th percentile milliseconds of each phase, then the
+        percentiles of each count. The overlay is only rendered again when
+        the report changes.
+
+        Args:
+            display_surface: A pygame.display representing the window
+                to view
+            report: A dict mapping phase names to a tuple of the 50th and
+                99th percentile seconds and names in COUNTS to a tuple of
+                the percentile counts, like FrameProfiler.report, or None
+                to hide the overlay
+        """
+        self._erase_hud(display_surface, "profile")
+        if report is None:
+            self._hud_rects.pop("profile", None)
+            return
+        if report is not self._profile_report:
+            self._profile_report = report
+            lines = [f"{'ms':<11}{'p50':>6}{'p99':>6}"] + [
+                f"{phase:<11}{p50 * 1000:>6.2f}{p99 * 1000:>6.2f}"
+                for phase, (p50, p99) in report.items()
+                if phase not in COUNTS
+            ]
+            lines += [
+                f"{name:<11}{report[name][0]:>6}{report[name][1]:>6}"
+                for name in COUNTS
+                if name in report
+            ]
+            font = ASSETS.font(FONT_PATH, 8)
+            line_height = font.get_linesize()
+            self._profile_surface = pygame.Surface(
+                (
+                    max(font.size(line)[0] for line in lines) + 8,
+                    line_height * len(lines) + 8,
+                )
+            )
+            self._profile_surface.fill((40, 40, 40))
+            for index, line in enumerate(lines):
+                self._profile_surface.blit(
+                    font.render(line, True, (255, 255, 255)),
+                    (4, 4 + index * line_height),
+                )
+        rect = self._profile_surface.get_rect(
+            bottomleft=(10, display_surface.get_height() - 10)
+        )
+        self._record_hud(
+            "profile", display_surface.blit(self._profile_surface, rect)
         )
-        display_surface.blit(score_text, (10, 10))
 
     def draw_game_over(self, display_surface):
         """
@@ -133,14 +340,58 @@ class View:
                 to view.
         """
         display_surface.fill((0, 0, 0))
-        game_over = FONT.render("GAME OVER", True, (255, 255, 255))
-        score_text = FONT.render(
+        game_over = self._font.render("GAME OVER", True, (255, 255, 255))
+        score_text = self._font.render(
             f"SCORE: {self._model.score}", True, (255, 255, 255)
         )
         display_surface.blit(game_over, game_over.get_rect(center=(200, 150)))
         display_surface.blit(score_text, score_text.get_rect(center=(200, 200)))
-        self._background_sound.stop()
-        self._end_sound.play()
+
+    def play_game_over_sound(self):
+        """
+        Stops the background music and plays the game over sound
+
+        Args:
+            none
+        """
+        if pygame.mixer.get_init():
+            pygame.mixer.music.stop()
+        ASSETS.sound("sounds/end_sound.wav").play()
+
+    def draw_paused(self, display_surface):
+        """
+        Darkens the game screen and draws the pause message over it. The
+        next game frame redraws the whole screen to remove it.
+
+        Args:
+            display_surface: A pygame.display representing the window
+                to view
+        """
+        shade = pygame.Surface(display_surface.get_size())
+        shade.set_alpha(160)
+        display_surface.blit(shade, (0, 0))
+        paused = self._font.render("PAUSED", True, (255, 255, 255))
+        hint = self._font.render("P TO RESUME", True, (255, 255, 255))
+        display_surface.blit(paused, paused.get_rect(center=(200, 200)))
+        display_surface.blit(hint, hint.get_rect(center=(200, 240)))
+        self._drawn_offset = None
+
+    @staticmethod
+    def pause_sound(paused):
+        """
+        Pauses or resumes every sound that is playing
+
+        Args:
+            paused: A bool representing if sounds should be paused
+        """
+        if not pygame.mixer.get_init():
+            return
+        if paused:
+            pygame.mixer.pause()
+            pygame.mixer.music.pause()
+        else:
+            pygame.mixer.unpause()
+            pygame.mixer.music.unpause()
 
     @property
     def easy_button(self):
@@ -187,11 +438,12 @@ class Button:
         _button_color: A tuple representing the RGB color of the button
         _button_rect: A pygame rectangle object representing the button size and
             shape
+        _font: A pygame.font.Font used to render the text
         _text_surf: A surface object to write text on
         _text_rect: A rectangle object representing the shape to put text in
     """
 
-    def __init__(self, top_left, text) -> None:
+    def __init__(self, top_left, text, font) -> None:
         """
         Initializes the button to be displayed.
 
@@ -199,9 +451,11 @@ class Button:
             top_left: A tuple representing the (x,y) position of the button
                 placement
             text: A string representing the text on the button
+            font: A pygame.font.Font used to render the text
         """
         self._top_left = top_left
         self._text = text
+        self._font = font
         self._text_color = (0, 0, 0)
         self._width = 100
         self._height = 50
@@ -209,7 +463,7 @@ class Button:
         self._button_surf = pygame.Surface((self._width, self._height))
         self._button_surf.fill(self._button_color)
         self._button_rect = self._button_surf.get_rect(topleft=self._top_left)
-        self._text_surf = FONT.render(self._text, True, self._text_color)
+        self._text_surf = self._font.render(self._text, True, self._text_color)
         self._text_rect = self._text_surf.get_rect(
             center=self._button_rect.center
         )
@@ -237,3 +491,136 @@ class Button:
             Private attribute _button_rect which is of pygame.Rect()
         """
         return self._button_rect
+
+
+class CachedText:
+    """
+    Renders text for a value only when the value changes, so text that is
+    drawn every frame is not rasterized every frame.
+
+    Attributes:
+        _font: A pygame.font.Font used to render the text
+        _color: A tuple representing the RGB color of the text
+        _value: The value the current surface was rendered for
+        _surface: A pygame.Surface() of the rendered text, or None before
+            the first render
+    """
+
+    def __init__(self, font, color) -> None:
+        """
+        Initializes the cache without rendering anything.
+
+        Args:
+            font: A pygame.font.Font used to render the text
+            color: A tuple representing the RGB color of the text
+        """
+        self._font = font
+        self._color = color
+        self._value = None
+        self._surface = None
+
+    def render(self, value, template="{}"):
+        """
+        Returns the rendered text for a value, rendering it only if the
+        value differs from the last call
+
+        Args:
+            value: The value to show
+            template: A string format template the value is put into.
+                Defaults to "{}".
+
+        Returns:
+            A pygame.Surface() of the rendered text
+        """
+        if self._surface is None or value != self._value:
+            self._value = value
+            self._surface = self._font.render(
+                template.format(value), True, self._color
+            )
+        return self._surface
+
+
+class GlyphAtlas:
+    """
+    Holds one pre-rendered surface per character so text that changes
+    every frame, like the timer, can be drawn with a few small blits
+    instead of rendering the text again.
+
+    Attributes:
+        _font: A pygame.font.Font used to render the characters
+        _color: A tuple representing the RGB color of the text
+        _glyphs: A dict mapping a character to its rendered surface
+        _height: An int representing the height of the tallest glyph
+    """
+
+    def __init__(self, font, characters, color) -> None:
+        """
+        Initializes the atlas by rendering each character.
+
+        Args:
+            font: A pygame.font.Font used to render the characters
+            characters: A string of the characters to render up front.
+                Other characters are rendered the first time they are used.
+            color: A tuple representing the RGB color of the text
+        """
+        self._font = font
+        self._color = color
+        self._glyphs = {}
+        self._height = 0
+        for character in characters:
+            self._glyph(character)
+
+    def _glyph(self, character):
+        """
+        Returns the surface for a character, rendering it if needed
+
+        Args:
+            character: A string of length 1
+
+        Returns:
+            A pygame.Surface() of the rendered character
+        """
+        glyph = self._glyphs.get(character)
+        if glyph is None:
+            glyph = self._font.render(character, True, self._color)
+            self._glyphs[character] = glyph
+            self._height = max(self._height, glyph.get_height())
+        return glyph
+
+    def size(self, text):
+        """
+        Returns the size the text takes up when drawn
+
+        Args:
+            text: A string to measure
+
+        Returns:
+            A tuple of ints representing the width and height
+        """
+        return (
+            sum(self._glyph(character).get_width() for character in text),
+            self._height,
+        )
+
+    def draw(self, display_surface, text, center):
+        """
+        Draws text centered on a point
+
+        Args:
+            display_surface: A pygame.display representing the window
+                to view
+            text: A string to draw
+            center: A tuple representing the center of the text
+
+        Returns:
+            A pygame.Rect of the area drawn over
+        """
+        width, height = self.size(text)
+        left = center[0] - width // 2
+        top = center[1] - height // 2
+        x_pos = left
+        for character in text:
+            glyph = self._glyphs[character]
+            display_surface.blit(glyph, (x_pos, top))
+            x_pos += glyph.get_width()
+        return pygame.Rect(left, top, width, height)